@@ -0,0 +1,2 @@
+from . import bench_Video
+from . import bench_import
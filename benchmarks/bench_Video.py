@@ -0,0 +1,210 @@
+'''
+    Benchmarks of the class Video hot paths.
+'''
+from typing import Any, Dict, List, Tuple
+import shutil
+import numba
+import numpy as np
+
+from gridvid import Video, GridSpec
+from gridvid.config import paths
+from gridvid.utils import geometry, kernels
+from benchmarks.measure import measure
+
+# Resolutions and frame counts covered by the benchmarks, see `run_all`
+quick_matrix = {
+    'resolutions': [(240, 320), (480, 640), (720, 1280)],
+    'frames': [10, 30],
+}
+full_matrix = {
+    'resolutions': [(240, 320), (480, 640), (720, 1280), (1080, 1920)],
+    'frames': [30, 100, 300],
+}
+
+grid_widths = [1, 5, 15]
+grid_shapes = [(5, 5), (20, 20)]
+
+def bench_noise(frames:int, resolution:Tuple[int]) -> List[Dict[str,Any]]:
+    '''
+        Times the creation of a noise video.
+    '''
+    result = measure(
+        'Video.noise', lambda: Video.noise(frames, resolution, 30), frames,
+        frames = frames, resolution = resolution
+    )
+    return [result]
+
+def bench_init(frames:int, resolution:Tuple[int]) -> List[Dict[str,Any]]:
+    '''
+        Times the construction of a Video from an array, with and without
+        copying the array.
+    '''
+    data = Video.noise(frames, resolution, 30).raw
+    results = []
+    for copy in (True, False):
+        result = measure(
+            'Video.__init__', lambda: Video(data, 30, copy = copy), frames,
+            frames = frames, resolution = resolution, copy = copy
+        )
+        results.append(result)
+    return results
+
+def bench_create_grid(
+frames:int, resolution:Tuple[int]) -> List[Dict[str,Any]]:
+    '''
+        Times the addition of grids of various shapes and line widths, and
+        the drawing of the grid onto every frame of the video – both when the
+        grid is computed, and when it is reused from the cache of instances
+        of class GridSpec (see `GridSpec.get`).
+    '''
+    video = Video.noise(frames, resolution, 30)
+
+    def create_grid(shape, width):
+        video.create_grid(shape, width)
+        return video[:]
+
+    def reset(cached):
+        video.remove_grid()
+        if not cached:
+            GridSpec._instances.clear()
+
+    results = []
+    for cached in (False, True):
+        for shape in grid_shapes:
+            for width in grid_widths:
+                result = measure(
+                    'Video.create_grid',
+                    lambda: create_grid(shape, width), frames,
+                    setup = lambda: reset(cached),
+                    frames = frames, resolution = resolution, shape = shape,
+                    width = width, cached = cached
+                )
+                results.append(result)
+    return results
+
+def bench_set_grid(
+frames:int, resolution:Tuple[int]) -> List[Dict[str,Any]]:
+    '''
+        Times the grid kernel, separating its JIT compilation from its steady
+        state performance.
+    '''
+    data = Video.noise(frames, resolution, 30).raw
+    grid = GridSpec(resolution, (20, 20), 5)
+    rows, cols = map(
+        np.ascontiguousarray,
+        geometry.grid_indices(grid.rows, grid.cols, resolution)
+    )
+    color = np.array(grid.linecolor, dtype = np.uint8)
+
+    def compile_kernel():
+        kernel = numba.njit(parallel = True, nogil = True)(
+            kernels.set_grid.py_func
+        )
+        kernel(data, rows, cols, color)
+
+    compiled = measure(
+        'set_grid.compile', compile_kernel, frames, repeat = 1,
+        frames = frames, resolution = resolution
+    )
+    steady = measure(
+        'set_grid', lambda: kernels.set_grid(data, rows, cols, color), frames,
+        frames = frames, resolution = resolution
+    )
+    return [compiled, steady]
+
+def bench_save(frames:int, resolution:Tuple[int]) -> List[Dict[str,Any]]:
+    '''
+        Times the encoding of a video to file.
+    '''
+    video = Video.noise(frames, resolution, 30)
+    result = measure(
+        'Video.save',
+        lambda: video.save(
+            'benchmark', extension = '.mp4',
+            directory = paths.temp_video_directory
+        ), frames,
+        frames = frames, resolution = resolution
+    )
+    return [result]
+
+def bench_from_file(
+frames:int, resolution:Tuple[int]) -> List[Dict[str,Any]]:
+    '''
+        Times the decoding of a video file.
+    '''
+    video = Video.noise(frames, resolution, 30)
+    video.save(
+        'benchmark', extension = '.mp4', directory = paths.temp_video_directory
+    )
+    result = measure(
+        'Video.from_file',
+        lambda: Video.from_file('benchmark.mp4', paths.temp_video_directory),
+        frames,
+        frames = frames, resolution = resolution
+    )
+    return [result]
+
+def bench_save_frame(
+frames:int, resolution:Tuple[int]) -> List[Dict[str,Any]]:
+    '''
+        Times the saving of a single frame to an image file.
+    '''
+    video = Video.noise(frames, resolution, 30)
+    result = measure(
+        'Video.save_frame',
+        lambda: video.save_frame(
+            0, 'benchmark', directory = paths.temp_video_directory
+        ), 1,
+        frames = frames, resolution = resolution
+    )
+    return [result]
+
+def bench_save_frames(
+frames:int, resolution:Tuple[int]) -> List[Dict[str,Any]]:
+    '''
+        Times the saving of every frame to image files, compared to saving
+        them one at a time through matplotlib.
+    '''
+    video = Video.noise(frames, resolution, 30)
+    directory = paths.temp_video_directory / 'benchmark_frames'
+
+    def save_each():
+        for frame in range(len(video)):
+            video.save_frame(frame, 'benchmark', directory = directory)
+
+    results = []
+    for name, func in [
+        ('Video.save_frames', lambda: video.save_frames(directory = directory)),
+        ('Video.save_frame (loop)', save_each),
+    ]:
+        result = measure(
+            name, func, frames, repeat = 1,
+            frames = frames, resolution = resolution
+        )
+        results.append(result)
+    shutil.rmtree(directory)
+    return results
+
+benchmarks = [
+    bench_noise, bench_init, bench_create_grid, bench_set_grid, bench_save,
+    bench_from_file, bench_save_frame, bench_save_frames,
+]
+
+def run_all(full:bool = False) -> List[Dict[str,Any]]:
+    '''
+        Runs all class Video benchmarks over the matrix of resolutions and
+        frame counts; the larger matrix is used if `full` is True.
+    '''
+    matrix = full_matrix if full else quick_matrix
+    results = []
+    try:
+        for benchmark in benchmarks:
+            for resolution in matrix['resolutions']:
+                for frames in matrix['frames']:
+                    results += benchmark(frames, resolution)
+    finally:
+        for filename in ('benchmark.mp4', 'benchmark.png'):
+            path = paths.temp_video_directory / filename
+            if path.exists():
+                path.unlink()
+    return results
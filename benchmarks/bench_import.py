@@ -0,0 +1,58 @@
+'''
+    Benchmarks of the time taken to import the package, which is paid by
+    every command line call and every worker process.
+'''
+from typing import Any, Dict, List
+from pathlib import Path
+import subprocess
+import sys
+
+# Modules imported in a fresh interpreter, see `bench_import`
+modules = ['gridvid', 'gridvid.utils.kernels']
+
+# Prints the time taken by the import, and the peak resident set size
+script = '''
+import time, resource
+start = time.perf_counter()
+import {module}
+seconds = time.perf_counter() - start
+peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+print(seconds, peak)
+'''
+
+def bench_import(module:str, repeat:int = 5) -> List[Dict[str,Any]]:
+    '''
+        Times the import of `module` in a fresh interpreter, as the fastest of
+        `repeat` runs.  Each run starts a new process, such that no modules
+        are already cached.
+    '''
+    root = Path(__file__).parent.parent
+    times = []
+    peak = 0
+    for i in range(repeat):
+        output = subprocess.run(
+            [sys.executable, '-c', script.format(module = module)],
+            cwd = root, capture_output = True, text = True, check = True
+        ).stdout.split()
+        times.append(float(output[0]))
+        peak = max(peak, int(output[1]))
+
+    seconds = min(times)
+    result = {
+        'name': 'import',
+        'params': {'module': module},
+        'seconds': seconds,
+        'fps': 1 / seconds,
+        'peak_rss': peak,
+    }
+    return [result]
+
+def run_all(full:bool = False) -> List[Dict[str,Any]]:
+    '''
+        Runs all import benchmarks; `full` is accepted for consistency with
+        the other benchmark modules.
+    '''
+    results = []
+    for module in modules:
+        results += bench_import(module)
+    return results
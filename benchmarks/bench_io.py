@@ -0,0 +1,100 @@
+'''
+    Benchmarks of video decoding and encoding through imageio's ffmpeg plugin
+    and through raw pipes to the ffmpeg executable, see `utils/pipes.py`.
+'''
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from gridvid import Video
+from gridvid.config import paths, video_settings
+from benchmarks.measure import measure
+
+# Resolutions and frame counts covered by the benchmarks, see `run_all`
+quick_matrix = {
+    'resolutions': [(480, 640), (720, 1280)],
+    'frames': [60],
+}
+full_matrix = {
+    'resolutions': [(480, 640), (720, 1280), (1080, 1920)],
+    'frames': [60, 300],
+}
+
+# Input/output backends compared, see `video_settings.encoder`
+encoders = ['ffmpeg', 'pipe']
+
+# Numbers of segments encoded at the same time, see `Video.save`
+parallel = [1, 4]
+
+def gradient(frames:int, resolution:Tuple[int]) -> Video:
+    '''
+        Returns a video of moving color gradients.  Unlike noise, it is cheap
+        to encode and decode, such that the cost of passing frames between
+        Python and ffmpeg is not hidden by the codec.
+    '''
+    rows = np.arange(resolution[0])[:,None]
+    cols = np.arange(resolution[1])[None,:]
+    data = np.empty((frames,) + tuple(resolution) + (3,), dtype = np.uint8)
+    for t in range(frames):
+        data[t,...,0] = (cols + 4 * t) % 256
+        data[t,...,1] = (rows + 2 * t) % 256
+        data[t,...,2] = (rows + cols) // 4 % 256
+    return Video(data, 30, verbose = False, copy = False)
+
+def bench_save(
+frames:int, resolution:Tuple[int], encoder:str) -> List[Dict[str,Any]]:
+    '''
+        Times the encoding of a video to file with the given backend, for
+        each number of segments encoded in parallel.
+    '''
+    video = gradient(frames, resolution)
+    results = []
+    for segments in parallel:
+        results.append(measure(
+            'save',
+            lambda: video.save(
+                'benchmark', extension = '.mp4', preset = 'ultrafast',
+                directory = paths.temp_video_directory, keyint = 30,
+                parallel = segments
+            ), frames,
+            frames = frames, resolution = resolution, encoder = encoder,
+            parallel = segments
+        ))
+    return results
+
+def bench_from_file(
+frames:int, resolution:Tuple[int], encoder:str) -> List[Dict[str,Any]]:
+    '''
+        Times the decoding of a video file with the given backend.
+    '''
+    result = measure(
+        'from_file',
+        lambda: Video.from_file(
+            'benchmark.mp4', paths.temp_video_directory, verbose = False
+        ), frames,
+        frames = frames, resolution = resolution, encoder = encoder
+    )
+    return [result]
+
+def run_all(full:bool = False) -> List[Dict[str,Any]]:
+    '''
+        Runs the input/output benchmarks for each backend over the matrix of
+        resolutions and frame counts; the larger matrix is used if `full` is
+        True.
+    '''
+    matrix = full_matrix if full else quick_matrix
+    default = video_settings.encoder
+    results = []
+    try:
+        for resolution in matrix['resolutions']:
+            for frames in matrix['frames']:
+                for encoder in encoders:
+                    video_settings.encoder = encoder
+                    results += bench_save(frames, resolution, encoder)
+                    results += bench_from_file(frames, resolution, encoder)
+    finally:
+        video_settings.encoder = default
+        path = paths.temp_video_directory / 'benchmark.mp4'
+        if path.exists():
+            path.unlink()
+    return results
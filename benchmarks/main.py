@@ -0,0 +1,133 @@
+'''
+    Runs the benchmark suite, stores the results as JSON and compares them to
+    a stored baseline.
+
+    Usage:
+        python -m benchmarks.main [--full] [--save-baseline]
+'''
+from typing import Any, Dict, List
+from pathlib import Path
+import argparse
+import json
+import sys
+
+from gridvid.utils import text
+from benchmarks import bench_Video, bench_import, bench_io
+from benchmarks.measure import key
+
+results_directory = Path(__file__).parent / 'results'
+
+def parse_args():
+
+    argparse_desc = (
+        'Runs the Gridvid benchmarks, and fails if any benchmark is slower '
+        'than its stored baseline by more than the given threshold.'
+    )
+
+    parser = argparse.ArgumentParser(description = argparse_desc)
+
+    parser.add_argument(
+        '--full', action = 'store_true',
+        help = 'Runs the benchmarks over the larger matrix of video sizes'
+    )
+    parser.add_argument(
+        '--output', type = Path, default = results_directory / 'latest.json',
+        help = 'Where the results are stored as JSON'
+    )
+    parser.add_argument(
+        '--baseline', type = Path,
+        default = results_directory / 'baseline.json',
+        help = 'The results against which regressions are checked'
+    )
+    parser.add_argument(
+        '--threshold', type = float, default = 0.25,
+        help = 'The tolerated relative slowdown compared to the baseline'
+    )
+    parser.add_argument(
+        '--save-baseline', action = 'store_true',
+        help = 'Stores the results as the new baseline'
+    )
+
+    return parser.parse_args()
+
+def run_all(full:bool = False) -> List[Dict[str,Any]]:
+    '''
+        Runs every benchmark and returns the results.
+    '''
+    results = (
+        bench_import.run_all(full) + bench_Video.run_all(full) +
+        bench_io.run_all(full)
+    )
+    for result in results:
+        result['key'] = key(result)
+    return results
+
+def report(results:List[Dict[str,Any]]) -> None:
+    '''
+        Prints a table of benchmark results.
+    '''
+    header = (
+        f'{"Benchmark":<60s} {"Time":>10s} {"FPS":>10s} {"Peak RSS":>10s}'
+    )
+    print(text.bold(header) + text.norm())
+    for result in results:
+        print(
+            f'{result["key"]:<60s} {result["seconds"]:>9.4f}s '
+            f'{result["fps"]:>10.1f} {result["peak_rss"]/1024**2:>8.1f}MB'
+        )
+
+def compare(
+results:List[Dict[str,Any]], baseline:List[Dict[str,Any]],
+threshold:float) -> List[str]:
+    '''
+        Returns a description of each benchmark which is slower than in
+        `baseline` by more than the relative `threshold`.
+    '''
+    baseline = {result['key']:result for result in baseline}
+    regressions = []
+    for result in results:
+        if result['key'] not in baseline:
+            continue
+        old = baseline[result['key']]['seconds']
+        if result['seconds'] > old * (1 + threshold):
+            regressions.append(
+                f'{result["key"]}: {old:.4f}s -> {result["seconds"]:.4f}s '
+                f'({result["seconds"]/old - 1:+.0%})'
+            )
+    return regressions
+
+def main() -> int:
+    args = parse_args()
+
+    results = run_all(args.full)
+    report(results)
+
+    args.output.parent.mkdir(parents = True, exist_ok = True)
+    with open(args.output, 'w') as outfile:
+        json.dump(results, outfile, indent = 4)
+
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents = True, exist_ok = True)
+        with open(args.baseline, 'w') as outfile:
+            json.dump(results, outfile, indent = 4)
+        return 0
+
+    if not args.baseline.exists():
+        print('\nNo baseline found, run with `--save-baseline` to store one.')
+        return 0
+
+    with open(args.baseline) as infile:
+        baseline = json.load(infile)
+
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print('\n' + text.bold('Regressions:') + text.norm())
+        for regression in regressions:
+            print(regression)
+        return 1
+
+    print('\nNo regressions found.')
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
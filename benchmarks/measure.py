@@ -0,0 +1,75 @@
+'''
+    Tools for timing benchmarks and measuring their memory usage.
+'''
+from typing import Any, Callable, Dict
+from pathlib import Path
+import resource
+import time
+
+_clear_refs = Path('/proc/self/clear_refs')
+_status = Path('/proc/self/status')
+
+def reset_peak_rss() -> None:
+    '''
+        Resets the peak resident set size of the current process, where
+        supported (Linux).  Otherwise, the peak covers the whole process.
+    '''
+    try:
+        _clear_refs.write_text('5')
+    except OSError:
+        pass
+
+def peak_rss() -> int:
+    '''
+        Returns the peak resident set size of the current process in bytes,
+        since the last call to `reset_peak_rss` where supported.
+    '''
+    try:
+        for line in _status.read_text().splitlines():
+            if line.startswith('VmHWM:'):
+                return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+def measure(
+name:str, func:Callable[[], Any], count:int, repeat:int = 3,
+setup:Callable[[], Any] = None, **params) -> Dict[str,Any]:
+    '''
+        Runs `func` `repeat` times and returns a result containing the fastest
+        wall time, the corresponding throughput in frames per second given
+        that `func` processes `count` frames, and the peak resident set size
+        reached while running it.
+
+        If given, `setup` is called before every run and is not timed.
+        Keyword arguments are stored in the result as the benchmark's
+        parameters.
+    '''
+    times = []
+    peak = 0
+    for i in range(repeat):
+        if setup is not None:
+            setup()
+        reset_peak_rss()
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+        peak = max(peak, peak_rss())
+
+    seconds = min(times)
+    result = {
+        'name': name,
+        'params': params,
+        'seconds': seconds,
+        'fps': count / seconds if seconds > 0 else float('inf'),
+        'peak_rss': peak,
+    }
+    return result
+
+def key(result:Dict[str,Any]) -> str:
+    '''
+        Returns a string uniquely identifying the benchmark which produced
+        `result`, used to compare results against a baseline.
+    '''
+    params = ','.join(f'{k}={v}' for k,v in sorted(result['params'].items()))
+    return f'{result["name"]}[{params}]'
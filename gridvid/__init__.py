@@ -1,3 +1,5 @@
 from . import config
 from .obj import *
 from . import utils
+from . import pipeline
+from . import batch
@@ -0,0 +1,228 @@
+'''
+    Batch processing, in which the same grid is added to every video in a
+    directory by a pool of worker processes.
+'''
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+import time
+import os
+
+from gridvid.config import defaults, paths, video_settings
+from gridvid.utils import encoding, rendercache, text
+from gridvid import pipeline
+
+def process_directory(
+shape:Tuple[int], width:int = 1, linecolor:Tuple[int] = None,
+directory:Path = None, output_directory:Path = None, jobs:int = None,
+memory:int = None, verbose:bool = False, cache:bool = None,
+**encoder) -> List[Dict[str,Any]]:
+    '''
+        Adds a grid to every video in `directory` (see method `create_grid` in
+        class `Video` for a description of `shape`, `width` and `linecolor`),
+        and saves the results to `output_directory` under the same filenames.
+
+        The videos are distributed across `jobs` worker processes, each of
+        which streams its video in chunks small enough to stay within a budget
+        of `memory` bytes.  Videos whose output already exists are skipped, so
+        that an interrupted batch can be resumed by running it again.
+
+        If `cache` is True, which defaults to `video_settings.render_cache`,
+        a video which has already been processed with the same grid and
+        encoder settings (e.g. under another name, or by an earlier batch
+        whose output was since removed) is copied from the render cache
+        instead of being decoded and encoded again, see
+        `utils/rendercache.py`.
+
+        Additional keyword arguments configure the encoder, see method `save`
+        in class `Video`.
+
+        Returns a list containing the statistics of each processed video.
+    '''
+    err_msg = (
+        'Function `process_directory` in module `batch` requires that '
+        'argument `{}` be {}'
+    )
+
+    if directory is None:
+        directory = paths.input_videos
+
+    if output_directory is None:
+        output_directory = paths.finished_videos
+
+    if jobs is None:
+        jobs = os.cpu_count()
+
+    if memory is None:
+        memory = video_settings.worker_memory
+
+    if cache is None:
+        cache = video_settings.render_cache
+
+    if not isinstance(directory, Path):
+        raise TypeError(err_msg.format('directory', 'of <class \'Path\'>.'))
+
+    if not isinstance(output_directory, Path):
+        msg = 'of <class \'Path\'>.'
+        raise TypeError(err_msg.format('output_directory', msg))
+
+    if not isinstance(jobs, int) or jobs <= 0:
+        msg = 'an integer greater than zero.'
+        raise ValueError(err_msg.format('jobs', msg))
+
+    if not isinstance(memory, int) or memory <= 0:
+        msg = 'an integer greater than zero.'
+        raise ValueError(err_msg.format('memory', msg))
+
+    if not isinstance(cache, bool):
+        raise TypeError(err_msg.format('cache', 'of <class \'bool\'>.'))
+
+    # Sending the cache directory with each task, as the spawned workers
+    # import the default configuration rather than this process's
+    cache_directory = paths.render_cache if cache else None
+
+    tasks = []
+    for source in sorted(directory.iterdir()):
+        if source.suffix not in video_settings.input_extensions:
+            continue
+        destination = output_directory / source.name
+        if destination.exists():
+            if verbose:
+                print(f'Skipping {source.name} (already processed)')
+            continue
+        tasks.append((
+            source, destination, shape, width, linecolor, memory,
+            cache_directory, encoder
+        ))
+
+    # Compiling the kernels once, such that the workers all load them from
+    # the shared kernel cache rather than each compiling them
+    if tasks:
+        from gridvid.utils import kernels
+        kernels.warmup()
+
+    # Worker processes are spawned rather than forked, as forking a process
+    # whose numba threading layer is already running is unsafe
+    import multiprocessing
+    context = multiprocessing.get_context('spawn')
+
+    results = []
+    with context.Pool(min(jobs, max(len(tasks), 1))) as pool:
+        for result in pool.imap_unordered(_process_file, tasks):
+            results.append(result)
+            if verbose:
+                _report_file(result)
+
+    if verbose:
+        report(results)
+
+    return results
+
+def report(results:List[Dict[str,Any]]) -> None:
+    '''
+        Prints a summary of the throughput of each video processed by function
+        `process_directory`.
+    '''
+    header = (
+        f'{"Video":<40s} {"Frames":>8s} {"Time":>9s} {"FPS":>9s} '
+        f'{"MB/s":>9s}'
+    )
+    print(text.bold(header) + text.norm())
+
+    for result in sorted(results, key = lambda r: r['filename']):
+        if result['error'] is not None:
+            print(f'{result["filename"]:<40s} FAILED: {result["error"]}')
+            continue
+        if result['cached']:
+            print(f'{result["filename"]:<40s} {result["frames"]:>8d}   cached')
+            continue
+        print(
+            f'{result["filename"]:<40s} {result["frames"]:>8d} '
+            f'{result["seconds"]:>8.2f}s {result["fps"]:>9.1f} '
+            f'{result["mbps"]:>9.1f}'
+        )
+
+def _report_file(result:Dict[str,Any]) -> None:
+    '''
+        Private function which prints a single line of progress output once a
+        video has been processed.
+    '''
+    if result['error'] is None and result['cached']:
+        print(f'Reused {result["filename"]} from the render cache')
+    elif result['error'] is None:
+        print(
+            f'Finished {result["filename"]} – {result["frames"]:d} frames in '
+            f'{result["seconds"]:.2f}s'
+        )
+    else:
+        print(f'Failed {result["filename"]} – {result["error"]}')
+
+def _process_file(task:Tuple) -> Dict[str,Any]:
+    '''
+        Private function which processes a single video in a worker process.
+
+        The output is written to a hidden file in the output directory, and is
+        only renamed once complete, such that an interrupted run never leaves
+        behind an output which would be skipped on resumption.
+    '''
+    (source, destination, shape, width, linecolor, memory, cache_directory,
+     encoder) = task
+    partial = destination.with_name('.' + destination.name)
+
+    result = {
+        'filename': source.name, 'frames': 0, 'bytes': 0, 'seconds': 0.0,
+        'fps': 0.0, 'mbps': 0.0, 'error': None, 'cached': False,
+    }
+
+    try:
+        job = None
+        if cache_directory is not None:
+            paths.render_cache = cache_directory
+
+            # Reusing the output of an identical job, skipping the decode and
+            # encode entirely
+            job = rendercache.key(
+                source, job = 'batch', shape = shape, width = width,
+                linecolor = linecolor, extension = destination.suffix,
+                params = encoding.writer_params(**encoder)
+            )
+            entry = rendercache.fetch(job, partial)
+            if entry is not None:
+                os.replace(partial, destination)
+                result['frames'] = entry['frames']
+                result['bytes'] = entry['bytes']
+                result['cached'] = True
+                return result
+
+        # Choosing a chunk size which keeps every buffer of the pipeline
+        # within the memory budget
+        import imageio
+        with imageio.get_reader(source, 'ffmpeg') as reader:
+            frame_width, frame_height = reader.get_meta_data()['size']
+        frame_bytes = frame_width * frame_height * 3
+        chunk_size = max(1, memory // (defaults.pipeline_buffers * frame_bytes))
+
+        start = time.perf_counter()
+        frames = pipeline.process(
+            source, partial, shape, width, linecolor, chunk_size,
+            verbose = False, **encoder
+        )
+        seconds = time.perf_counter() - start
+        os.replace(partial, destination)
+        if job is not None:
+            rendercache.store(
+                job, destination, frames = frames,
+                bytes = frames * frame_bytes
+            )
+
+        result['frames'] = frames
+        result['bytes'] = frames * frame_bytes
+        result['seconds'] = seconds
+        result['fps'] = frames / seconds
+        result['mbps'] = frames * frame_bytes / seconds / 1024**2
+    except Exception as e:
+        result['error'] = f'{type(e).__name__}: {e}'
+    finally:
+        if partial.exists():
+            os.remove(partial)
+
+    return result
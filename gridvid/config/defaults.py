@@ -11,8 +11,33 @@ image_output_directory ='Images'
 input_video_directory = 'Videos'
 temp_video_directory = '.temporary videos'
 
+# Compiled Kernels
+kernel_cache_directory = 'kernels'
+
+# Rendered Videos
+render_cache_directory = 'render cache'
+
 # Filenames
 video_filename = 'video'
 
 # File Extensions
 image_extension = '.png'
+
+# Image Compression – PNG zlib level in [0, 9] and JPEG quality in [1, 95]
+image_compression = 6
+image_quality = 90
+
+# Streaming
+chunk_size = 32
+
+# Frame Cache
+cache_extension = '.gvc'
+
+# Lazy Decoding
+lazy_cache_size = 16
+
+# Grid Specifications
+grid_cache_size = 32
+
+# Number of chunk buffers shared by the stages of a pipeline
+pipeline_buffers = 4
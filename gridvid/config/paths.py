@@ -26,12 +26,17 @@ input_videos = input_data / defaults.input_video_directory
 # Directory where videos are temporarily stored
 temp_video_directory = output_data / defaults.temp_video_directory
 
-# If necessary, creates the above directories on module initialization
-package_data.mkdir(exist_ok = True)
-user_data.mkdir(exist_ok = True)
-output_data.mkdir(exist_ok = True)
-input_data.mkdir(exist_ok = True)
-finished_videos.mkdir(exist_ok = True)
-image_output.mkdir(exist_ok = True)
-input_videos.mkdir(exist_ok = True)
-temp_video_directory.mkdir(exist_ok = True)
+# Directory where compiled kernels are cached
+kernel_cache = package_data / defaults.kernel_cache_directory
+
+# Directory where rendered videos and their manifest are cached
+render_cache = package_data / defaults.render_cache_directory
+
+def ensure(directory:Path) -> Path:
+    '''
+        Creates `directory` and its parents if they do not exist yet, and
+        returns it.  Directories are only created once something is written to
+        them, such that importing the package has no effect on the filesystem.
+    '''
+    directory.mkdir(parents = True, exist_ok = True)
+    return directory
@@ -3,5 +3,38 @@ input_extensions = (
     '.mp4', '.mov', '.avi', '.mpg', '.mpeg', '.mkv', '.wmv'
 )
 
-# Default video encoder type
+# Video input/output backend used by `Video.from_file` and `Video.save`:
+#   'ffmpeg' – imageio's ffmpeg plugin, one frame at a time
+#   'pipe'   – raw pipes to the ffmpeg executable, many frames at a time (see
+#              `utils/pipes.py`)
 encoder = 'ffmpeg'
+
+# Maximum total size of the frame cache in bytes
+cache_size = 8 * 1024**3
+
+# Whether `Video.save` and batch processing reuse the outputs of identical
+# jobs, see `utils/rendercache.py`
+render_cache = False
+
+# Maximum total size of the render cache in bytes
+render_cache_size = 8 * 1024**3
+
+# Memory budget of each batch processing worker in bytes
+worker_memory = 512 * 1024**2
+
+# Default encoder settings used when saving videos
+codec = 'libx264'
+crf = 23
+preset = 'veryfast'
+threads = 0
+pixelformat = 'yuv420p'
+
+# Pixel format used when saving grayscale videos, which stores only luminance
+gray_pixelformat = 'gray'
+
+# Maximum number of frames between keyframes; shorter groups of pictures make
+# splicing a modified segment into a video cheaper
+keyint = 250
+
+# Number of prepared frames buffered ahead of the encoder
+queue_size = 16
@@ -0,0 +1,313 @@
+from collections import OrderedDict
+from typing import Tuple
+
+import numpy as np
+
+from gridvid.config import defaults
+from gridvid.utils import geometry, profiling
+
+class GridSpec:
+
+    # Most recently used instances, see method `get`
+    _instances = OrderedDict()
+
+    # CONSTRUCTORS
+    @classmethod
+    def get(
+    cls, frame_shape:Tuple[int], shape:Tuple[int], width:int = 1,
+    linecolor:Tuple[int] = None, opacity:float = 1.0,
+    antialias:bool = False) -> 'GridSpec':
+        '''
+            Returns an instance of GridSpec with the given arguments, reusing a
+            previously created instance if one exists.
+
+            The `defaults.grid_cache_size` most recently used instances are
+            kept, such that the pixel indices of a grid are only computed once
+            for batches of videos sharing the same resolution and grid.
+        '''
+        args = (frame_shape, shape, width, linecolor, opacity, antialias)
+        key = cls._memo_key(args)
+        try:
+            hash(key)
+        except TypeError:
+            # Unhashable arguments are not cached
+            return cls(*args)
+
+        if key in cls._instances:
+            cls._instances.move_to_end(key)
+            return cls._instances[key]
+
+        instance = cls(*args)
+        cls._instances[key] = instance
+        if len(cls._instances) > defaults.grid_cache_size:
+            cls._instances.popitem(last = False)
+
+        return instance
+
+    def __init__(
+    self, frame_shape:Tuple[int], shape:Tuple[int], width:int = 1,
+    linecolor:Tuple[int] = None, opacity:float = 1.0,
+    antialias:bool = False) -> None:
+        '''
+            Precomputes the pixels covered by a grid on frames of shape
+            `frame_shape` (height, width).
+
+            `shape` should be a tuple containing two positive integers – the
+            first is the number of horizontal lines in the grid, and the second
+            is the number of vertical lines in the grid. Does not include image
+            boundaries.  Either integer may be replaced by a sequence of line
+            positions, given in pixels (integers) or as fractions of the image
+            size (floats in [0, 1]), see `utils/geometry.py`.
+
+            `width` is the width of the grid lines in pixels.  Must be an
+            integer greater than or equal to one.
+
+            `linecolor` is an rgb value, i.e. a tuple containing three integers
+            in the range [0, 255], or a gray level – a tuple containing a
+            single integer – for grayscale videos.
+
+            `opacity` is the opacity of the grid lines, in the range [0, 1].
+            If `antialias` is True, the lines are drawn at their exact
+            (possibly fractional) positions, and pixels they partially cover
+            are blended proportionally.
+        '''
+        if linecolor is None:
+            linecolor = (255, 255, 255)
+
+        err_msg = (
+            'The constructor for class `GridSpec` requires that argument `{}` '
+            'be of <class \'{}\'>.'
+        )
+
+        if not isinstance(frame_shape, tuple):
+            raise TypeError(err_msg.format('frame_shape', 'tuple'))
+
+        if not isinstance(shape, tuple):
+            raise TypeError(err_msg.format('shape', 'tuple'))
+
+        if not isinstance(width, int):
+            raise TypeError(err_msg.format('width', 'int'))
+
+        if not isinstance(linecolor, tuple):
+            raise TypeError(err_msg.format('linecolor', 'tuple'))
+
+        if not isinstance(opacity, (int, float)):
+            raise TypeError(err_msg.format('opacity', 'float'))
+
+        if not isinstance(antialias, bool):
+            raise TypeError(err_msg.format('antialias', 'bool'))
+
+        err_msg = (
+            'The constructor for class `GridSpec` requires that argument `{}` '
+            'be {}'
+        )
+
+        if not self._check_tuple(frame_shape, 2, 1):
+            msg = 'a two-tuple of integers greater than or equal to one.'
+            raise TypeError(err_msg.format('frame_shape', msg))
+
+        if len(shape) != 2:
+            msg = (
+                'a two-tuple of integers greater than or equal to zero, or of '
+                'sequences of line positions.'
+            )
+            raise TypeError(err_msg.format('shape', msg))
+
+        if width <= 0:
+            msg = 'an integer greater than or equal to one.'
+            raise TypeError(err_msg.format('width', msg))
+
+        if not (self._check_tuple(linecolor, 3, 0, 255) or
+                self._check_tuple(linecolor, 1, 0, 255)):
+            msg = 'a one- or three-tuple of integers in the range [0, 255].'
+            raise TypeError(err_msg.format('linecolor', msg))
+
+        if not 0 <= opacity <= 1:
+            msg = 'a number in the range [0, 1].'
+            raise ValueError(err_msg.format('opacity', msg))
+
+        self._frame_shape = frame_shape
+        self._shape = shape
+        self._width = width
+        self._linecolor = linecolor
+        self._opacity = opacity
+        self._antialias = antialias
+
+        rows = geometry.line_positions(frame_shape[0], shape[0])
+        cols = geometry.line_positions(frame_shape[1], shape[1])
+
+        self._rows = geometry.line_bands(rows, width, frame_shape[0])
+        self._cols = geometry.line_bands(cols, width, frame_shape[1])
+        self._color = np.array(linecolor, dtype = np.uint8)
+
+        # Coordinates of every pixel covered by the grid, stored contiguously
+        # as required by the kernels
+        self._indices = tuple(
+            np.ascontiguousarray(idx) for idx in
+            geometry.grid_indices(self._rows, self._cols, frame_shape)
+        )
+
+        # Opacity of each row and column in [0, 255], used for blending
+        if self.blended:
+            if antialias:
+                row_coverage = geometry.line_coverage(
+                    geometry.line_centers(frame_shape[0], shape[0]), width,
+                    frame_shape[0]
+                )
+                col_coverage = geometry.line_coverage(
+                    geometry.line_centers(frame_shape[1], shape[1]), width,
+                    frame_shape[1]
+                )
+            else:
+                row_coverage = np.zeros(frame_shape[0])
+                row_coverage[self._rows] = 1
+                col_coverage = np.zeros(frame_shape[1])
+                col_coverage[self._cols] = 1
+
+            self._row_weights = np.rint(
+                row_coverage * opacity * 255
+            ).astype(np.int32)
+            self._col_weights = np.rint(
+                col_coverage * opacity * 255
+            ).astype(np.int32)
+
+    # PROPERTIES
+    @property
+    def frame_shape(self) -> Tuple[int]:
+        '''
+            Returns the shape (height, width) of the frames the grid fits.
+        '''
+        return self._frame_shape
+
+    @property
+    def shape(self) -> Tuple[int]:
+        '''
+            Returns the number (or positions) of the horizontal and vertical
+            grid lines.
+        '''
+        return self._shape
+
+    @property
+    def width(self) -> int:
+        '''
+            Returns the width of the grid lines in pixels.
+        '''
+        return self._width
+
+    @property
+    def linecolor(self) -> Tuple[int]:
+        '''
+            Returns the rgb value (or gray level) of the grid lines.
+        '''
+        return self._linecolor
+
+    @property
+    def opacity(self) -> float:
+        '''
+            Returns the opacity of the grid lines.
+        '''
+        return self._opacity
+
+    @property
+    def antialias(self) -> bool:
+        '''
+            Returns True if the grid lines are anti-aliased.
+        '''
+        return self._antialias
+
+    @property
+    def blended(self) -> bool:
+        '''
+            Returns True if the grid is blended into the frames, rather than
+            replacing the pixels it covers.
+        '''
+        return self._antialias or self._opacity < 1
+
+    @property
+    def rows(self) -> np.ndarray:
+        '''
+            Returns the sorted indices of the rows covered by the grid.
+        '''
+        return self._rows
+
+    @property
+    def cols(self) -> np.ndarray:
+        '''
+            Returns the sorted indices of the columns covered by the grid.
+        '''
+        return self._cols
+
+    # MODIFIERS
+    def apply(self, frames:np.ndarray) -> np.ndarray:
+        '''
+            Draws the grid onto `frames`, an array of shape (Number of frames,
+            Video Height, Video Width, Color Channels), in place.  Returns
+            `frames`.  The number of color channels must match `linecolor`.
+
+            Opaque grids replace the pixels they cover, while transparent or
+            anti-aliased grids are blended into the frames.  The GIL is
+            released while drawing, see `utils/kernels.py`.
+        '''
+        # Importing numba takes a while, and is only needed once drawing
+        from gridvid.utils import kernels
+
+        if frames.shape[1:3] != self._frame_shape:
+            msg = (
+                f'Method `apply` in class `GridSpec` requires frames of shape '
+                f'{self._frame_shape}, got {frames.shape[1:3]}.'
+            )
+            raise ValueError(msg)
+
+        if frames.shape[3] != len(self._linecolor):
+            msg = (
+                f'Method `apply` in class `GridSpec` requires frames with '
+                f'{len(self._linecolor):d} color channels, got '
+                f'{frames.shape[3]:d}.'
+            )
+            raise ValueError(msg)
+
+        if self.blended:
+            with profiling.stage(
+                'blend_grid', frames = len(frames), nbytes = frames.nbytes
+            ):
+                return kernels.blend_grid(
+                    frames, self._row_weights, self._col_weights, self._color
+                )
+
+        with profiling.stage(
+            'set_grid', frames = len(frames), nbytes = frames.nbytes
+        ):
+            return kernels.set_grid(
+                frames, self._indices[0], self._indices[1], self._color
+            )
+
+    # PRIVATE METHODS
+    @classmethod
+    def _memo_key(cls, value) -> tuple:
+        '''
+            Private method which returns a key identifying `value` along with
+            the type of each of its elements, such that equal values of
+            different types – e.g. the line index 1 and the fractional position
+            1.0 – are cached separately, see method `get`.
+        '''
+        if isinstance(value, (tuple, list)):
+            return (type(value).__name__,) + tuple(
+                cls._memo_key(element) for element in value
+            )
+        return (type(value).__name__, value)
+
+    @staticmethod
+    def _check_tuple(
+    values:Tuple, length:int, low:int, high:int = None) -> bool:
+        '''
+            Private method which checks that `values` is a tuple of `length`
+            integers in the range [low, high].
+        '''
+        if len(values) != length:
+            return False
+        for value in values:
+            if not isinstance(value, int) or value < low:
+                return False
+            if high is not None and value > high:
+                return False
+        return True
@@ -0,0 +1,263 @@
+from collections import OrderedDict
+from pathlib import Path
+import math
+
+import numpy as np
+
+from gridvid.obj.Video import Video
+from gridvid.config import defaults
+from gridvid.utils import scaling, color, profiling
+
+class LazyVideo(Video):
+
+    # Frames are decoded by a single reader
+    _concurrent = False
+
+    # CONSTRUCTORS
+    @classmethod
+    def from_file(
+    cls, filename:str, directory:Path = None, verbose:bool = False,
+    cache_size:int = None, size:scaling.Size = None,
+    crop:scaling.Crop = None, grayscale:bool = False) -> 'LazyVideo':
+        '''
+            To initiate an instance of class LazyVideo by referring to the path
+            of a video file.  No frames are decoded until they are accessed.
+        '''
+        path = cls._source_path(filename, directory, verbose, 'from_file')
+        return cls(path, verbose, cache_size, size, crop, grayscale)
+
+    def __init__(
+    self, path:Path, verbose:bool = False, cache_size:int = None,
+    size:scaling.Size = None, crop:scaling.Crop = None,
+    grayscale:bool = False) -> None:
+        '''
+            A Video which decodes its frames on demand, seeking directly to the
+            requested frames in the video file at `path`.
+
+            The `cache_size` most recently decoded frames are kept in memory.
+            The number of frames, shape and fps are read from the container
+            metadata, without decoding any frames.  Containers which do not
+            store the number of frames give an estimate from their duration,
+            which is corrected once a frame past the end fails to decode.
+
+            Frames are cropped to `crop` and scaled to `size` as they are
+            decoded, see method `from_file` in class `Video`.  If `grayscale`
+            is True, only the luminance of each decoded frame is kept, such
+            that cached frames take a third of the memory.
+        '''
+        err_msg = (
+            '\n\nThe constructor for class `LazyVideo` requires that argument '
+            '`{}` be of <class \'{}\'>.'
+        )
+
+        if cache_size is None:
+            cache_size = defaults.lazy_cache_size
+
+        if not isinstance(path, Path):
+            raise TypeError(err_msg.format('path', 'Path'))
+
+        if not isinstance(verbose, bool):
+            raise TypeError(err_msg.format('verbose', 'bool'))
+
+        if not isinstance(grayscale, bool):
+            raise TypeError(err_msg.format('grayscale', 'bool'))
+
+        if not isinstance(cache_size, int) or cache_size <= 0:
+            msg = (
+                '\n\nThe constructor for class `LazyVideo` requires that '
+                'argument `cache_size` be an integer greater than zero.'
+            )
+            raise ValueError(msg)
+
+        # Created first, such that a video which fails to construct can be
+        # closed, see method `close`
+        self._cache = OrderedDict()
+        self._cache_size = cache_size
+
+        import imageio
+        self._reader = imageio.get_reader(path, 'ffmpeg')
+        metadata = self._reader.get_meta_data()
+
+        # Estimating the number of frames from the container metadata, which
+        # is corrected on the first failed read, see method `_read`
+        nframes = metadata['nframes']
+        if not math.isfinite(nframes):
+            nframes = round(metadata['duration'] * metadata['fps'])
+
+        width, height = metadata['source_size']
+
+        region = scaling.region((height, width), size, crop)
+        if not scaling.is_identity(region):
+            height, width = region[2]
+
+        # The frames are decoded on demand, so the video array only holds the
+        # shape of the video, without taking up any memory
+        shape = (int(nframes), height, width, 1 if grayscale else 3)
+        placeholder = np.broadcast_to(np.zeros((), dtype = np.uint8), shape)
+        super().__init__(
+            placeholder, int(metadata['fps']), path.name, verbose, copy = False
+        )
+
+        self._default_extension = path.suffix
+        self._source = path
+        self._segment = (0, shape[0], 1)
+        self._region = None if scaling.is_identity(region) else region
+
+        # Reopening the video with the filters which crop and scale it
+        if self._region is not None:
+            self._reader.close()
+            self._reader = self._open()
+
+    # PROPERTIES
+    @property
+    def raw(self) -> np.ndarray:
+        '''
+            Returns the original video data array, without modifications,
+            decoding the entire video.  The frames are not kept in memory, so
+            every access decodes them again – use `Video.from_file` instead
+            to work with all of them.
+        '''
+        return self._decode_all()
+
+    # GETTER/SETTER METHODS
+    def __getitem__(self, key) -> np.ndarray:
+        '''
+            Returns an element or subset of the video data, decoding only the
+            frames selected by the first index.
+        '''
+        if self._modified_data is not None:
+            return super().__getitem__(key)
+        return self._render_key(key)
+
+    # CLOSING
+    def close(self) -> None:
+        '''
+            Closes the underlying video file reader, and clears the frame
+            cache.  Accessing frames afterwards reopens the reader.  Closing
+            the video again has no effect.
+        '''
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+        self._cache.clear()
+
+    def __enter__(self) -> 'LazyVideo':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        # Videos which failed to construct may not have opened a reader
+        if getattr(self, '_reader', None) is not None:
+            self.close()
+
+    # PRIVATE METHODS
+    @property
+    def _frames(self) -> np.ndarray:
+        '''
+            Private property which returns the modified video array if it
+            exists.  Otherwise, decodes and returns the entire original video
+            array, e.g. for conversions – which is as slow as
+            `Video.from_file`, and is not cached.
+        '''
+        if self._modified_data is None:
+            return self._decode_all()
+        return self._modified_data
+
+    def _select(self, indices:np.ndarray) -> np.ndarray:
+        '''
+            Private method which returns a new array containing the frames at
+            `indices`, decoding only those frames.
+        '''
+        if self._modified_data is not None:
+            return super()._select(indices)
+
+        data = np.empty((len(indices),) + self.shape[1:], dtype = np.uint8)
+        for n, idx in enumerate(indices):
+            data[n] = self._decode(int(idx))
+        return data
+
+    def _writable(self) -> np.ndarray:
+        '''
+            Private method which returns the modified video array, decoding the
+            entire video into it on the first call.
+        '''
+        if self._modified_data is None:
+            self._modified_data = self._decode_all()
+        return self._modified_data
+
+    def _open(self):
+        '''
+            Private method which opens a reader of the video file, which crops
+            and scales the frames as they are decoded.
+        '''
+        import imageio
+        if self._region is None:
+            return imageio.get_reader(self._source, 'ffmpeg')
+        return imageio.get_reader(
+            self._source, 'ffmpeg',
+            output_params = scaling.ffmpeg_params(self._region)
+        )
+
+    def _decode_all(self) -> np.ndarray:
+        '''
+            Private method which decodes every frame of the video, bypassing
+            the frame cache.
+        '''
+        data = np.empty(self.shape, dtype = np.uint8)
+        for idx in range(len(self)):
+            try:
+                data[idx] = self._read(idx)
+            except IndexError:
+                # The video is shorter than its metadata suggested
+                return data[:idx]
+        return data
+
+    def _decode(self, idx:int) -> np.ndarray:
+        '''
+            Private method which returns frame number `idx`, either from the
+            frame cache or by seeking to it in the video file.
+        '''
+        if idx in self._cache:
+            self._cache.move_to_end(idx)
+            return self._cache[idx]
+
+        frame = self._read(idx)
+        self._cache[idx] = frame
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last = False)
+
+        return frame
+
+    def _read(self, idx:int) -> np.ndarray:
+        '''
+            Private method which decodes frame number `idx` from the video
+            file, converting it to grayscale if the video has one channel.
+
+            If the frame cannot be read, the video ends before it, and the
+            number of frames – which is estimated for some containers – is
+            reduced to at most `idx` before IndexError is raised.
+        '''
+        if self._reader is None:
+            self._reader = self._open()
+
+        with profiling.stage('decode') as stage:
+            try:
+                frame = self._reader.get_data(idx)
+            except IndexError:
+                # The reader cannot be used after reaching the end of the file
+                self._reader.close()
+                self._reader = None
+                if idx < len(self):
+                    self._data = self._data[:idx]
+                    self._segment = (0, idx, 1)
+                msg = (
+                    f'Frame {idx} is beyond the end of the video '
+                    f'{self._filename}.'
+                )
+                raise IndexError(msg)
+            if self.grayscale:
+                frame = color.to_grayscale(frame[None])[0]
+            stage.advance(1, frame.nbytes)
+        return frame
@@ -0,0 +1,152 @@
+from typing import Tuple
+
+import numpy as np
+
+from gridvid.obj.Video import Video
+from gridvid.config import defaults
+from gridvid.utils import noise
+
+class NoiseVideo(Video):
+
+    def __init__(
+    self, frames:int, shape:Tuple[int], fps:int, grayscale:bool = False,
+    seed:int = None, chunk_size:int = None, filename:str = None,
+    verbose:bool = False) -> None:
+        '''
+            A Video consisting of random generated noise, which generates its
+            frames on demand rather than storing them.
+
+            The noise is generated `chunk_size` frames at a time, each chunk
+            seeded from `seed`, such that any frame can be reproduced without
+            generating the frames before it – see `utils/noise.py`.  Saving
+            the video streams the noise into the encoder one chunk at a time,
+            so the entire video is never held in memory.  If `seed` is None, a
+            random seed is chosen, see property `seed`.
+        '''
+        err_msg = (
+            '\n\nThe constructor for class `NoiseVideo` requires that argument '
+            '`{}` be of <class \'{}\'>.'
+        )
+
+        if chunk_size is None:
+            chunk_size = defaults.chunk_size
+
+        if seed is None:
+            seed = np.random.SeedSequence().entropy
+
+        if not isinstance(frames, int):
+            raise TypeError(err_msg.format('frames', 'int'))
+
+        if not isinstance(shape, tuple):
+            raise TypeError(err_msg.format('shape', 'tuple'))
+
+        if not isinstance(grayscale, bool):
+            raise TypeError(err_msg.format('grayscale', 'bool'))
+
+        if not isinstance(seed, int):
+            raise TypeError(err_msg.format('seed', 'int'))
+
+        if not isinstance(chunk_size, int) or chunk_size <= 0:
+            msg = (
+                '\n\nThe constructor for class `NoiseVideo` requires that '
+                'argument `chunk_size` be an integer greater than zero.'
+            )
+            raise ValueError(msg)
+
+        # The frames are generated on demand, so the video array only holds
+        # the shape of the video, without taking up any memory
+        shape = (frames, shape[0], shape[1], 1 if grayscale else 3)
+        placeholder = np.broadcast_to(np.zeros((), dtype = np.uint8), shape)
+        super().__init__(placeholder, fps, filename, verbose, copy = False)
+
+        self._seed = seed
+        self._chunk_size = chunk_size
+        self._chunk = (None, None)
+
+    # PROPERTIES
+    @property
+    def seed(self) -> int:
+        '''
+            Returns the seed from which the noise is generated.
+        '''
+        return self._seed
+
+    @property
+    def raw(self) -> np.ndarray:
+        '''
+            Returns the original video data array, without modifications,
+            generating the entire video.
+        '''
+        return self._generate_all()
+
+    # GETTER/SETTER METHODS
+    def __getitem__(self, key) -> np.ndarray:
+        '''
+            Returns an element or subset of the video data, generating only the
+            chunks containing the frames selected by the first index.
+        '''
+        if self._modified_data is not None:
+            return super().__getitem__(key)
+        return self._render_key(key)
+
+    # PRIVATE METHODS
+    @property
+    def _frames(self) -> np.ndarray:
+        '''
+            Private property which returns the modified video array if it
+            exists, or generates the entire original video array otherwise.
+        '''
+        if self._modified_data is None:
+            return self._generate_all()
+        return self._modified_data
+
+    def _select(self, indices:np.ndarray) -> np.ndarray:
+        '''
+            Private method which returns a new array containing the frames at
+            `indices`, generating only the chunks which contain them.
+        '''
+        if self._modified_data is not None:
+            return super()._select(indices)
+
+        data = np.empty((len(indices),) + self.shape[1:], dtype = np.uint8)
+        current = (None, None)
+        for n, idx in enumerate(indices):
+            chunk, offset = divmod(int(idx), self._chunk_size)
+            if current[0] != chunk:
+                current = (chunk, self._generate(chunk))
+            data[n] = current[1][offset]
+        return data
+
+    def _writable(self) -> np.ndarray:
+        '''
+            Private method which returns the modified video array, generating
+            the entire video into it on the first call.
+        '''
+        if self._modified_data is None:
+            self._modified_data = self._generate_all()
+        return self._modified_data
+
+    def _generate_all(self) -> np.ndarray:
+        '''
+            Private method which generates and returns the entire original
+            video array.
+        '''
+        data = np.empty(self.shape, dtype = np.uint8)
+        return noise.generate(data, self._seed, self._chunk_size)
+
+    def _generate(self, chunk:int) -> np.ndarray:
+        '''
+            Private method which returns chunk number `chunk` of the noise,
+            keeping the most recently generated chunk.  Safe to call from
+            several threads at once, see method `save`.
+        '''
+        cached, frames = self._chunk
+        if cached != chunk:
+            start = chunk * self._chunk_size
+            count = min(self._chunk_size, len(self) - start)
+            frames = noise.noise_chunk(
+                noise.chunk_seed(self._seed, chunk),
+                (count,) + self.shape[1:]
+            )
+            self._chunk = (chunk, frames)
+        return frames
@@ -0,0 +1,172 @@
+from pathlib import Path
+from typing import Any, Dict, List
+import tracemalloc
+import threading
+import json
+import time
+import os
+
+from gridvid.utils import profiling, text
+
+class Profiler:
+
+    def __init__(self, memory:bool = True) -> None:
+        '''
+            Records the wall time, number of frames, bytes moved and peak
+            memory of every stage of the video operations run while the
+            profiler is active, e.g.
+
+                with Profiler() as profiler:
+                    video = Video.from_file('input.mp4')
+                    video.create_grid((5, 5))
+                    video.save()
+                profiler.report()
+
+            Stages include `from_file` (decoding), `copy` (copies of the video
+            array), `create_grid` (grid geometry), `set_grid` and `blend_grid`
+            (drawing grids), `save` (encoding), `save_frame`, `save_frames`
+            and `parallel_map` – see `utils/profiling.py`.
+
+            If `memory` is True, the peak memory allocated during each stage
+            is measured with `tracemalloc`, which includes numpy arrays but not
+            the memory of ffmpeg processes or memory maps.
+        '''
+        if not isinstance(memory, bool):
+            msg = (
+                'The constructor for class `Profiler` requires that argument '
+                '`memory` be of <class \'bool\'>.'
+            )
+            raise TypeError(msg)
+
+        self._memory = memory
+        self._records = []
+        self._lock = threading.Lock()
+        self._started_tracing = False
+        self._origin = None
+
+    # PROPERTIES
+    @property
+    def records(self) -> List[Dict[str,Any]]:
+        '''
+            Returns the measurements of every stage, in the order in which the
+            stages finished.  Times are in seconds since the profiler started.
+        '''
+        with self._lock:
+            return [dict(record) for record in self._records]
+
+    # ACTIVATION
+    def start(self) -> 'Profiler':
+        '''
+            Starts recording stages, see also `with` statements.
+        '''
+        if self._memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        if self._origin is None:
+            self._origin = time.perf_counter()
+        profiling.activate(self)
+        return self
+
+    def stop(self) -> None:
+        '''
+            Stops recording stages.
+        '''
+        profiling.deactivate(self)
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def __enter__(self) -> 'Profiler':
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    # RESULTS
+    def summary(self) -> Dict[str,Dict[str,Any]]:
+        '''
+            Returns the total wall time, frames and bytes, and the maximum
+            peak memory, of each stage, along with the number of times it ran
+            and its throughput.
+        '''
+        summary = {}
+        for record in self.records:
+            total = summary.setdefault(record['name'], {
+                'calls': 0, 'seconds': 0.0, 'frames': 0, 'bytes': 0,
+                'memory': None,
+            })
+            total['calls'] += 1
+            total['seconds'] += record['seconds']
+            total['frames'] += record['frames']
+            total['bytes'] += record['bytes']
+            if record['memory'] is not None:
+                total['memory'] = max(total['memory'] or 0, record['memory'])
+
+        for total in summary.values():
+            seconds = total['seconds']
+            total['fps'] = total['frames'] / seconds if seconds > 0 else None
+            total['mbps'] = (
+                total['bytes'] / seconds / 1024**2 if seconds > 0 else None
+            )
+        return summary
+
+    def report(self) -> None:
+        '''
+            Prints the summary of each stage, see method `summary`.
+        '''
+        header = (
+            f'{"Stage":<16s} {"Calls":>6s} {"Time":>9s} {"Frames":>8s} '
+            f'{"FPS":>9s} {"MB/s":>9s} {"Peak MB":>9s}'
+        )
+        print(text.bold(header) + text.norm())
+
+        for name, total in self.summary().items():
+            fps = '-' if total['fps'] is None else f'{total["fps"]:.1f}'
+            mbps = '-' if total['mbps'] is None else f'{total["mbps"]:.1f}'
+            memory = total['memory']
+            memory = '-' if memory is None else f'{memory / 1024**2:.1f}'
+            print(
+                f'{name:<16s} {total["calls"]:>6d} {total["seconds"]:>8.3f}s '
+                f'{total["frames"]:>8d} {fps:>9s} {mbps:>9s} {memory:>9s}'
+            )
+
+    def to_json(self, path:Path) -> None:
+        '''
+            Writes the measurements of every stage, and their summary, to a
+            JSON file at `path`.
+        '''
+        contents = {'stages': self.records, 'summary': self.summary()}
+        Path(path).write_text(json.dumps(contents, indent = 2))
+
+    def to_trace(self, path:Path) -> None:
+        '''
+            Writes the stages to a trace file at `path`, in the Trace Event
+            Format read by chrome://tracing and Perfetto, where each stage is a
+            span on the thread which ran it.
+        '''
+        events = []
+        for record in self.records:
+            events.append({
+                'name': record['name'],
+                'ph': 'X',
+                'ts': record['start'] * 1e6,
+                'dur': record['seconds'] * 1e6,
+                'pid': os.getpid(),
+                'tid': record['thread'],
+                'args': {
+                    'frames': record['frames'],
+                    'bytes': record['bytes'],
+                    'memory': record['memory'],
+                },
+            })
+        Path(path).write_text(json.dumps({'traceEvents': events}))
+
+    # PRIVATE METHODS
+    def _add(self, record:Dict[str,Any]) -> None:
+        '''
+            Private method which stores the measurements of a finished stage,
+            relative to the time at which the profiler started.
+        '''
+        record = dict(record, start = record['start'] - self._origin)
+        with self._lock:
+            self._records.append(record)
@@ -0,0 +1,189 @@
+import weakref
+
+import numpy as np
+
+from gridvid.obj.Video import Video
+from gridvid.utils import profiling, sharing
+
+class SharedVideo(Video):
+
+    # CONSTRUCTORS
+    @classmethod
+    def attach(
+    cls, handle:sharing.Handle, filename:str = None,
+    verbose:bool = False) -> 'SharedVideo':
+        '''
+            Returns an instance of SharedVideo which uses the frames of the
+            shared video with the given handle (see property `handle`)
+            directly, without copying them.  Modifications are seen by every
+            process attached to the video.
+
+            The attached video does not own the frames: method `close` must be
+            called once it is no longer needed, but only the video which
+            created the frames unlinks them.
+        '''
+        name, shape, dtype, fps = handle
+        memory = sharing.attach(name)
+
+        video = cls.__new__(cls)
+        Video.__init__(
+            video, sharing.ndarray(memory, shape, dtype), fps, filename,
+            verbose, copy = False
+        )
+        video._memory = memory
+        video._owner = False
+        return video
+
+    def __init__(
+    self, data:np.ndarray, fps:int, filename:str = None,
+    verbose:bool = False) -> None:
+        '''
+            A Video whose frames are stored in a block of shared memory, into
+            which `data` is copied.  Other processes attach to the frames
+            through the video's handle, without copying or pickling them, e.g.
+
+                with SharedVideo(data, 30) as video:
+                    pool.map(work, [video.handle] * 4)
+
+            where `work` calls `SharedVideo.attach(handle)`.  Pickling the
+            video itself also only sends its handle and grids.
+
+            Unlike other videos, modifiers write to the shared frames in place,
+            rather than to a copy.  The video owns the shared memory, which is
+            unlinked once the video is closed with `unlink`, leaves a `with`
+            statement, or is garbage collected.
+        '''
+        super().__init__(data, fps, filename, verbose, copy = False)
+
+        data = self._data
+        self._memory = sharing.create(data.nbytes)
+        self._owner = True
+        self._data = sharing.ndarray(self._memory, data.shape, data.dtype.str)
+        with profiling.stage('copy', nbytes = data.nbytes):
+            self._data[...] = data
+
+    # PROPERTIES
+    @property
+    def handle(self) -> sharing.Handle:
+        '''
+            Returns the handle of the video, a tuple (name, shape, dtype, fps)
+            from which other processes attach to its frames, see `attach`.
+        '''
+        return (
+            self._memory.name, self._data.shape, self._data.dtype.str,
+            self._fps
+        )
+
+    @property
+    def owner(self) -> bool:
+        '''
+            Returns True if the video created its shared memory, and is
+            responsible for unlinking it.
+        '''
+        return self._owner
+
+    # CLOSING
+    def close(self) -> None:
+        '''
+            Detaches the video from its shared memory, after which it can no
+            longer be used.  Raises BufferError if an array viewing the frames
+            (e.g. property `raw`) still exists.
+        '''
+        if self._memory is None:
+            return
+
+        # Every view of the frames keeps their base array alive, so the
+        # memory can only be closed if the video holds the last reference
+        shape, dtype = self._data.shape, self._data.dtype
+        base = weakref.ref(self._data.base)
+        self._data = np.empty((0,) + shape[1:], dtype = dtype)
+        if base() is not None:
+            self._data = base().reshape(shape)
+            msg = (
+                '\n\nThe method `close` for class `SharedVideo` requires that '
+                'no other arrays view the frames (e.g. property `raw`).\n'
+            )
+            raise BufferError(msg)
+
+        self._memory.close()
+        self._modified_data = None
+        self._memory = None
+
+    def unlink(self) -> None:
+        '''
+            Closes the video and frees its shared memory, once every attached
+            process has closed it too.  Only the owner should unlink the
+            video, see property `owner`.
+        '''
+        if self._memory is None:
+            return
+        memory = self._memory
+        self.close()
+        memory.unlink()
+
+    def __enter__(self) -> 'SharedVideo':
+        return self
+
+    def __exit__(self, *args) -> None:
+        if self._owner:
+            self.unlink()
+        else:
+            self.close()
+
+    def __del__(self) -> None:
+        # Videos which failed to construct have no shared memory
+        memory = getattr(self, '_memory', None)
+        if memory is None:
+            return
+
+        # Releasing the video's view of the frames before unmapping them
+        try:
+            self.close()
+        except BufferError:
+            # Arrays viewing the frames keep them mapped until they are freed
+            pass
+
+        if self._owner:
+            try:
+                memory.unlink()
+            except FileNotFoundError:
+                pass
+
+    def __reduce__(self) -> tuple:
+        '''
+            Pickles the video as its handle and grids, such that unpickling it
+            attaches to the frames rather than copying them.
+        '''
+        state = {
+            '_overlays': self._overlays,
+            '_region': self._region,
+            '_default_extension': self._default_extension,
+        }
+        return (
+            self.attach, (self.handle, self._filename, self._verbose), state
+        )
+
+    # PRIVATE METHODS
+    def _writable(self) -> np.ndarray:
+        '''
+            Private method which returns the shared video array, which is
+            modified in place.
+        '''
+        return self._data
+
+    def _release(self) -> None:
+        '''
+            Private method which unlinks the shared memory while keeping the
+            frames mapped, such that the memory is freed once the video and
+            its views are garbage collected, see method `Video.parallel_map`.
+        '''
+        if self._owner and self._memory is not None:
+            self._memory.unlink()
+            self._owner = False
+
+    def _shared(self) -> 'SharedVideo':
+        '''
+            Private method which returns the video itself, as its frames are
+            already shared, see method `parallel_map`.
+        '''
+        return self
@@ -1,93 +1,292 @@
-from multiprocessing import Pool
 from pathlib import Path
-from typing import Tuple
+from typing import Callable, Iterator, List, Sequence, Tuple, Union
+import threading
 import os
 
-import matplotlib.pyplot as plt
-from numba import njit, prange
 import numpy as np
-import imageio
 
-from gridvid.config.video_settings import input_extensions
-from gridvid.utils.creators import create_unique_name
-from gridvid.config import defaults, paths
+from gridvid.config.video_settings import input_extensions, gray_pixelformat
+from gridvid.utils.creators import create_unique_name, create_unique_names
+from gridvid.utils import (
+    framecache, encoding, decoding, segments, scaling, color, images, noise,
+    pipes, profiling, sharing, rendercache
+)
+from gridvid.config import defaults, paths, video_settings
+from gridvid.obj.GridSpec import GridSpec
 
 class Video:
 
+    # Whether frames may be selected by several threads at once, see method
+    # `save`
+    _concurrent = True
+
     # CONSTRUCTORS
     @classmethod
     def noise(
     cls, frames:int, shape:Tuple[int], fps:int, grayscale:bool = False,
-    filename:str = None, verbose:bool = True) -> 'Video':
+    filename:str = None, verbose:bool = False, seed:int = None,
+    chunk_size:int = None, workers:int = None,
+    lazy:bool = False) -> 'Video':
         '''
             Returns an instance of Video consisting of random generated noise.
+            If `grayscale` is True, the video has a single color channel.
+
+            The noise is generated `chunk_size` frames at a time by `workers`
+            threads, with each chunk seeded from `seed`, such that the same
+            `seed` and `chunk_size` always give the same video – see
+            `utils/noise.py`.
+
+            If `lazy` is True, returns a `NoiseVideo`, which only generates
+            frames as they are accessed or saved, and never stores the entire
+            video in memory.
         '''
-        data = np.random.randint(
-            0, 256, (frames, shape[0], shape[1], 3), dtype = np.uint8
-        )
-        if grayscale:
-            data[:,:,:,0] = data[:,:,:,2]
-            data[:,:,:,1] = data[:,:,:,2]
+        if lazy:
+            from gridvid.obj.NoiseVideo import NoiseVideo
+            return NoiseVideo(
+                frames, shape, fps, grayscale, seed, chunk_size, filename,
+                verbose
+            )
 
-        return cls(data, fps, filename, verbose)
+        if seed is None:
+            seed = np.random.SeedSequence().entropy
+
+        channels = 1 if grayscale else 3
+        data = np.empty((frames, shape[0], shape[1], channels), np.uint8)
+        with profiling.stage('noise', frames = frames, nbytes = data.nbytes):
+            noise.generate(data, seed, chunk_size, workers)
+
+        return cls(data, fps, filename, verbose, copy = False)
+
+    @classmethod
+    def wrap(
+    cls, data:np.ndarray, fps:int, filename:str = None,
+    verbose:bool = False) -> 'Video':
+        '''
+            Returns an instance of Video which uses the array `data` directly,
+            without copying it.  The array is never written to by Video, as
+            any modifications are made to a copy created on the first write.
+        '''
+        return cls(data, fps, filename, verbose, copy = False)
 
     @classmethod
     def from_file(
-    cls, filename:str, directory:Path = None, verbose:bool = True) -> 'Video':
+    cls, filename:str, directory:Path = None, verbose:bool = False,
+    cache:bool = False, start:segments.Position = None,
+    end:segments.Position = None, stride:int = None,
+    size:scaling.Size = None, crop:scaling.Crop = None,
+    grayscale:bool = False) -> 'Video':
         '''
             To initiate an instance of class Video by referring to the path of a
             video file.
-        '''
-        err_msg = (
-            '\n\nThe class method `from_file` for class `Video` requires that '
-            'argument `{}` be of <class \'{}\'>.\n'
-        )
 
-        if not isinstance(filename, str):
-            raise TypeError(err_msg.format('filename', 'str'))
+            If `cache` is True, the decoded frames are stored in a raw cache
+            file in the temporary video directory, and the video is backed by a
+            memory map of that file.  Loading an unchanged file again then maps
+            the cache instead of decoding the file, and only the frames that
+            are actually accessed are read from disk.
+
+            `start` and `end` select a segment of the video, as frame numbers
+            (int), seconds (float) or timestamps (str, e.g. '00:30.5'), where
+            `end` is excluded.  Every `stride`-th frame of the segment is kept.
+            The decoder seeks directly to `start` and stops at `end`, unless
+            `cache` is True, in which case the entire video is cached and the
+            segment is a view of the cache.  See `save` for splicing a modified
+            segment back into the video file.
+
+            `crop` selects a rectangle (top, left, height, width) of each
+            frame, which is scaled to `size` – either a tuple (height, width)
+            or a scale factor, e.g. 0.25 for previews.  Frames are cropped and
+            scaled by ffmpeg while decoding, so full size frames are never held
+            in memory.  Grids added to the video are placed as they would be
+            on the full size frames – see `create_grid`.
+
+            If `grayscale` is True, only the luminance of the frames is kept,
+            in a single color channel.  ffmpeg converts the frames while
+            decoding, so RGB frames are never held in memory.
+        '''
+        path = cls._source_path(filename, directory, verbose, 'from_file')
 
-        if not isinstance(directory, Path):
-            raise TypeError(err_msg.format('directory', 'Path'))
+        if not isinstance(cache, bool):
+            msg = (
+                '\n\nThe class method `from_file` for class `Video` requires '
+                'that argument `cache` be of <class \'bool\'>.\n'
+            )
+            raise TypeError(msg)
 
-        if not isinstance(verbose, bool):
-            raise TypeError(err_msg.format('verbose', 'bool'))
+        if not isinstance(grayscale, bool):
+            msg = (
+                '\n\nThe class method `from_file` for class `Video` requires '
+                'that argument `grayscale` be of <class \'bool\'>.\n'
+            )
+            raise TypeError(msg)
 
-        path = directory / filename
+        empty_msg = (
+            '\n\nThe class method `from_file` for class `Video` requires '
+            'that arguments `start` and `end` select at least one frame.\n'
+        )
 
-        # Check that `path` refers to an existing file
-        if not path.exists():
-            msg = ('\n\nGiven path cannot be located in filesystem\n')
-            raise FileNotFoundError(msg)
+        cached = framecache.load(path) if cache else None
 
-        # Raises Exception if `path` is of invalid filetype
-        if path.suffix not in input_extensions:
-            msg = ( '\n\nUnsupported file extension in given path, supported '
-                   f'filetypes are: {",".join(input_extensions)}\n')
-            raise IOError(msg)
-
-        # Getting video metadata
-        reader = imageio.get_reader(path, 'ffmpeg')
-        metadata = reader.get_meta_data()
+        if cached is not None:
+            data, fps = cached
+        else:
+            import imageio
+
+            with profiling.stage('from_file', verbose) as stage:
+                pipe = not cache and video_settings.encoder == 'pipe'
+
+                with imageio.get_reader(path, 'ffmpeg') as reader:
+                    # Getting video metadata
+                    metadata = reader.get_meta_data()
+
+                    # Getting video duration and fps
+                    fps = int(metadata['fps'])
+
+                    width, height = metadata['source_size']
+                    region = scaling.region((height, width), size, crop)
+
+                    if cache:
+                        # Decoding the video directly into the cache file
+                        framecache.store(
+                            path, profiling.counted(reader, stage), fps
+                        )
+                    else:
+                        first, stop, stride = segments.frame_range(
+                            start, end, stride, metadata['fps']
+                        )
+                        count = decoding.frame_count(
+                            metadata, first, stop, stride
+                        )
+
+                        if not pipe:
+                            frames = reader
+                            if ((first, stop, stride) != (0, None, 1) or
+                                not scaling.is_identity(region) or grayscale):
+                                # Seeking to the segment instead of decoding
+                                # every frame, and cropping, scaling and
+                                # converting frames as they are decoded
+                                frames = segments.read_frames(
+                                    path, metadata['fps'], first, stop, stride,
+                                    scaling.ffmpeg_params(region), grayscale
+                                )
+
+                            # Decoding directly into an array sized from the
+                            # metadata
+                            data = decoding.read_into(
+                                profiling.counted(frames, stage), count
+                            )
+
+                if cache:
+                    # Sources which decode to no frames are not cached
+                    cached = framecache.load(path)
+                    if cached is None:
+                        raise ValueError(empty_msg)
+                    data, fps = cached
+                elif pipe:
+                    # Reading many frames at a time, straight into an array
+                    # sized from the metadata, once imageio's decoder has
+                    # stopped
+                    input_params, output_params = pipes.input_args(
+                        metadata['fps'], first, stop, stride,
+                        scaling.ffmpeg_params(region)
+                    )
+                    data = pipes.read_into(
+                        path, region[2] + (1 if grayscale else 3,), count,
+                        input_params, output_params
+                    )
+                    stage.advance(len(data), data.nbytes)
+
+        if cache:
+            # Selecting the segment as a view of the cache
+            first, stop, stride = segments.frame_range(
+                start, end, stride, fps, len(data)
+            )
+            data = data[first:stop:stride]
 
-        # Getting video duration and fps
-        fps = int(metadata['fps'])
+            region = scaling.region(data.shape[1:3], size, crop)
+            if not scaling.is_identity(region):
+                data = scaling.resize(data, region)
 
-        # Preparing list of video frames
-        video = []
-        for frame in reader:
-            video.append(frame)
+            if grayscale:
+                data = color.to_grayscale(data)
 
-        data = np.array(video, dtype = np.uint8)
+        if data is None or len(data) == 0:
+            raise ValueError(empty_msg)
 
-        video = cls(data, fps, path.name, verbose)
+        video = cls(data, fps, path.name, verbose, copy = False)
         video.default_extension = path.suffix
+        video._source = path
+        video._segment = (first, first + (len(data) - 1) * stride + 1, stride)
+        if not scaling.is_identity(region):
+            video._region = region
         return video
 
+    @classmethod
+    def stream(
+    cls, filename:str, directory:Path = None, chunk_size:int = None,
+    verbose:bool = False) -> Iterator['Video']:
+        '''
+            Decodes a video file `chunk_size` frames at a time, yielding each
+            chunk as an instance of Video.  Only the chunk currently being
+            processed is kept in memory, so the video file does not need to
+            fit in RAM.
+        '''
+        if chunk_size is None:
+            chunk_size = defaults.chunk_size
+
+        if not isinstance(chunk_size, int) or chunk_size <= 0:
+            msg = (
+                '\n\nThe class method `stream` for class `Video` requires that '
+                'argument `chunk_size` be an integer greater than zero.\n'
+            )
+            raise ValueError(msg)
+
+        path = cls._source_path(filename, directory, verbose, 'stream')
+
+        import imageio
+        reader = imageio.get_reader(path, 'ffmpeg')
+        try:
+            fps = int(reader.get_meta_data()['fps'])
+
+            chunk = None
+            idx = 0
+            for frame in reader:
+                if chunk is None:
+                    chunk = np.empty((chunk_size,) + frame.shape, np.uint8)
+                chunk[idx] = frame
+                idx += 1
+                if idx == chunk_size:
+                    video = cls(chunk, fps, path.name, verbose, copy = False)
+                    video._default_extension = path.suffix
+                    yield video
+                    chunk = None
+                    idx = 0
+
+            if idx > 0:
+                video = cls(
+                    chunk[:idx], fps, path.name, verbose, copy = False
+                )
+                video._default_extension = path.suffix
+                yield video
+        finally:
+            reader.close()
+
     def __init__(
     self, data:np.ndarray, fps:int, filename:str = None,
-    verbose:bool = True) -> None:
+    verbose:bool = False, copy:bool = True) -> None:
         '''
-            To handle video data in a convenient way.  Copies the input array.
+            To handle video data in a convenient way.  Copies the input array,
+            unless `copy` is False – in which case the given array is used
+            directly and is never written to.
+
+            Modifications are made to a second array, which is only created
+            once a modifier actually writes to the video.  Grids are not
+            written to the video at all, but are kept as overlays which are
+            drawn onto each frame as it is accessed – see `create_grid`.
+
+            `data` is an array of shape (Number of frames, Video Height, Video
+            Width, Color Channels), with either three (RGB) channels or a
+            single (grayscale) channel.  A 3-D array is taken to be grayscale.
         '''
         err_msg = (
             '\n\nThe constructor for class `Video` requires that argument '
@@ -109,20 +308,38 @@ class Video:
         if not isinstance(filename, str):
             raise TypeError(err_msg.format('filename', 'str'))
 
+        if not isinstance(copy, bool):
+            raise TypeError(err_msg.format('copy', 'bool'))
+
         array_msg = (
             '\n\nThe constructor for class `Video` requires that argument '
-            '`data` be a 4-D array of dtype <class \'np.uint8\'>.'
+            '`data` be a 3-D or 4-D array of dtype <class \'np.uint8\'>, '
+            'with one or three color channels.'
         )
-        if data.ndim != 4:
+        if data.ndim == 3:
+            # Grayscale frames are stored with a single color channel
+            data = data[...,None]
+
+        if data.ndim != 4 or data.shape[3] not in (1, 3):
             raise ValueError(array_msg)
         elif data.dtype != np.uint8:
             raise TypeError(array_msg)
 
         self._filename = filename
 
-        self._data = data.copy()
-        self._modified_data = data.copy()
+        if copy:
+            with profiling.stage('copy', nbytes = data.nbytes):
+                data = data.copy()
+
+        self._data = data
+        self._verbose = verbose
+        self._modified_data = None
+        self._shared_frames = None
+        self._overlays = []
         self._fps = fps
+        self._source = None
+        self._segment = None
+        self._region = None
         self._default_extension = input_extensions[0]
 
     # PROPERTIES
@@ -136,7 +353,7 @@ class Video:
     @property
     def raw(self) -> np.ndarray:
         '''
-            Returns the video data array.
+            Returns the original video data array, without modifications.
         '''
         return self._data
 
@@ -150,9 +367,19 @@ class Video:
     @property
     def array(self) -> np.ndarray:
         '''
-            Returns a copy of the video array.
+            Returns a copy of the video array, including its grids.
         '''
-        return self._data.copy()
+        if self._overlays:
+            return self[:]
+        return self._frames.copy()
+
+    @property
+    def grids(self) -> Tuple[GridSpec]:
+        '''
+            Returns the grids overlaid on the video, in the order in which they
+            are drawn.
+        '''
+        return tuple(self._overlays)
 
     @property
     def shape(self) -> Tuple[int]:
@@ -163,6 +390,21 @@ class Video:
         '''
         return self._data.shape
 
+    @property
+    def channels(self) -> int:
+        '''
+            Returns the number of color channels, i.e. 1 for grayscale videos
+            and 3 for RGB videos.
+        '''
+        return self.shape[3]
+
+    @property
+    def grayscale(self) -> bool:
+        '''
+            Returns True if the video has a single (grayscale) color channel.
+        '''
+        return self.channels == 1
+
     @property
     def size(self) -> int:
         '''
@@ -187,21 +429,24 @@ class Video:
         '''
             Returns the data array as an array of specified type.
         '''
-        return self._data.astype(new_type)
+        return self[:].astype(new_type)
 
     # GETTER/SETTER METHODS
     def __getitem__(self, key) -> np.ndarray:
         '''
-            Returns an element or subset of the video data.
+            Returns an element or subset of the video data.  If the video has
+            grids, they are drawn onto a copy of the selected frames.
         '''
-        return self._data[key]
+        if not self._overlays:
+            return self._frames[key]
+        return self._render_key(key)
 
     def __setitem__(self, key, value) -> None:
         '''
             Sets an element or subset of the video data to a new value.
         '''
         try:
-            self._data[key] = value
+            self._writable()[key] = value
         except ValueError:
             msg = 'Attempted to set element of Video instance with invalid value.'
             raise ValueError(msg)
@@ -223,128 +468,143 @@ class Video:
             SEE METHOD: __iter__()
         '''
         self.iter_idx += 1
-        if self.iter_idx < self._data.shape[0]:
-            return self._data[self.iter_idx]
+        if self.iter_idx < len(self):
+            return self[self.iter_idx]
         else:
             raise StopIteration()
 
     # MODIFIERS
     def create_grid(
-    self, shape:Tuple[int], width:int = 1, linecolor:Tuple[int] = None) -> None:
+    self, shape:Tuple[int], width:int = 1, linecolor:Tuple[int] = None,
+    opacity:float = 1.0, antialias:bool = False) -> GridSpec:
         '''
-            Adds a grid to the video.
+            Adds a grid to the video, and returns it.
 
             `shape` should be a tuple containing two positive integers – the
             first is the number of horizontal lines in the grid, and the second
             is the number of vertical lines in the grid. Does not include image
-            boundaries.
+            boundaries.  Either integer may be replaced by a sequence of line
+            positions, in pixels (integers) or as fractions of the image size
+            (floats in [0, 1]).
 
             `width` is the width of the grid lines in pixels.  Must be an
             integer greater than or equal to one.
 
             `linecolor` is an rgb value, i.e. a tuple containing three integers
-            in the range [0, 255].
+            in the range [0, 255], or a gray level.  On grayscale videos, rgb
+            values are drawn with their luminance.
+
+            `opacity` is the opacity of the grid lines, in the range [0, 1].
+            If `antialias` is True, lines are drawn at their exact positions,
+            with partially covered pixels blended proportionally.
+
+            If the video was cropped or scaled while loading (see
+            `from_file`), the grid is placed, and its lines are scaled, as
+            they would be on the full size frames of the video file.
+
+            The pixels covered by the grid are only computed once for each
+            combination of frame shape and grid – see class `GridSpec`.  The
+            video data is left untouched: the grid is kept as an overlay, and
+            drawn onto frames as they are accessed, shown or saved.  Grids are
+            drawn in the order in which they were added.
         '''
-        if linecolor is None:
-            linecolor = (255, 255, 255)
-
-        err_msg = (
-            'Method `create_grid` in class `Video` requires that argument '
-            '`{}` be of <class \'{}\'>.'
-        )
-
-        if not isinstance(shape, tuple):
-            raise TypeError(err_msg.format('shape', 'tuple'))
+        if self._region is not None:
+            shape, width = scaling.grid_placement(
+                self._region, shape, width, antialias
+            )
 
-        if not isinstance(width, int):
-            raise TypeError(err_msg.format('width', 'int'))
+        linecolor = color.grid_color(linecolor, self.channels)
 
-        if not isinstance(linecolor, tuple):
-            raise TypeError(err_msg.format('linecolor', 'tuple'))
+        with profiling.stage('create_grid'):
+            grid = GridSpec.get(
+                self.shape[1:3], shape, width, linecolor, opacity, antialias
+            )
+        self._overlays.append(grid)
+        return grid
 
-        err_msg = (
-            'Method `create_grid` in class `Video` requires that argument '
-            '`{}` be {}'
-        )
+    def remove_grid(self, grid:GridSpec = None) -> None:
+        '''
+            Removes `grid`, as returned by `create_grid`, from the video.
 
-        cond = [
-            len(shape) != 2,
-            not isinstance(shape[0], int), shape[0] < 0,
-            not isinstance(shape[1], int), shape[1] < 0,
-        ]
-        if cond[0] or cond[1] or cond[2] or cond[3] or cond[4]:
-            msg = (
-                'a two-tuple of integers greater than or equal to zero.'
-            )
-            raise TypeError(err_msg.format('shape', msg))
+            If `grid` is None, removes every grid added during the program
+            runtime (i.e. not included in the loaded video.)  Modifications
+            made through indexing or `parallel_map` are kept.
+        '''
+        if grid is None:
+            self._overlays.clear()
+            return
 
-        if not isinstance(width, int) or width <= 0:
+        try:
+            self._overlays.remove(grid)
+        except ValueError:
             msg = (
-                'an integer greater than or equal to one.'
+                'The method `remove_grid` for class `Video` requires that '
+                'argument `grid` be a grid returned by `create_grid`.'
             )
-            raise TypeError(err_msg.format('width', msg))
+            raise ValueError(msg)
 
+    def parallel_map(
+    self, func:Callable[[np.ndarray], np.ndarray], chunk_size:int = None,
+    workers:int = None) -> None:
+        '''
+            Applies `func` to the frames of the video, `chunk_size` frames at a
+            time, in a pool of `workers` processes, e.g. to draw a grid into
+            the frames:
+
+                video.parallel_map(grid.apply)
+
+            `func` receives an array of shape (Number of frames, Video Height,
+            Video Width, Color Channels) holding a range of frames, which it
+            modifies in place, or it returns an array of the same shape which
+            replaces the range.  The ranges are disjoint, and `func` must be
+            picklable, e.g. a function defined at the top level of a module.
+
+            The frames are passed to the workers through shared memory rather
+            than being pickled, see `utils/sharing.py`.  A `SharedVideo` is
+            modified in place, while other videos are copied into shared
+            memory once, and keep the modified frames there.  Grids kept as
+            overlays are not passed to `func`.
+        '''
         err_msg = (
-            'Method `create_grid` in class `Video` requires that argument '
-            '`{}` be {}'
+            'The method `parallel_map` for class `Video` requires that '
+            'argument `{}` be {}'
         )
 
-        cond = [
-            len(linecolor) != 3,
-            not isinstance(linecolor[0], int), 256 <= linecolor[0] <= 0,
-            not isinstance(linecolor[1], int), 256 <= linecolor[1] <= 0,
-            not isinstance(linecolor[2], int), 256 <= linecolor[2] <= 0,
-        ]
+        if chunk_size is None:
+            chunk_size = defaults.chunk_size
 
-        if cond[0] or cond[1] or cond[2] or cond[3] or cond[4]:
-            msg = (
-                'a two-tuple of integers greater than or equal to zero.'
-            )
-            raise TypeError(err_msg.format('shape', msg))
-
-        img_shape = self._data.shape[1:3]
-        shape = (shape[0]+2, shape[1]+2)
+        if workers is None:
+            workers = os.cpu_count()
 
-        rows = np.linspace(0, img_shape[0]-1, shape[0], dtype = np.int64)
-        cols = np.linspace(0, img_shape[1]-1, shape[1], dtype = np.int64)
+        if not callable(func):
+            raise TypeError(err_msg.format('func', 'callable.'))
 
-        old_rows = rows.copy()
-        old_cols = cols.copy()
+        if not isinstance(chunk_size, int) or chunk_size <= 0:
+            msg = 'an integer greater than zero.'
+            raise ValueError(err_msg.format('chunk_size', msg))
 
-        disp = 1
-        for i in range(width-1):
-            new_rows = old_rows + disp
-            invalid_rows = np.where(np.logical_or(
-                new_rows < 0, new_rows >= img_shape[0]
-            ))
-            new_rows = np.delete(new_rows, invalid_rows)
+        if not isinstance(workers, int) or workers <= 0:
+            msg = 'an integer greater than zero.'
+            raise ValueError(err_msg.format('workers', msg))
 
-            new_cols = old_cols + disp
-            invalid_cols = np.where(np.logical_or(
-                new_cols < 0, new_cols >= img_shape[1]
-            ))
-            new_cols = np.delete(new_cols, invalid_cols)
-
-            rows = np.concatenate([rows, new_rows])
-            cols = np.concatenate([cols, new_cols])
-            if disp > 0:
-                disp = -disp
-            elif disp < 0:
-                disp = -disp + 1
-
-        rows = np.sort(np.array(list(set(rows)), dtype = np.int64))
-        cols = np.sort(np.array(list(set(cols)), dtype = np.int64))
-
-        self._modified_data = self._set_grid(
-            self._data, rows, cols, np.array(linecolor, dtype = np.uint8)
-        )
-
-    def remove_grid(self):
-        '''
-            Resets the video and removes any grids added during the program
-            runtime (i.e. not included in the loaded video.)
-        '''
-        self._modified_data = self._data.copy()
+        shared = self._shared()
+        try:
+            with profiling.stage('parallel_map', self._verbose) as stage:
+                sharing.map_ranges(
+                    shared.handle, func,
+                    sharing.ranges(len(shared), chunk_size), workers, stage
+                )
+        except BaseException:
+            if shared is not self:
+                shared.unlink()
+            raise
+
+        if shared is not self:
+            # Keeping the mapped frames as the modified video array rather
+            # than copying them out, the memory being freed once unmapped
+            shared._release()
+            self._modified_data = shared.raw
+            self._shared_frames = shared
 
     # CREATING/SAVING IMAGES AND VIDEO
     def show(self, frame:int) -> None:
@@ -360,8 +620,10 @@ class Video:
         image = self.__getitem__(frame)
 
         # Display the image
+        import matplotlib.pyplot as plt
+        image, kwargs = self._image_args(image)
         plt.style.use('dark_background')
-        plt.imshow(image)
+        plt.imshow(image, **kwargs)
         plt.axis(False)
         plt.show()
 
@@ -397,15 +659,15 @@ class Video:
         if not isinstance(directory, Path):
             raise TypeError(err_msg.format('directory', 'Path'))
 
-        if frame < -self._data.shape[0] or frame >= self._data.shape[0]:
+        if frame < -len(self) or frame >= len(self):
             msg = (
                 f'The method `save_frame` for class `Video` requires that '
                 f'argument `frame` be an integer in range '
-                f'[{-self._data.shape[0]:d}, {self._data.shape[0]-1:d}].'
+                f'[{-len(self):d}, {len(self)-1:d}].'
             )
             raise ValueError(msg)
 
-        path = (directory / filename).with_suffix(extension)
+        path = (paths.ensure(directory) / filename).with_suffix(extension)
 
         # Check that 'frame' is an integer value
         if not isinstance(frame, int):
@@ -416,14 +678,138 @@ class Video:
         image = self.__getitem__(frame)
 
         # Save the image
-        plt.imsave(path, image)
+        import matplotlib.pyplot as plt
+        with profiling.stage('save_frame', frames = 1, nbytes = image.nbytes):
+            image, kwargs = self._image_args(image)
+            plt.imsave(path, image, **kwargs)
+
+    def save_frames(
+    self, frames:Union[slice, Sequence[int]] = None, directory:Path = None,
+    extension:str = None, prefix:str = None, compression:int = None,
+    quality:int = None, workers:int = None) -> List[Path]:
+        '''
+            Saves the frames selected by `frames` – a slice or a sequence of
+            frame numbers, defaulting to every frame – as image files, and
+            returns their paths.
+
+            Files are named after `prefix` (the video's filename by default),
+            the current date and time and the frame number.  `extension`
+            selects PNG or JPEG images, whose `compression` level or
+            `quality` default to the values in `config/defaults.py` – see
+            `utils/images.py`.
+
+            Frames are rendered `defaults.chunk_size` at a time, and encoded
+            in parallel by `workers` threads, which defaults to the number of
+            CPUs.
+        '''
+        err_msg = (
+            'The method `save_frames` for class `Video` requires that '
+            'argument `{}` be of <class \'{}\'>.'
+        )
+
+        if frames is None:
+            frames = slice(None)
+
+        if extension is None:
+            extension = defaults.image_extension
+
+        if directory is None:
+            directory = paths.image_output
+
+        if prefix is None:
+            prefix = self._filename
+
+        if not isinstance(frames, (slice, Sequence, np.ndarray)):
+            raise TypeError(err_msg.format('frames', 'slice'))
+
+        if not isinstance(extension, str):
+            raise TypeError(err_msg.format('extension', 'str'))
+
+        if not isinstance(directory, Path):
+            raise TypeError(err_msg.format('directory', 'Path'))
+
+        if not isinstance(prefix, str):
+            raise TypeError(err_msg.format('prefix', 'str'))
+
+        params = images.writer_params(extension, compression, quality)
+
+        # Resolving integers and slices arithmetically, without an array of
+        # every frame number
+        try:
+            if isinstance(frames, slice):
+                selected = range(len(self))[frames]
+                indices = np.arange(
+                    selected.start, selected.stop, selected.step
+                )
+            elif isinstance(frames, (int, np.integer)):
+                indices = np.array(range(len(self))[frames])
+            else:
+                indices = np.arange(len(self))[frames]
+        except IndexError:
+            msg = 'Attempted to access invalid index on Video instance.'
+            raise IndexError(msg)
+
+        directory = paths.ensure(directory)
+        files = [
+            directory / (name + extension)
+            for name in create_unique_names(indices.tolist(), prefix)
+        ]
+
+        def render():
+            for start in range(0, len(indices), defaults.chunk_size):
+                yield from self[indices[start:start + defaults.chunk_size]]
+
+        with profiling.stage('save_frames', self._verbose) as stage:
+            return images.write_images(
+                profiling.counted(render(), stage), files, workers, **params
+            )
 
     def save(
     self, filename:str = None, fps:int = None, extension:str = None,
-    directory:Path = None) -> None:
+    directory:Path = None, codec:str = None, crf:int = None,
+    preset:str = None, threads:int = None, pixelformat:str = None,
+    keyint:int = None, start:segments.Position = None,
+    end:segments.Position = None, stride:int = None,
+    splice:bool = False, parallel:int = None, cache:bool = None) -> None:
         '''
             Saves the entire video to file, defaults to directory:
                 'Videos/Gridvid/Program Output/Videos/'
+
+            `start`, `end` and `stride` save only a segment of the video, see
+            `from_file`.
+
+            If `splice` is True, the video must have been loaded from a
+            segment of a video file (see `from_file`) with a stride of one.
+            The saved file is then a copy of that entire video file, in which
+            the segment is replaced by this video.  Only the groups of
+            pictures overlapping the segment are re-encoded, while the rest of
+            the video stream is copied as is – see `utils/segments.py`.  As
+            the streams are joined without re-encoding them, `codec` and
+            `pixelformat` must match those of the file, or ValueError is
+            raised.
+
+            `codec`, `crf`, `preset`, `threads`, `pixelformat` and `keyint`
+            configure the ffmpeg encoder, and default to the values in
+            `config/video_settings.py`.  Frames are prepared in a separate
+            thread while the encoder is running, and grids are drawn onto
+            them `defaults.chunk_size` frames at a time.
+
+            Grayscale videos are encoded with only their luminance, using
+            `video_settings.gray_pixelformat`, unless `splice` is True.
+
+            If `parallel` is greater than one, the frames are split into that
+            many segments, which are encoded at the same time by separate
+            ffmpeg processes and joined without re-encoding them, see
+            `segments.split` and `segments.concat`.  The segments are aligned
+            to `keyint`, and temporarily stored in
+            `paths.temp_video_directory`.  Unless `threads` is given, the
+            available cores are divided between the encoders.
+
+            If `cache` is True, which defaults to `video_settings.render_cache`,
+            saving an unmodified video loaded from a file reuses the output of
+            an earlier save of the same file with the same grids and
+            arguments, by copying it rather than encoding the video again –
+            see `utils/rendercache.py`.
         '''
         err_msg = (
             'The method `save` for class `Video` requires that argument `{}` '
@@ -454,11 +840,121 @@ class Video:
         if not isinstance(directory, Path):
             raise TypeError(err_msg.format('directory', 'Path'))
 
-        path = directory / (filename + extension)
+        if cache is None:
+            cache = video_settings.render_cache
+
+        if not isinstance(splice, bool):
+            raise TypeError(err_msg.format('splice', 'bool'))
 
-        with imageio.get_writer(path, fps = fps) as writer:
-            for frame in self.__iter__():
-                writer.append_data(frame)
+        if not isinstance(cache, bool):
+            raise TypeError(err_msg.format('cache', 'bool'))
+
+        if parallel is None:
+            parallel = 1
+
+        if not isinstance(parallel, int) or parallel <= 0:
+            msg = (
+                'The method `save` for class `Video` requires that argument '
+                '`parallel` be an integer greater than zero.'
+            )
+            raise ValueError(msg)
+
+        if splice and parallel > 1:
+            msg = (
+                'The method `save` for class `Video` requires that argument '
+                '`parallel` be one, when argument `splice` is True.'
+            )
+            raise ValueError(msg)
+
+        if keyint is None:
+            keyint = video_settings.keyint
+
+        if threads is None and parallel > 1:
+            threads = max(1, (os.cpu_count() or 1) // parallel)
+
+        if pixelformat is None and self.grayscale and not splice:
+            # Encoding only the luminance, rather than expanding to rgb
+            pixelformat = gray_pixelformat
+
+        params = encoding.writer_params(
+            codec = codec, crf = crf, preset = preset, threads = threads,
+            pixelformat = pixelformat, keyint = keyint
+        )
+
+        path = paths.ensure(directory) / (filename + extension)
+
+        if splice:
+            segment = (start, end, stride)
+        else:
+            first, stop, stride = segments.frame_range(
+                start, end, stride, self._fps, len(self)
+            )
+            segment = (first, stop, stride)
+
+        job = None
+        if cache:
+            job = self._cache_key(
+                fps = fps, extension = extension, params = params,
+                segment = segment, splice = splice, parallel = parallel
+            )
+
+        if job is not None and rendercache.fetch(job, path) is not None:
+            if self._verbose:
+                print(f'save: reused the cached render of {path.name}')
+            return
+
+        if splice:
+            self._splice(path, start, end, stride, params)
+        elif parallel > 1:
+            self._save_parallel(
+                path, fps, first, stop, stride, params, parallel, keyint
+            )
+        else:
+            with profiling.stage('save', self._verbose) as stage:
+                self._encode(path, fps, first, stop, stride, params, stage)
+
+        if job is not None:
+            rendercache.store(job, path)
+
+    # CONVERSIONS
+    def to_grayscale(self) -> 'Video':
+        '''
+            Returns a grayscale copy of the video, containing the luminance of
+            its frames in a single color channel.  Grids are kept, and drawn
+            with the luminance of their colors.
+        '''
+        if self.grayscale:
+            data = self._frames
+        else:
+            data = color.to_grayscale(self._frames)
+        return self._converted(data)
+
+    def to_rgb(self) -> 'Video':
+        '''
+            Returns an rgb copy of the video, in which every color channel is
+            equal to the luminance of a grayscale video.  Grids are kept.
+        '''
+        if self.grayscale:
+            data = color.to_rgb(self._frames)
+        else:
+            data = self._frames
+        return self._converted(data)
+
+    def to_shared(self) -> 'SharedVideo':
+        '''
+            Returns a copy of the video whose frames are stored in shared
+            memory, from which other processes read them without copying, see
+            class `SharedVideo`.  Grids are kept.
+        '''
+        from gridvid.obj.SharedVideo import SharedVideo
+
+        video = SharedVideo(
+            self._frames, self._fps, self._filename, self._verbose
+        )
+        video._default_extension = self._default_extension
+        video._region = self._region
+        video._overlays = list(self._overlays)
+        return video
 
     # REMOVING FILES
     @classmethod
@@ -466,25 +962,324 @@ class Video:
         '''
             Clears the files stored in the temporary directory – location:
                 `~/Videos/Gridvid/Program Output/.temporary files/`
+
+            This includes the frame cache files created by `from_file`.
         '''
         files = paths.temp_video_directory.glob('*')
         for f in files:
-            os.remove(f)
+            if f.is_file():
+                os.remove(f)
 
     # PRIVATE METHODS
-    @staticmethod
-    @njit(cache = True, parallel = True)
-    def _set_grid(
-    video:np.ndarray, rows:np.ndarray, cols:np.ndarray,
-    color:np.ndarray) -> np.ndarray:
+    @property
+    def _frames(self) -> np.ndarray:
+        '''
+            Private property which returns the modified video array if it
+            exists, or the original video array otherwise.
+        '''
+        if self._modified_data is None:
+            return self._data
+        return self._modified_data
+
+    def _select(self, indices:np.ndarray) -> np.ndarray:
+        '''
+            Private method which returns a new array containing the frames at
+            `indices`, without grids.
+        '''
+        return self._frames[indices]
+
+    def _render(self, indices:np.ndarray) -> np.ndarray:
+        '''
+            Private method which returns a new array containing the frames at
+            `indices`, with every grid drawn onto them.
+        '''
+        frames = self._select(indices)
+        for grid in self._overlays:
+            grid.apply(frames)
+        return frames
+
+    def _render_key(self, key) -> np.ndarray:
+        '''
+            Private method which returns the element or subset of the video
+            data selected by `key`, with every grid drawn onto the frames
+            selected by its first index.
+        '''
+        if isinstance(key, tuple):
+            frames, key = key[0], key[1:]
+        else:
+            frames, key = key, ()
+
+        if frames is Ellipsis:
+            return self._render(np.arange(len(self)))[(Ellipsis,) + key]
+
+        # Resolving integers and slices arithmetically, without an array of
+        # every frame number
+        try:
+            if isinstance(frames, slice):
+                selected = range(len(self))[frames]
+                indices = np.arange(
+                    selected.start, selected.stop, selected.step
+                )
+            elif isinstance(frames, (int, np.integer)):
+                indices = np.array(range(len(self))[frames])
+            else:
+                indices = np.arange(len(self))[frames]
+        except IndexError:
+            msg = 'Attempted to access invalid index on Video instance.'
+            raise IndexError(msg)
+
+        if indices.ndim == 0:
+            return self._render(indices[None])[0][key]
+        return self._render(indices)[(slice(None),) + key]
+
+    def _chunks(
+    self, first:int = 0, stop:int = None, stride:int = 1,
+    lock:threading.Lock = None) -> Iterator[np.ndarray]:
+        '''
+            Private method which yields every `stride`-th frame of the video
+            from `first` to `stop`, including its grids, as arrays of
+            `defaults.chunk_size` frames.  If given, `lock` is held while each
+            chunk is selected.
+        '''
+        if stop is None:
+            stop = len(self)
+
+        step = defaults.chunk_size * stride
+        for start in range(first, stop, step):
+            if lock is None:
+                yield self[start:min(start + step, stop):stride]
+            else:
+                with lock:
+                    chunk = self[start:min(start + step, stop):stride]
+                yield chunk
+
+    def _iter_chunks(
+    self, first:int = 0, stop:int = None, stride:int = 1,
+    lock:threading.Lock = None) -> Iterator[np.ndarray]:
+        '''
+            Private method which yields every `stride`-th frame of the video
+            from `first` to `stop`, including its grids, selecting
+            `defaults.chunk_size` frames at a time.
+        '''
+        for chunk in self._chunks(first, stop, stride, lock):
+            yield from chunk
+
+    def _encode(
+    self, path:Path, fps:int, first:int, stop:int, stride:int,
+    params:dict, stage:profiling.Stage,
+    lock:threading.Lock = None) -> None:
+        '''
+            Private method which encodes every `stride`-th frame of the video
+            from `first` to `stop` to `path`, with the backend selected by
+            `video_settings.encoder`.
         '''
-            Private method for replacing the required pixels in `video` with the
-            given RGB tuple `color`.
+        if video_settings.encoder == 'pipe':
+            # Writing each chunk of frames to ffmpeg with a single write
+            writer = pipes.Writer(path, fps, self.shape[1:], **params)
+            frames = self._chunks(first, stop, stride, lock)
+            queue_size = max(
+                1, video_settings.queue_size // defaults.chunk_size
+            )
+        else:
+            import imageio
+            writer = imageio.get_writer(path, fps = fps, **params)
+            frames = self._iter_chunks(first, stop, stride, lock)
+            queue_size = None
+
+        with writer:
+            encoding.write_frames(
+                writer, profiling.counted(frames, stage), queue_size
+            )
+
+    def _save_parallel(
+    self, path:Path, fps:int, first:int, stop:int, stride:int, params:dict,
+    parallel:int, keyint:int) -> None:
+        '''
+            Private method which encodes up to `parallel` segments of the video
+            at the same time, and joins them into `path`, see method `save`.
+        '''
+        from concurrent.futures import ThreadPoolExecutor
+
+        count = -(-(stop - first) // stride)
+        bounds = segments.split(count, parallel, keyint)
+
+        name = create_unique_name(prefix = 'parallel')
+        temp_directory = paths.ensure(paths.temp_video_directory)
+        parts = [
+            temp_directory / (name + f'_{n:03d}' + path.suffix)
+            for n in range(len(bounds))
+        ]
+
+        # Videos which decode their frames on demand share a single reader
+        lock = None if self._concurrent else threading.Lock()
+
+        with profiling.stage('save', self._verbose) as stage:
+            try:
+                with ThreadPoolExecutor(max_workers = len(parts)) as executor:
+                    futures = [
+                        executor.submit(
+                            self._encode, part, fps, first + start * stride,
+                            min(stop, first + end * stride), stride, params,
+                            stage, lock
+                        )
+                        for (start, end), part in zip(bounds, parts)
+                    ]
+                    for future in futures:
+                        future.result()
+
+                segments.concat(parts, path, temp_directory)
+            finally:
+                for part in parts:
+                    if part.exists():
+                        part.unlink()
+
+    def _splice(
+    self, path:Path, start:segments.Position, end:segments.Position,
+    stride:int, params:dict) -> None:
+        '''
+            Private method which saves the video by splicing it into the video
+            file it was loaded from, see method `save`.
+        '''
+        err_msg = (
+            'The method `save` for class `Video` requires {}, when argument '
+            '`splice` is True.'
+        )
+
+        if (start, end, stride) != (None, None, None):
+            msg = 'that arguments `start`, `end` and `stride` be None'
+            raise ValueError(err_msg.format(msg))
+
+        if self._source is None or self._segment[2] != 1:
+            msg = 'a video loaded from a file with a stride of one'
+            raise ValueError(err_msg.format(msg))
+
+        if self._region is not None:
+            msg = 'a video loaded without cropping or scaling'
+            raise ValueError(err_msg.format(msg))
+
+        first, stop, stride = self._segment
+        if len(self) != stop - first:
+            msg = 'that the number of frames in the video be unchanged'
+            raise ValueError(err_msg.format(msg))
+
+        frames = self._iter_chunks()
+        if self.grayscale:
+            # The segment must match the rgb frames decoded from the source
+            frames = (np.repeat(frame, 3, axis = 2) for frame in frames)
+
+        with profiling.stage('save', self._verbose) as stage:
+            segments.splice(
+                self._source, path, first, stop,
+                profiling.counted(frames, stage), paths.temp_video_directory,
+                **params
+            )
+
+    def _cache_key(self, **args) -> Union[str, None]:
         '''
-        for frame in prange(video.shape[0]):
-            for row in rows:
-                video[frame,row,:] = color
-            for col in cols:
-                video[frame,:,col] = color
+            Private method which returns the render cache key of saving the
+            video with the arguments given as keyword arguments, see method
+            `save`.  Returns None if the video cannot be cached, as it was not
+            loaded from a file which still exists, or it was modified.
+        '''
+        if self._source is None or self._modified_data is not None:
+            return None
+
+        if not self._source.exists():
+            return None
+
+        grids = [
+            (grid.frame_shape, grid.shape, grid.width, grid.linecolor,
+             grid.opacity, grid.antialias)
+            for grid in self._overlays
+        ]
+        return rendercache.key(
+            self._source, job = 'save', source_segment = self._segment,
+            region = self._region, channels = self.channels, grids = grids,
+            encoder = video_settings.encoder, **args
+        )
 
+    def _shared(self) -> 'SharedVideo':
+        '''
+            Private method which returns a copy of the video in shared memory,
+            see method `parallel_map`.
+        '''
+        return self.to_shared()
+
+    def _converted(self, data:np.ndarray) -> 'Video':
+        '''
+            Private method which returns a new Video containing `data`, the
+            converted frames of this video, along with its grids and settings.
+        '''
+        copy = data is self._frames
+        video = Video(
+            data, self._fps, self._filename, self._verbose, copy = copy
+        )
+        video._default_extension = self._default_extension
+        video._region = self._region
+        for grid in self._overlays:
+            video._overlays.append(GridSpec.get(
+                grid.frame_shape, grid.shape, grid.width,
+                color.grid_color(grid.linecolor, video.channels),
+                grid.opacity, grid.antialias
+            ))
         return video
+
+    @staticmethod
+    def _image_args(image:np.ndarray) -> Tuple[np.ndarray, dict]:
+        '''
+            Private method which returns a frame and the keyword arguments
+            with which matplotlib displays it, such that grayscale frames are
+            shown in gray rather than with a color map.
+        '''
+        if image.ndim == 3 and image.shape[2] == 1:
+            return image[...,0], {'cmap': 'gray', 'vmin': 0, 'vmax': 255}
+        return image, {}
+
+    def _writable(self) -> np.ndarray:
+        '''
+            Private method which returns the modified video array, creating it
+            from a copy of the original video array on the first call.
+        '''
+        if self._modified_data is None:
+            with profiling.stage('copy', nbytes = self._data.nbytes):
+                self._modified_data = self._data.copy()
+        return self._modified_data
+
+    @classmethod
+    def _source_path(
+    cls, filename:str, directory:Path, verbose:bool, method:str) -> Path:
+        '''
+            Private method which checks the arguments shared by the file-based
+            constructors, and returns the path to the video file.
+        '''
+        err_msg = (
+            f'\n\nThe class method `{method}` for class `Video` requires that '
+            'argument `{}` be of <class \'{}\'>.\n'
+        )
+
+        if directory is None:
+            directory = paths.input_videos
+
+        if not isinstance(filename, str):
+            raise TypeError(err_msg.format('filename', 'str'))
+
+        if not isinstance(directory, Path):
+            raise TypeError(err_msg.format('directory', 'Path'))
+
+        if not isinstance(verbose, bool):
+            raise TypeError(err_msg.format('verbose', 'bool'))
+
+        path = directory / filename
+
+        # Check that `path` refers to an existing file
+        if not path.exists():
+            msg = ('\n\nGiven path cannot be located in filesystem\n')
+            raise FileNotFoundError(msg)
+
+        # Raises Exception if `path` is of invalid filetype
+        if path.suffix not in input_extensions:
+            msg = ( '\n\nUnsupported file extension in given path, supported '
+                   f'filetypes are: {",".join(input_extensions)}\n')
+            raise IOError(msg)
+
+        return path
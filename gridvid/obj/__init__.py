@@ -1 +1,6 @@
 from .Video import Video
+from .LazyVideo import LazyVideo
+from .NoiseVideo import NoiseVideo
+from .GridSpec import GridSpec
+from .Profiler import Profiler
+from .SharedVideo import SharedVideo
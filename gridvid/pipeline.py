@@ -0,0 +1,196 @@
+'''
+    Streaming pipelines which decode, modify and encode videos chunk by chunk,
+    such that memory usage is bounded by the chunk size rather than by the
+    length of the video.
+'''
+from threading import Event, Thread
+from queue import Empty, Full, Queue
+from pathlib import Path
+from typing import Any, Callable, Tuple
+
+import numpy as np
+
+from gridvid.config import defaults, paths
+from gridvid.obj.GridSpec import GridSpec
+from gridvid.utils import encoding, profiling
+
+def process(
+source:Path, destination:Path, shape:Tuple[int], width:int = 1,
+linecolor:Tuple[int] = None, chunk_size:int = None, fps:int = None,
+verbose:bool = False, **encoder) -> int:
+    '''
+        Adds a grid to the video file at `source` and saves the result to
+        `destination`, without ever loading the entire video into memory.
+        Returns the number of frames processed.
+
+        Frames are decoded `chunk_size` at a time, the grid is added to each
+        chunk (see method `create_grid` in class `Video` for a description of
+        `shape`, `width` and `linecolor`) and the chunk is passed directly to
+        the video writer.
+
+        Decoding, adding the grid and encoding run simultaneously in three
+        threads, which pass chunks to one another through bounded queues.  The
+        chunks are stored in `defaults.pipeline_buffers` preallocated buffers,
+        which are reused once encoded.
+
+        If `verbose` is True, the number of frames encoded and the throughput
+        are displayed while the video is processed.  Additional keyword
+        arguments configure the encoder, see method `save` in class `Video`.
+    '''
+    err_msg = (
+        'Function `process` in module `pipeline` requires that argument `{}` '
+        'be {}'
+    )
+
+    if chunk_size is None:
+        chunk_size = defaults.chunk_size
+
+    if not isinstance(source, Path):
+        raise TypeError(err_msg.format('source', 'of <class \'Path\'>.'))
+
+    if not isinstance(destination, Path):
+        raise TypeError(err_msg.format('destination', 'of <class \'Path\'>.'))
+
+    if fps is not None and not isinstance(fps, int):
+        raise TypeError(err_msg.format('fps', 'of <class \'int\'>.'))
+
+    if not isinstance(verbose, bool):
+        raise TypeError(err_msg.format('verbose', 'of <class \'bool\'>.'))
+
+    if not isinstance(chunk_size, int) or chunk_size <= 0:
+        msg = 'an integer greater than zero.'
+        raise ValueError(err_msg.format('chunk_size', msg))
+
+    if not source.exists():
+        msg = ('\n\nGiven path cannot be located in filesystem\n')
+        raise FileNotFoundError(msg)
+
+    params = encoding.writer_params(**encoder)
+
+    import imageio
+    paths.ensure(destination.parent)
+    reader = imageio.get_reader(source, 'ffmpeg')
+    metadata = reader.get_meta_data()
+    frame_width, frame_height = metadata['size']
+    if fps is None:
+        fps = int(metadata['fps'])
+
+    grid = GridSpec.get((frame_height, frame_width), shape, width, linecolor)
+
+    buffers = np.empty(
+        (defaults.pipeline_buffers, chunk_size, frame_height, frame_width, 3),
+        dtype = np.uint8
+    )
+
+    # Buffers cycle through the queues: free -> decoded -> gridded -> free
+    free = Queue()
+    decoded = Queue(maxsize = defaults.pipeline_buffers)
+    gridded = Queue(maxsize = defaults.pipeline_buffers)
+    for idx in range(defaults.pipeline_buffers):
+        free.put(idx)
+
+    stop = Event()
+    errors = []
+    counts = []
+
+    def decode():
+        frames = iter(reader)
+        while True:
+            idx = _get(free, stop)
+            if idx is None:
+                return
+            n = 0
+            for frame in frames:
+                buffers[idx,n] = frame
+                n += 1
+                if n == chunk_size:
+                    break
+            if n == 0:
+                return
+            _put(decoded, (idx, n), stop)
+
+    def encode():
+        count = 0
+        with imageio.get_writer(destination, fps = fps, **params) as writer:
+            while True:
+                item = _get(gridded, stop)
+                if item is None:
+                    break
+                idx, n = item
+                for frame in buffers[idx,:n]:
+                    writer.append_data(frame)
+                count += n
+                stage.advance(n, buffers[idx,:n].nbytes)
+                free.put(idx)
+        counts.append(count)
+
+    with profiling.stage('process', verbose) as stage:
+        decoder = Thread(
+            target = _stage, args = (decode, decoded, stop, errors)
+        )
+        encoder = Thread(target = _stage, args = (encode, None, stop, errors))
+        decoder.start()
+        encoder.start()
+
+        # Adds the grid to each decoded chunk in the calling thread
+        try:
+            while True:
+                item = _get(decoded, stop)
+                if item is None:
+                    break
+                idx, n = item
+                grid.apply(buffers[idx,:n])
+                _put(gridded, item, stop)
+        except BaseException as e:
+            errors.append(e)
+            stop.set()
+        finally:
+            _put(gridded, None, stop)
+            decoder.join()
+            encoder.join()
+            reader.close()
+
+    if errors:
+        raise errors[0]
+
+    return counts[0]
+
+def _stage(
+func:Callable[[], None], output:Queue, stop:Event, errors:list) -> None:
+    '''
+        Private function which runs a single pipeline stage in a thread.  Once
+        the stage is done, signals the end of the stream to `output`; if the
+        stage fails, its exception is stored and the other stages are stopped.
+    '''
+    try:
+        func()
+    except BaseException as e:
+        errors.append(e)
+        stop.set()
+    finally:
+        if output is not None:
+            _put(output, None, stop)
+
+def _get(queue:Queue, stop:Event) -> Any:
+    '''
+        Private function which returns the next item in `queue`, or None if
+        the pipeline has been stopped.
+    '''
+    while not stop.is_set():
+        try:
+            return queue.get(timeout = 0.1)
+        except Empty:
+            pass
+    return None
+
+def _put(queue:Queue, item:Any, stop:Event) -> None:
+    '''
+        Private function which adds `item` to `queue`, unless the pipeline has
+        been stopped.
+    '''
+    while not stop.is_set():
+        try:
+            queue.put(item, timeout = 0.1)
+            return
+        except Full:
+            pass
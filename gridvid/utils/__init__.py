@@ -1,3 +1,16 @@
 from . import parsers
 from . import text
 from . import creators
+from . import framecache
+from . import encoding
+from . import decoding
+from . import geometry
+from . import segments
+from . import scaling
+from . import color
+from . import images
+from . import noise
+from . import profiling
+from . import pipes
+from . import sharing
+from . import rendercache
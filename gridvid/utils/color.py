@@ -0,0 +1,74 @@
+'''
+    Tools for converting video frames and colors between RGB and grayscale
+    (luminance) representations.
+'''
+from typing import Tuple, Union
+
+import numpy as np
+
+from gridvid.config import defaults
+
+# Integer ITU-R BT.601 luma weights of the red, green and blue channels, which
+# sum to 256
+_weights = (77, 150, 29)
+
+Color = Union[int, Tuple[int, ...]]
+
+def luminance(rgb:Tuple[int, int, int]) -> int:
+    '''
+        Returns the luminance in [0, 255] of the color `rgb`.
+    '''
+    return sum(w * c for w, c in zip(_weights, rgb)) + 128 >> 8
+
+def grid_color(linecolor:Color, channels:int) -> Tuple[int, ...]:
+    '''
+        Converts `linecolor` into a tuple with one value per color channel of
+        a video with `channels` channels (1 for grayscale, 3 for RGB).
+
+        `linecolor` may be None (white), a single integer (a gray level), or
+        a tuple of one (gray) or three (RGB) integers.  RGB colors are
+        converted to their luminance for grayscale videos.
+    '''
+    if linecolor is None:
+        linecolor = 255
+
+    if isinstance(linecolor, int):
+        return (linecolor,) * channels
+
+    if isinstance(linecolor, tuple):
+        if len(linecolor) == 1:
+            return linecolor * channels
+        if len(linecolor) == 3 and channels == 1:
+            return (luminance(linecolor),)
+
+    return linecolor
+
+def to_grayscale(frames:np.ndarray, chunk_size:int = None) -> np.ndarray:
+    '''
+        Converts `frames`, an array of shape (Number of frames, Video Height,
+        Video Width, 3), into an array of shape (Number of frames, Video
+        Height, Video Width, 1) containing their luminance.
+
+        Frames are converted `chunk_size` at a time, such that the temporary
+        integer arrays stay small.
+    '''
+    if chunk_size is None:
+        chunk_size = defaults.chunk_size
+
+    gray = np.empty(frames.shape[:3] + (1,), dtype = np.uint8)
+    for start in range(0, frames.shape[0], chunk_size):
+        chunk = frames[start:start + chunk_size]
+        total = np.full(chunk.shape[:3], 128, dtype = np.uint16)
+        for c, weight in enumerate(_weights):
+            total += chunk[...,c] * np.uint16(weight)
+        gray[start:start + chunk_size,...,0] = total >> 8
+
+    return gray
+
+def to_rgb(frames:np.ndarray) -> np.ndarray:
+    '''
+        Converts `frames`, an array of shape (Number of frames, Video Height,
+        Video Width, 1), into an array of shape (Number of frames, Video
+        Height, Video Width, 3) in which every channel is equal.
+    '''
+    return np.repeat(frames, 3, axis = 3)
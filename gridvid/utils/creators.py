@@ -1,3 +1,4 @@
+from typing import Iterable, List
 from datetime import datetime
 
 def create_unique_name(prefix:str = None, suffix:str = None) -> str:
@@ -17,3 +18,20 @@ def create_unique_name(prefix:str = None, suffix:str = None) -> str:
     datetime_str = f'{datetime.now():%m_%d_%Y_%H_%M_%S_%f}'
     filename = f'{prefix}{datetime_str}{suffix}'
     return filename
+
+def create_unique_names(
+numbers:Iterable[int], prefix:str = None, suffix:str = None) -> List[str]:
+    '''
+        Generate one filename for each of `numbers`, sharing a single date and
+        time, with each number appended as a zero-padded suffix
+    '''
+    numbers = list(numbers)
+    digits = len(str(max(numbers, default = 0)))
+    name = create_unique_name(prefix)
+
+    if suffix is None:
+        suffix = ''
+    elif suffix[0] != '_':
+        suffix = '_' + suffix
+
+    return [f'{name}_{number:0{digits}d}{suffix}' for number in numbers]
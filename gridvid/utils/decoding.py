@@ -0,0 +1,86 @@
+'''
+    Tools for decoding videos directly into preallocated arrays, sized from
+    the container metadata.
+'''
+from typing import Any, Dict, Iterable
+import math
+
+import numpy as np
+
+# Factor by which the buffer grows when the metadata underestimates the
+# number of frames
+_growth = 1.5
+
+# Unused frames are kept, rather than shrinking the array, while they make up
+# at most one in this many frames of the array
+_slack = 16
+
+def frame_count(
+metadata:Dict[str,Any], first:int = 0, stop:int = None,
+stride:int = 1) -> int:
+    '''
+        Returns the number of frames selected by `first`, `stop` and `stride`
+        (see `utils/segments.py`) in a video with the given imageio metadata,
+        estimated from its number of frames, or from its duration and fps.
+        Returns zero if the metadata contains neither.
+    '''
+    total = metadata.get('nframes', math.inf)
+    if not math.isfinite(total):
+        duration = metadata.get('duration', math.inf)
+        if not math.isfinite(duration):
+            return 0
+        total = round(duration * metadata['fps'])
+
+    if stop is not None:
+        total = min(total, stop)
+
+    return max(0, -(-(int(total) - first) // stride))
+
+def read_into(frames:Iterable[np.ndarray], count:int) -> np.ndarray:
+    '''
+        Copies each frame in `frames` into an array preallocated for `count`
+        frames once the shape of the first frame is known, and returns the
+        array of shape (Number of frames, *frame shape).  Returns None if
+        there are no frames.
+
+        Each frame is copied once, unless the metadata underestimates the
+        number of frames.  The array then grows geometrically, by
+        reallocating it, which may move the frames read so far; as the
+        capacity grows by a constant factor, each frame is copied a constant
+        number of times on average.  If there are fewer than `count` frames,
+        the array is shrunk once all frames are read, see `trim`.
+    '''
+    data = None
+    capacity = max(count, 1)
+
+    idx = 0
+    for frame in frames:
+        if data is None:
+            data = np.empty((capacity,) + frame.shape, dtype = np.uint8)
+        elif idx == capacity:
+            capacity = max(capacity + 1, int(capacity * _growth))
+            data.resize((capacity,) + data.shape[1:], refcheck = False)
+        data[idx] = frame
+        idx += 1
+
+    if data is None:
+        return None
+
+    return trim(data, idx)
+
+def trim(data:np.ndarray, frames:int) -> np.ndarray:
+    '''
+        Returns the first `frames` frames of `data`, an array allocated for
+        more frames than were decoded into it.
+
+        Reallocating the array copies it, so a view is returned instead if
+        only a few frames are unused.
+    '''
+    unused = len(data) - frames
+    if unused == 0:
+        return data
+    if unused * _slack <= len(data):
+        return data[:frames]
+
+    data.resize((frames,) + data.shape[1:], refcheck = False)
+    return data
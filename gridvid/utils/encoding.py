@@ -0,0 +1,110 @@
+'''
+    Tools for configuring the video encoder, and for feeding it frames.
+'''
+from typing import Any, Dict, Iterable
+from threading import Event, Thread
+from queue import Queue
+
+import numpy as np
+
+from gridvid.config import video_settings
+from gridvid.utils.parsers import parse_kwargs
+
+def writer_params(**kwargs) -> Dict[str,Any]:
+    '''
+        Converts the encoder settings given as keyword arguments into keyword
+        arguments for `imageio.get_writer`.  Settings which are not given, or
+        are None, are taken from `config/video_settings.py`.
+
+        Accepted settings:
+
+            codec       – name of the ffmpeg video codec, e.g. 'libx264'
+            crf         – constant rate factor, lower is better quality
+            preset      – speed/compression tradeoff, e.g. 'veryfast'
+            threads     – number of encoder threads, zero lets ffmpeg decide
+            pixelformat – pixel format of the output, e.g. 'yuv420p'
+            keyint      – maximum number of frames between keyframes
+    '''
+    expected = {
+        'codec': video_settings.codec,
+        'crf': video_settings.crf,
+        'preset': video_settings.preset,
+        'threads': video_settings.threads,
+        'pixelformat': video_settings.pixelformat,
+        'keyint': video_settings.keyint,
+    }
+    types = {
+        'codec': str, 'crf': int, 'preset': str, 'threads': int,
+        'pixelformat': str, 'keyint': int,
+    }
+
+    kwargs = {key:value for key,value in kwargs.items() if value is not None}
+    settings = parse_kwargs(kwargs, expected, types)
+
+    ffmpeg_params = [
+        '-crf', str(settings['crf']),
+        '-preset', settings['preset'],
+        '-threads', str(settings['threads']),
+        '-g', str(settings['keyint']),
+    ]
+
+    params = {
+        'codec': settings['codec'],
+        'pixelformat': settings['pixelformat'],
+        'quality': None,
+        'ffmpeg_params': ffmpeg_params,
+    }
+    return params
+
+def write_frames(
+writer, frames:Iterable[np.ndarray], queue_size:int = None) -> int:
+    '''
+        Appends each frame in `frames` to `writer`, an imageio video writer.
+        Returns the number of frames written.
+
+        The frames are prepared in a separate thread and passed to the
+        encoder through a queue holding up to `queue_size` frames, such that
+        preparing the next frames never stalls the encoder.
+    '''
+    if queue_size is None:
+        queue_size = video_settings.queue_size
+
+    queue = Queue(maxsize = queue_size)
+    stop = Event()
+    errors = []
+
+    def produce():
+        try:
+            for frame in frames:
+                if stop.is_set():
+                    break
+                queue.put(np.ascontiguousarray(frame))
+        except BaseException as e:
+            errors.append(e)
+        finally:
+            queue.put(None)
+
+    producer = Thread(target = produce, daemon = True)
+    producer.start()
+
+    count = 0
+    finished = False
+    try:
+        while not finished:
+            frame = queue.get()
+            if frame is None:
+                finished = True
+            else:
+                writer.append_data(frame)
+                count += 1
+    finally:
+        # Stops and unblocks the producer if the encoder failed
+        stop.set()
+        while not finished:
+            finished = queue.get() is None
+        producer.join()
+
+    if errors:
+        raise errors[0]
+
+    return count
@@ -0,0 +1,114 @@
+'''
+    On-disk cache of decoded video frames, stored as raw <np.uint8> arrays in
+    the temporary video directory and accessed through `np.memmap`.
+
+    Each cache file consists of a fixed-size header containing the shape of
+    the video array and its fps, followed by the raw frame data.  Cache files
+    are named after the path, size and modification time of the source video,
+    such that a modified source file never maps onto a stale cache.
+'''
+from typing import Iterable, Optional, Tuple
+from pathlib import Path
+import hashlib
+import struct
+import os
+
+import numpy as np
+
+from gridvid.config import defaults, paths, video_settings
+
+# Header layout: magic string, followed by frames, height, width, channels, fps
+_magic = b'GRIDVID\x00'
+_header_format = '<8s5q'
+_header_size = 64
+
+def cache_path(source:Path) -> Path:
+    '''
+        Returns the path of the cache file belonging to the video file at
+        `source`.
+    '''
+    stat = source.stat()
+    key = f'{source.resolve()}|{stat.st_size:d}|{stat.st_mtime_ns:d}'
+    digest = hashlib.sha1(key.encode()).hexdigest()
+    return paths.temp_video_directory / (digest + defaults.cache_extension)
+
+def load(source:Path) -> Optional[Tuple[np.memmap, int]]:
+    '''
+        Returns a read-only memory map of the cached frames belonging to the
+        video file at `source`, along with its fps.  Returns None if the video
+        has not been cached.
+    '''
+    path = cache_path(source)
+    if not path.exists():
+        return None
+
+    with open(path, 'rb') as infile:
+        header = infile.read(_header_size)
+
+    if len(header) < _header_size:
+        return None
+
+    magic, *shape, fps = struct.unpack_from(_header_format, header)
+    if magic != _magic or shape[0] == 0:
+        return None
+
+    # Marks the cache file as recently used, for the eviction policy
+    os.utime(path)
+
+    data = np.memmap(
+        path, dtype = np.uint8, mode = 'r', offset = _header_size,
+        shape = tuple(shape)
+    )
+    return data, fps
+
+def store(source:Path, frames:Iterable[np.ndarray], fps:int) -> None:
+    '''
+        Writes each frame in `frames` to the cache file belonging to the video
+        file at `source`, one frame at a time, then evicts the least recently
+        used cache files if the cache has grown too large.
+    '''
+    path = cache_path(source)
+    temp_path = path.with_suffix('.tmp')
+    paths.ensure(path.parent)
+
+    count = 0
+    shape = (0, 0, 0)
+    try:
+        with open(temp_path, 'wb') as outfile:
+            outfile.write(bytes(_header_size))
+            for frame in frames:
+                outfile.write(np.ascontiguousarray(frame, np.uint8).data)
+                shape = frame.shape
+                count += 1
+
+            header = struct.pack(_header_format, _magic, count, *shape, fps)
+            outfile.seek(0)
+            outfile.write(header)
+
+        os.replace(temp_path, path)
+    finally:
+        if temp_path.exists():
+            os.remove(temp_path)
+
+    evict(keep = path)
+
+def evict(max_size:int = None, keep:Path = None) -> None:
+    '''
+        Removes the least recently used cache files until the total size of
+        the cache is at most `max_size` bytes.  The cache file at `keep`, if
+        given, is never removed.
+    '''
+    if max_size is None:
+        max_size = video_settings.cache_size
+
+    files = paths.temp_video_directory.glob('*' + defaults.cache_extension)
+    files = sorted(files, key = lambda f: f.stat().st_mtime)
+
+    total = sum(f.stat().st_size for f in files)
+    for f in files:
+        if total <= max_size:
+            break
+        if keep is not None and f == keep:
+            continue
+        total -= f.stat().st_size
+        os.remove(f)
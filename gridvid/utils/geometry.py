@@ -0,0 +1,122 @@
+'''
+    Grid geometry – computes which pixels are covered by the lines of a grid.
+'''
+from typing import Sequence, Tuple, Union
+
+import numpy as np
+
+Placement = Union[int, Sequence[int], Sequence[float], np.ndarray]
+
+def line_centers(length:int, placement:Placement) -> np.ndarray:
+    '''
+        Returns the exact positions of the centers of the grid lines along an
+        image axis of `length` pixels, in pixel coordinates, as a sorted array
+        of floats.  Positions are not rounded to whole pixels.
+
+        `placement` may be given as:
+
+            int               – the number of uniformly spaced lines, not
+                                including the two lines at the image
+                                boundaries, which are always added
+            sequence of int   – explicit pixel positions, in [0, length)
+            sequence of float – fractional positions, in [0, 1], where 0 and
+                                1 correspond to the image boundaries
+    '''
+    err_msg = (
+        'Functions in module `geometry` require that argument `placement` be '
+        '{}'
+    )
+
+    if isinstance(placement, (int, np.integer)):
+        if placement < 0:
+            msg = 'an integer greater than or equal to zero.'
+            raise ValueError(err_msg.format(msg))
+        return np.linspace(0, length-1, placement+2)
+
+    positions = np.asarray(placement)
+
+    if positions.ndim != 1:
+        raise ValueError(err_msg.format('a one-dimensional sequence.'))
+
+    if positions.size == 0:
+        return np.empty(0, dtype = np.float64)
+
+    if np.issubdtype(positions.dtype, np.integer):
+        if positions.min() < 0 or positions.max() >= length:
+            msg = f'a sequence of integers in the range [0, {length-1:d}].'
+            raise ValueError(err_msg.format(msg))
+        return np.unique(positions.astype(np.float64))
+
+    if np.issubdtype(positions.dtype, np.floating):
+        if positions.min() < 0 or positions.max() > 1:
+            raise ValueError(err_msg.format('a sequence of floats in [0, 1].'))
+        return np.unique(positions * (length-1))
+
+    msg = 'an integer, or a sequence of integers or floats.'
+    raise TypeError(err_msg.format(msg))
+
+def line_positions(length:int, placement:Placement) -> np.ndarray:
+    '''
+        Returns the pixel positions of the grid lines along an image axis of
+        `length` pixels, as a sorted array of integers.  See `line_centers`
+        for a description of `placement`.
+
+        Uniformly spaced lines are truncated to whole pixels, while explicit
+        and fractional positions are rounded to the nearest pixel.
+    '''
+    centers = line_centers(length, placement)
+    if isinstance(placement, (int, np.integer)):
+        return centers.astype(np.int64)
+    return np.unique(np.rint(centers).astype(np.int64))
+
+def line_bands(positions:np.ndarray, width:int, length:int) -> np.ndarray:
+    '''
+        Returns the sorted pixel indices covered by lines `width` pixels wide,
+        centered at `positions`, along an image axis of `length` pixels.
+
+        Each line is widened by alternately adding a pixel after and before
+        it, and pixels falling outside the image are clipped.
+    '''
+    k = np.arange(width)
+    offsets = (k + 1) // 2 * np.where(k % 2 == 1, 1, -1)
+
+    bands = (positions[:,None] + offsets[None,:]).ravel()
+    bands = bands[(bands >= 0) & (bands < length)]
+
+    return np.unique(bands)
+
+def grid_indices(
+rows:np.ndarray, cols:np.ndarray, frame_shape:Tuple[int]) -> Tuple[np.ndarray]:
+    '''
+        Returns the coordinates (row indices, column indices) of every pixel
+        covered by the given grid rows and columns, in a frame of shape
+        `frame_shape` (height, width).
+    '''
+    mask = np.zeros(frame_shape, dtype = bool)
+    mask[rows,:] = True
+    mask[:,cols] = True
+    return np.nonzero(mask)
+
+def line_coverage(centers:np.ndarray, width:float, length:int) -> np.ndarray:
+    '''
+        Returns the fraction of each pixel, along an image axis of `length`
+        pixels, which is covered by lines `width` pixels wide centered at the
+        (possibly fractional) pixel coordinates `centers`.
+
+        Pixel `i` spans the interval [i - 0.5, i + 0.5], such that lines which
+        do not fall on a pixel center partially cover their edge pixels, as
+        needed for anti-aliasing.
+    '''
+    pixels = np.arange(length, dtype = np.float64)
+    low = centers[:,None] - width / 2
+    high = centers[:,None] + width / 2
+
+    overlap = (
+        np.minimum(high, pixels[None,:] + 0.5) -
+        np.maximum(low, pixels[None,:] - 0.5)
+    )
+
+    if overlap.shape[0] == 0:
+        return np.zeros(length, dtype = np.float64)
+
+    return np.clip(overlap, 0, 1).max(axis = 0)
@@ -0,0 +1,107 @@
+'''
+    Tools for writing video frames to image files, encoding many frames in
+    parallel.
+'''
+from typing import Any, Dict, Iterable, List
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from pathlib import Path
+import os
+
+import numpy as np
+
+from gridvid.config import defaults
+
+# Image formats, by file extension, with the name of their compression setting
+_formats = {
+    '.png': ('PNG', 'compression'),
+    '.jpg': ('JPEG', 'quality'),
+    '.jpeg': ('JPEG', 'quality'),
+}
+
+def writer_params(
+extension:str, compression:int = None, quality:int = None) -> Dict[str,Any]:
+    '''
+        Returns the keyword arguments with which images with the file
+        extension `extension` are saved by Pillow.
+
+        `compression` is the zlib compression level of PNG images, in the
+        range [0, 9], where 0 is fastest and 9 gives the smallest files.
+        `quality` is the quality of JPEG images, in the range [1, 95].  Both
+        default to the values in `config/defaults.py`.
+    '''
+    err_msg = (
+        'Functions in module `images` require that argument `{}` be {}'
+    )
+
+    extension = extension.lower()
+    if extension not in _formats:
+        msg = f'one of the supported extensions: {", ".join(_formats)}.'
+        raise ValueError(err_msg.format('extension', msg))
+
+    if compression is None:
+        compression = defaults.image_compression
+
+    if quality is None:
+        quality = defaults.image_quality
+
+    if not isinstance(compression, int) or not 0 <= compression <= 9:
+        msg = 'an integer in the range [0, 9].'
+        raise ValueError(err_msg.format('compression', msg))
+
+    if not isinstance(quality, int) or not 1 <= quality <= 95:
+        msg = 'an integer in the range [1, 95].'
+        raise ValueError(err_msg.format('quality', msg))
+
+    name, setting = _formats[extension]
+    if setting == 'compression':
+        return {'format': name, 'compress_level': compression}
+    return {'format': name, 'quality': quality}
+
+def write_image(frame:np.ndarray, path:Path, **params) -> None:
+    '''
+        Writes `frame`, an array of shape (Video Height, Video Width, Color
+        Channels), to the image file at `path`.  Keyword arguments are those
+        returned by `writer_params`.
+    '''
+    from PIL import Image
+
+    if frame.ndim == 3 and frame.shape[2] == 1:
+        frame = frame[...,0]
+    Image.fromarray(np.ascontiguousarray(frame)).save(path, **params)
+
+def write_images(
+frames:Iterable[np.ndarray], paths:Iterable[Path], workers:int = None,
+**params) -> List[Path]:
+    '''
+        Writes each frame in `frames` to the corresponding path in `paths`,
+        encoding up to `workers` images at a time, and returns the paths.
+
+        Pillow releases the GIL while compressing images, so the frames are
+        encoded in a pool of threads.  Frames are consumed as the pool
+        finishes them, such that only a few frames are held in memory at a
+        time.  Keyword arguments are those returned by `writer_params`.
+    '''
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if not isinstance(workers, int) or workers <= 0:
+        msg = (
+            'Function `write_images` in module `images` requires that '
+            'argument `workers` be an integer greater than zero.'
+        )
+        raise ValueError(msg)
+
+    written = []
+    pending = deque()
+    with ThreadPoolExecutor(max_workers = workers) as executor:
+        for frame, path in zip(frames, paths):
+            pending.append(executor.submit(write_image, frame, path, **params))
+            written.append(path)
+            # Limiting the number of frames waiting to be encoded
+            if len(pending) >= 2 * workers:
+                pending.popleft().result()
+        while pending:
+            pending.popleft().result()
+
+    return written
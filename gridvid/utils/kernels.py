@@ -0,0 +1,218 @@
+'''
+    Compiled kernels for modifying video frames.  The kernels release the GIL,
+    such that they can run alongside decoding and encoding threads.
+
+    Each kernel is compiled for explicit signatures the first time it is
+    used, or by `warmup`, and the machine code is cached in
+    `paths.kernel_cache`, which is shared by every process.  Once the cache
+    has been populated (see `main.py --warmup`), new processes and batch
+    workers load the kernels instead of compiling them.  Importing this module
+    compiles nothing.
+
+    Only the kernels in this module are cached there: numba's own cache
+    settings, and the caches of other packages' functions, are left as they
+    are.  The cache relies on numba internals, so the kernels are compiled
+    without it if it cannot be set up, e.g. if the cache directory cannot be
+    created.
+'''
+from typing import Any, Callable, Dict, List
+import functools
+import threading
+
+from numba import njit, prange, types
+import numpy as np
+
+from gridvid.config import paths
+
+def _kernel_cache(py_func:Callable) -> Any:
+    '''
+        Private function which returns a numba function cache which places
+        the cache files of `py_func` in `paths.kernel_cache`.  Raises an
+        error if the cache cannot be created.
+    '''
+    from numba.core.caching import (
+        CompileResultCacheImpl, FunctionCache, _CacheLocator,
+        _SourceFileBackedLocatorMixin
+    )
+
+    class KernelCacheLocator(_SourceFileBackedLocatorMixin, _CacheLocator):
+        def __init__(self, py_func:Callable, py_file:str) -> None:
+            self._py_file = py_file
+            self._lineno = py_func.__code__.co_firstlineno
+            self._cache_path = str(
+                paths.kernel_cache / self.get_suitable_cache_subpath(py_file)
+            )
+
+        def get_cache_path(self) -> str:
+            return self._cache_path
+
+    class KernelCacheImpl(CompileResultCacheImpl):
+        _locator_classes = [KernelCacheLocator]
+
+    class KernelCache(FunctionCache):
+        _impl_class = KernelCacheImpl
+
+    return KernelCache(py_func)
+
+class _Kernel:
+    '''
+        Private wrapper of a kernel, which is compiled for its signatures
+        the first time it is called, see function `_kernel`.
+    '''
+
+    def __init__(
+    self, func:Callable, signatures:List, options:Dict[str,Any]) -> None:
+        functools.update_wrapper(self, func)
+        self.py_func = func
+        self._signatures = signatures
+        self._options = options
+        self._dispatcher = None
+        self._cached = False
+        self._lock = threading.Lock()
+
+    @property
+    def compiled(self) -> bool:
+        '''
+            Returns True if the kernel has been compiled or loaded from the
+            kernel cache in this process.
+        '''
+        return self._dispatcher is not None
+
+    @property
+    def signatures(self) -> List:
+        '''
+            Returns the signatures of the compiled kernel, compiling it first.
+        '''
+        return self.compile().signatures
+
+    @property
+    def stats(self) -> Any:
+        '''
+            Returns numba's cache statistics of the kernel, compiling it first.
+        '''
+        return self.compile().stats
+
+    def compile(self) -> Callable:
+        '''
+            Compiles the kernel for its signatures, or loads it from the
+            kernel cache, unless this was already done.  Returns the compiled
+            numba dispatcher.
+        '''
+        with self._lock:
+            if self._dispatcher is None:
+                dispatcher = njit(**self._options)(self.py_func)
+                try:
+                    dispatcher._cache = _kernel_cache(dispatcher.py_func)
+                    self._cached = True
+                except Exception:
+                    # Compiling the kernel without caching it
+                    pass
+                for signature in self._signatures:
+                    dispatcher.compile(signature)
+                dispatcher.disable_compile()
+                self._dispatcher = dispatcher
+        return self._dispatcher
+
+    def __call__(self, *args) -> Any:
+        return self.compile()(*args)
+
+def _kernel(signatures:List, **options) -> Callable:
+    '''
+        Private decorator which compiles a kernel like `njit(signatures,
+        cache = True, **options)`, but only once it is first used, and caches
+        it in `paths.kernel_cache` rather than in numba's cache directory.
+    '''
+    def decorator(func:Callable) -> _Kernel:
+        return _Kernel(func, signatures, options)
+    return decorator
+
+# Video frames, of shape (Number of frames, Height, Width, Color Channels);
+# contiguous frames are compiled separately, as they are faster to access
+_frames = (types.uint8[:,:,:,::1], types.uint8[:,:,:,:])
+
+@_kernel(
+    [(frames, types.int64[::1], types.int64[::1], types.uint8[::1])
+     for frames in _frames],
+    parallel = True, nogil = True
+)
+def set_grid(
+frames:np.ndarray, rows:np.ndarray, cols:np.ndarray,
+color:np.ndarray) -> np.ndarray:
+    '''
+        Replaces the pixels of `frames` at coordinates (`rows[i]`, `cols[i]`)
+        with the given RGB tuple `color`, in place.
+    '''
+    for frame in prange(frames.shape[0]):
+        for i in range(rows.shape[0]):
+            frames[frame,rows[i],cols[i]] = color
+
+    return frames
+
+@_kernel(
+    [(frames, types.int32[::1], types.int32[::1], types.uint8[::1])
+     for frames in _frames],
+    parallel = True, nogil = True
+)
+def blend_grid(
+frames:np.ndarray, row_weights:np.ndarray, col_weights:np.ndarray,
+color:np.ndarray) -> np.ndarray:
+    '''
+        Blends the given RGB tuple `color` into `frames`, in place, using
+        integer arithmetic.  Pixel (y, x) receives the opacity
+        max(`row_weights[y]`, `col_weights[x]`), in the range [0, 255].
+
+        Only rows and columns with nonzero weight are visited, such that the
+        cost scales with the number of pixels covered by the grid.
+    '''
+    rows = np.nonzero(row_weights)[0]
+    cols = np.nonzero(col_weights)[0]
+
+    for frame in prange(frames.shape[0]):
+        # Pixels on weighted rows, including their intersections with columns
+        for i in range(rows.shape[0]):
+            y = rows[i]
+            for x in range(frames.shape[2]):
+                alpha = max(row_weights[y], col_weights[x])
+                for c in range(frames.shape[3]):
+                    value = np.int32(frames[frame,y,x,c])
+                    frames[frame,y,x,c] = (
+                        value * (255 - alpha) + np.int32(color[c]) * alpha
+                        + 127
+                    ) // 255
+
+        # Remaining pixels on weighted columns
+        for y in range(frames.shape[1]):
+            if row_weights[y] != 0:
+                continue
+            for j in range(cols.shape[0]):
+                x = cols[j]
+                alpha = col_weights[x]
+                for c in range(frames.shape[3]):
+                    value = np.int32(frames[frame,y,x,c])
+                    frames[frame,y,x,c] = (
+                        value * (255 - alpha) + np.int32(color[c]) * alpha
+                        + 127
+                    ) // 255
+
+    return frames
+
+# Every kernel in this module, see `warmup`
+kernels = {'set_grid': set_grid, 'blend_grid': blend_grid}
+
+def is_cached(kernel:_Kernel) -> bool:
+    '''
+        Returns True if `kernel` was loaded from the kernel cache, or False if
+        it had to be compiled, or cannot be cached.  Loads or compiles the
+        kernel if this has not happened yet.
+    '''
+    stats = kernel.stats
+    if not kernel._cached:
+        return False
+    return sum(stats.cache_hits.values()) > 0 and not stats.cache_misses
+
+def warmup() -> Dict[str,bool]:
+    '''
+        Ensures that every kernel is compiled and stored in the kernel cache,
+        and returns whether each one (by name) was already cached beforehand.
+    '''
+    return {name:is_cached(kernel) for name, kernel in kernels.items()}
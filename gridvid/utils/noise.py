@@ -0,0 +1,83 @@
+'''
+    Tools for generating random noise frames in independent, reproducible
+    chunks, such that chunks can be generated in parallel or on demand.
+'''
+from typing import Iterator, Tuple
+from concurrent.futures import ThreadPoolExecutor
+import os
+
+import numpy as np
+
+from gridvid.config import defaults
+
+def chunk_seed(seed:int, chunk:int) -> np.random.SeedSequence:
+    '''
+        Returns the seed of chunk number `chunk` of the noise generated from
+        `seed`.  Each chunk has its own independent stream of random numbers,
+        such that any chunk can be generated without generating the others.
+    '''
+    return np.random.SeedSequence(seed, spawn_key = (chunk,))
+
+def noise_chunk(seed:np.random.SeedSequence, shape:Tuple[int]) -> np.ndarray:
+    '''
+        Returns an array of shape `shape` and dtype <np.uint8> filled with the
+        random bits of a PCG64 bit generator seeded with `seed`.
+
+        The raw 64-bit outputs of the bit generator are reinterpreted as
+        little-endian bytes, which is faster than drawing bounded integers,
+        and releases the GIL.  The byte order is fixed, such that a seed gives
+        the same noise on every platform; on little-endian platforms the
+        outputs are not copied.
+    '''
+    size = int(np.prod(shape))
+    bits = np.random.PCG64(seed).random_raw(-(-size // 8))
+    bits = bits.astype('<u8', copy = False)
+    return bits.view(np.uint8)[:size].reshape(shape)
+
+def generate(
+out:np.ndarray, seed:int, chunk_size:int = None,
+workers:int = None) -> np.ndarray:
+    '''
+        Fills `out`, an array of shape (Number of frames, Video Height, Video
+        Width, Color Channels) and dtype <np.uint8>, with noise generated from
+        `seed`, `chunk_size` frames at a time.  Returns `out`.
+
+        Chunks are generated by `workers` threads, defaulting to the number of
+        CPUs.  The result only depends on `seed` and `chunk_size`, and equals
+        the frames yielded by `stream`.
+    '''
+    if chunk_size is None:
+        chunk_size = defaults.chunk_size
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    def fill(chunk):
+        start = chunk * chunk_size
+        frames = out[start:start + chunk_size]
+        frames[...] = noise_chunk(chunk_seed(seed, chunk), frames.shape)
+
+    chunks = range(-(-len(out) // chunk_size))
+    with ThreadPoolExecutor(max_workers = workers) as executor:
+        for _ in executor.map(fill, chunks):
+            pass
+
+    return out
+
+def stream(
+frames:int, frame_shape:Tuple[int], seed:int,
+chunk_size:int = None) -> Iterator[np.ndarray]:
+    '''
+        Yields the noise generated from `seed` (see `generate`) as arrays of
+        up to `chunk_size` frames of shape `frame_shape` (Video Height, Video
+        Width, Color Channels), such that the noise is never held in memory
+        in its entirety.
+    '''
+    if chunk_size is None:
+        chunk_size = defaults.chunk_size
+
+    for chunk, start in enumerate(range(0, frames, chunk_size)):
+        count = min(chunk_size, frames - start)
+        yield noise_chunk(
+            chunk_seed(seed, chunk), (count,) + tuple(frame_shape)
+        )
@@ -0,0 +1,291 @@
+'''
+    Video input and output through raw pipes to the ffmpeg executable, which
+    bypasses imageio's per-frame wrapper.  Frames are read many at a time with
+    `readinto`, directly into numpy arrays, and written one chunk at a time
+    with a single `write` call.
+
+    Selected by setting `video_settings.encoder` to 'pipe', see
+    `config/video_settings.py`.
+'''
+from typing import IO, Iterator, List, Tuple
+from pathlib import Path
+import subprocess
+import functools
+import tempfile
+import re
+
+import numpy as np
+
+from gridvid.config import defaults
+from gridvid.utils import decoding
+
+# Growth factor of the output array when the metadata underestimates the
+# number of frames, see `read_into`
+_growth = 1.5
+
+def input_args(
+fps:float, first:int = 0, stop:int = None, stride:int = 1,
+output_params:List[str] = None) -> Tuple[List[str], List[str]]:
+    '''
+        Returns the ffmpeg input and output arguments which select every
+        `stride`-th frame from frame number `first` up to (but not including)
+        frame number `stop` of a video with the given fps, seeking directly to
+        `first`.  `output_params` may contain a single '-vf' filter chain,
+        see `utils/scaling.py`, to which the frame selection is added.
+    '''
+    input_params = []
+    if first > 0:
+        # Seeking half a frame early, such that rounding never skips `first`
+        input_params = ['-ss', f'{(first - 0.5) / fps:.6f}']
+
+    filters = []
+    params = list(output_params or [])
+    if '-vf' in params:
+        idx = params.index('-vf')
+        filters.append(params[idx + 1])
+        del params[idx:idx + 2]
+
+    if stride > 1:
+        # Passing the selected frames through as they are, rather than
+        # duplicating or dropping frames to keep the frame rate constant
+        filters.insert(0, f'select=not(mod(n\\,{stride:d}))')
+        params += _passthrough_params()
+
+    if filters:
+        params = ['-vf', ','.join(filters)] + params
+
+    if stop is not None:
+        params += ['-frames:v', str(max(0, -(-(stop - first) // stride)))]
+
+    return input_params, params
+
+def read_into(
+path:Path, frame_shape:Tuple[int, int, int], count:int,
+input_params:List[str] = None, output_params:List[str] = None) -> np.ndarray:
+    '''
+        Decodes the video file at `path` into an array of shape (Number of
+        frames, *`frame_shape`), where `frame_shape` is (Video Height, Video
+        Width, Color Channels) with one (gray) or three (rgb24) channels.
+
+        The array is allocated for `count` frames, and ffmpeg's output is read
+        directly into it with `readinto`, as many frames as fit at a time.  If
+        there are more frames, the array grows geometrically, and if there are
+        fewer it is shrunk in place once all frames are read.
+    '''
+    frame_bytes = int(np.prod(frame_shape))
+    capacity = max(count, 1)
+    data = np.empty((capacity,) + tuple(frame_shape), dtype = np.uint8)
+
+    process, stderr = _open(
+        path, frame_shape[2], input_params or [], output_params or []
+    )
+    filled = 0
+    finished = False
+    try:
+        while True:
+            if filled == capacity * frame_bytes:
+                # Only growing the array once another frame has arrived
+                spare = bytearray(frame_bytes)
+                size = process.stdout.readinto(spare)
+                if not size:
+                    finished = True
+                    break
+                capacity = max(capacity + 1, int(capacity * _growth))
+                data.resize((capacity,) + data.shape[1:], refcheck = False)
+                data.reshape(-1)[filled:filled + size] = np.frombuffer(
+                    spare, np.uint8, size
+                )
+                filled += size
+                continue
+            view = memoryview(data.reshape(-1))[filled:]
+            size = process.stdout.readinto(view)
+            view.release()
+            if not size:
+                finished = True
+                break
+            filled += size
+    finally:
+        _close(process, stderr, finished)
+
+    return decoding.trim(data, filled // frame_bytes)
+
+def read_chunks(
+path:Path, frame_shape:Tuple[int, int, int], chunk_size:int = None,
+input_params:List[str] = None,
+output_params:List[str] = None) -> Iterator[np.ndarray]:
+    '''
+        Decodes the video file at `path`, yielding up to `chunk_size` frames
+        at a time as an array of shape (Number of frames, *`frame_shape`),
+        see `read_into`.
+
+        The chunks are read into a single buffer which is reused for every
+        chunk, so each chunk must be consumed (or copied) before the next one
+        is requested.
+    '''
+    if chunk_size is None:
+        chunk_size = defaults.chunk_size
+
+    buffer = np.empty((chunk_size,) + tuple(frame_shape), dtype = np.uint8)
+    frame_bytes = int(np.prod(frame_shape))
+    view = memoryview(buffer.reshape(-1))
+
+    process, stderr = _open(
+        path, frame_shape[2], input_params or [], output_params or []
+    )
+    finished = False
+    try:
+        while not finished:
+            filled = 0
+            while filled < len(view):
+                size = process.stdout.readinto(view[filled:])
+                if not size:
+                    finished = True
+                    break
+                filled += size
+            frames = filled // frame_bytes
+            if frames > 0:
+                yield buffer[:frames]
+    finally:
+        _close(process, stderr, finished)
+
+class Writer:
+    '''
+        Encodes frames to a video file by writing them to the standard input
+        of an ffmpeg process as raw rgb24 or gray pixels.
+    '''
+
+    def __init__(
+    self, path:Path, fps:float, frame_shape:Tuple[int, int, int],
+    codec:str, pixelformat:str, ffmpeg_params:List[str] = None,
+    **kwargs) -> None:
+        '''
+            Starts an ffmpeg process which encodes frames of shape
+            `frame_shape` (Video Height, Video Width, Color Channels) to
+            `path`.  Accepts the keyword arguments returned by
+            `encoding.writer_params`.
+        '''
+        import imageio_ffmpeg
+
+        height, width, channels = frame_shape
+        command = [
+            imageio_ffmpeg.get_ffmpeg_exe(), '-y', '-v', 'error',
+            '-f', 'rawvideo', '-pix_fmt', _pixel_format(channels),
+            '-s', f'{width:d}x{height:d}', '-r', f'{fps}', '-i', '-',
+            '-an', '-c:v', codec, '-pix_fmt', pixelformat,
+        ] + list(ffmpeg_params or []) + [str(path)]
+
+        self._frame_shape = tuple(frame_shape)
+        self._stderr = tempfile.TemporaryFile()
+        self._process = subprocess.Popen(
+            command, stdin = subprocess.PIPE, stderr = self._stderr
+        )
+
+    def append_data(self, frames:np.ndarray) -> None:
+        '''
+            Encodes a single frame, or an array of frames, with a single
+            write to the ffmpeg process.
+        '''
+        if frames.shape[-3:] != self._frame_shape:
+            msg = (
+                f'Method `append_data` in class `Writer` requires frames of '
+                f'shape {self._frame_shape}, got {frames.shape[-3:]}.'
+            )
+            raise ValueError(msg)
+        try:
+            self._process.stdin.write(np.ascontiguousarray(frames).data)
+        except BrokenPipeError:
+            self.close()
+
+    def close(self) -> None:
+        '''
+            Finishes encoding, and raises RuntimeError if ffmpeg failed.
+        '''
+        if self._process.stdin.closed:
+            return
+        try:
+            self._process.stdin.close()
+        except BrokenPipeError:
+            pass
+        self._process.wait()
+        stderr = _read_stderr(self._stderr)
+        if self._process.returncode != 0:
+            msg = f'ffmpeg failed with the following output:\n{stderr}'
+            raise RuntimeError(msg)
+
+    def __enter__(self) -> 'Writer':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+def _pixel_format(channels:int) -> str:
+    '''
+        Private function which returns the raw pixel format of frames with
+        `channels` color channels.
+    '''
+    return 'gray' if channels == 1 else 'rgb24'
+
+def _open(
+path:Path, channels:int, input_params:List[str],
+output_params:List[str]) -> Tuple[subprocess.Popen, IO[bytes]]:
+    '''
+        Private function which starts an ffmpeg process decoding the video
+        file at `path` to raw frames on its standard output, and returns it
+        along with the temporary file to which its error output is written –
+        a pipe which is only read once ffmpeg exits would block it once full.
+    '''
+    import imageio_ffmpeg
+
+    command = (
+        [imageio_ffmpeg.get_ffmpeg_exe(), '-v', 'error', '-nostdin'] +
+        input_params + ['-i', str(path)] + output_params +
+        ['-map', '0:v:0', '-f', 'rawvideo', '-pix_fmt',
+         _pixel_format(channels), '-']
+    )
+    stderr = tempfile.TemporaryFile()
+    process = subprocess.Popen(
+        command, stdout = subprocess.PIPE, stderr = stderr, bufsize = 0
+    )
+    return process, stderr
+
+def _close(
+process:subprocess.Popen, stderr:IO[bytes], finished:bool) -> None:
+    '''
+        Private function which waits for a decoding ffmpeg process to exit
+        once its output has been read to the end, if `finished` is True, or
+        stops it if the reader stopped early.  Raises RuntimeError, with the
+        error output of ffmpeg, if ffmpeg failed although its output was read
+        to the end.
+    '''
+    process.stdout.close()
+    if not finished:
+        # Stopping ffmpeg, which may still be decoding frames nobody reads
+        process.kill()
+    process.wait()
+    stderr = _read_stderr(stderr)
+    if finished and process.returncode != 0:
+        msg = f'ffmpeg failed with the following output:\n{stderr}'
+        raise RuntimeError(msg)
+
+def _read_stderr(stderr:IO[bytes]) -> str:
+    '''
+        Private function which returns the contents of the temporary file
+        `stderr`, to which ffmpeg wrote its error output, and closes it.
+    '''
+    with stderr:
+        stderr.seek(0)
+        return stderr.read().decode(errors = 'replace')
+
+@functools.lru_cache(maxsize = None)
+def _passthrough_params() -> Tuple[str, str]:
+    '''
+        Private function which returns the ffmpeg output arguments which pass
+        frames through without duplicating or dropping any.  `-vsync` was
+        replaced by `-fps_mode` in ffmpeg 5.1.
+    '''
+    import imageio_ffmpeg
+
+    match = re.match(r'(\d+)\.(\d+)', imageio_ffmpeg.get_ffmpeg_version())
+    if match is not None and tuple(map(int, match.groups())) < (5, 1):
+        return ('-vsync', '0')
+    return ('-fps_mode', 'passthrough')
@@ -0,0 +1,179 @@
+'''
+    Instrumentation hooks which record the wall time, number of frames, bytes
+    and peak memory of each stage of a video operation, for the active
+    instances of class `Profiler`, and display the progress of stages run by
+    verbose videos.
+
+    Stages cost next to nothing while no profiler is active and the video is
+    not verbose, such that the hooks can be left in the hot paths.
+'''
+from typing import Any, Dict, Iterable, Iterator
+from contextlib import contextmanager
+import threading
+import tracemalloc
+import time
+import sys
+
+# Active profilers, see class `Profiler`
+_profilers = []
+
+# Stages currently measuring peak memory, shared by all threads as the traced
+# memory belongs to the whole process
+_memory_stack = []
+_memory_lock = threading.Lock()
+
+# Minimum number of seconds between two progress updates
+_progress_interval = 0.1
+
+class Stage:
+    '''
+        A single run of a stage, which accumulates the number of frames and
+        bytes it processes, see function `stage`.
+    '''
+
+    def __init__(
+    self, name:str, verbose:bool, frames:int, nbytes:int) -> None:
+        self.name = name
+        self.verbose = verbose
+        self.frames = frames
+        self.bytes = nbytes
+        self.start = time.perf_counter()
+        self.memory = None
+        self._shown = self.start
+        self._lock = threading.Lock()
+
+    def advance(self, frames:int = 0, nbytes:int = 0) -> None:
+        '''
+            Adds `frames` and `nbytes` to the totals of the stage, and updates
+            the progress display if the stage is verbose.  May be called from
+            several threads at once.
+        '''
+        with self._lock:
+            self.frames += frames
+            self.bytes += nbytes
+        if self.verbose:
+            now = time.perf_counter()
+            if now - self._shown >= _progress_interval:
+                self._shown = now
+                self._show(now, end = '\r')
+
+    def record(self, end:float) -> Dict[str,Any]:
+        '''
+            Returns the measurements of the stage, which finished at `end`.
+        '''
+        return {
+            'name': self.name,
+            'start': self.start,
+            'seconds': end - self.start,
+            'frames': self.frames,
+            'bytes': self.bytes,
+            'memory': self.memory,
+            'thread': threading.get_ident(),
+        }
+
+    def _show(self, now:float, end:str = '\n') -> None:
+        '''
+            Prints a single line containing the progress and throughput of the
+            stage.
+        '''
+        seconds = now - self.start
+        line = f'{self.name}: {self.frames:d} frames in {seconds:.2f}s'
+        if seconds > 0 and self.frames > 0:
+            line += f' ({self.frames / seconds:.1f} fps'
+            line += f', {self.bytes / seconds / 1024**2:.1f} MB/s)'
+        sys.stdout.write(line + end)
+        sys.stdout.flush()
+
+class _NullStage:
+    '''
+        Stage which records nothing, used while no profiler is active.
+    '''
+
+    def advance(self, frames:int = 0, nbytes:int = 0) -> None:
+        pass
+
+_null_stage = _NullStage()
+
+@contextmanager
+def stage(
+name:str, verbose:bool = False, frames:int = 0,
+nbytes:int = 0) -> Iterator[Stage]:
+    '''
+        Measures the code run within the context as the stage `name`, which
+        processes `frames` frames and `nbytes` bytes, plus those added through
+        method `advance` of the yielded stage.
+
+        The measurements are passed to every active profiler.  If `verbose`
+        is True, the progress of the stage is displayed while it runs, and its
+        throughput once it finishes.
+    '''
+    if not _profilers and not verbose:
+        yield _null_stage
+        return
+
+    current = Stage(name, verbose, frames, nbytes)
+    tracing = tracemalloc.is_tracing()
+    if tracing:
+        _enter_memory(current)
+    try:
+        yield current
+    finally:
+        if tracing:
+            _exit_memory(current)
+        end = time.perf_counter()
+        if verbose:
+            current._show(end)
+        record = current.record(end)
+        for profiler in list(_profilers):
+            profiler._add(record)
+
+def counted(frames:Iterable, current:Stage) -> Iterator:
+    '''
+        Yields each frame in `frames`, adding it to the totals of the stage
+        `current` as it is yielded.  Arrays of frames, of shape (Number of
+        frames, Video Height, Video Width, Color Channels), count as their
+        number of frames.
+    '''
+    for frame in frames:
+        current.advance(len(frame) if frame.ndim == 4 else 1, frame.nbytes)
+        yield frame
+
+def activate(profiler) -> None:
+    '''
+        Passes the measurements of every stage to `profiler`, until it is
+        deactivated.
+    '''
+    _profilers.append(profiler)
+
+def deactivate(profiler) -> None:
+    '''
+        Stops passing measurements to `profiler`.
+    '''
+    _profilers.remove(profiler)
+
+def _enter_memory(current:Stage) -> None:
+    '''
+        Private function which starts measuring the peak memory of `current`,
+        without losing the peak memory of the enclosing stages.
+    '''
+    with _memory_lock:
+        size, peak = tracemalloc.get_traced_memory()
+        for entry in _memory_stack:
+            entry[2] = max(entry[2], peak)
+        tracemalloc.reset_peak()
+        _memory_stack.append([current, size, size])
+
+def _exit_memory(current:Stage) -> None:
+    '''
+        Private function which stores the peak memory allocated during
+        `current`, in bytes, relative to the memory allocated when it started.
+    '''
+    with _memory_lock:
+        size, peak = tracemalloc.get_traced_memory()
+        for entry in _memory_stack:
+            entry[2] = max(entry[2], peak)
+        for n, (entry_stage, start, entry_peak) in enumerate(_memory_stack):
+            if entry_stage is current:
+                current.memory = entry_peak - start
+                del _memory_stack[n]
+                break
@@ -0,0 +1,307 @@
+'''
+    Content-addressed cache of rendered videos, which lets `Video.save` and
+    `batch.process_directory` skip jobs which have already been run.
+
+    Each job is identified by a key, computed from a hash of the contents of
+    its source video file and the canonicalized arguments of the job – its
+    grids, segment and encoder settings.  The output of every job is copied
+    into the cache directory under its key, and a later job with the same
+    key copies that output to its own destination instead of decoding and
+    encoding the video again.  Cached outputs are read-only, and never share
+    their storage with the outputs, such that editing an output in place
+    leaves the cache intact.
+
+    The manifest in the cache directory, `paths.render_cache`, records the
+    size, hash and last use of each cached output.  Cached outputs are only
+    reused while their contents match their hash, and the least recently used
+    outputs are evicted once their total size exceeds
+    `video_settings.render_cache_size`.  The hashes of the source files are
+    kept in the manifest as well, and only recomputed once a file's size or
+    modification time changes.
+'''
+from typing import Any, Dict, Iterator, Optional, Tuple
+from contextlib import contextmanager
+from pathlib import Path
+import hashlib
+import json
+import time
+import os
+
+import numpy as np
+
+from gridvid.config import paths, video_settings
+
+# Files in the cache directory which are not cached outputs
+_manifest_name = 'manifest.json'
+_lock_name = 'manifest.lock'
+
+# Number of bytes of a source file hashed at a time
+_block_size = 1024**2
+
+# Changing the version invalidates every existing key
+_version = 2
+
+def source_digest(source:Path) -> str:
+    '''
+        Returns a hash of the contents of the file at `source`.  The hash is
+        stored in the manifest, and only recomputed if the size or
+        modification time of the file has changed.
+    '''
+    source = Path(source).resolve()
+    stat = source.stat()
+    signature = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+    with _manifest() as manifest:
+        known = manifest['sources'].get(str(source))
+    if known is not None and known['signature'] == signature:
+        return known['digest']
+
+    # Hashing outside of the manifest lock, such that other processes are not
+    # kept waiting
+    digest = hashlib.blake2b(digest_size = 20)
+    with open(source, 'rb') as infile:
+        for block in iter(lambda: infile.read(_block_size), b''):
+            digest.update(block)
+    digest = digest.hexdigest()
+
+    with _manifest() as manifest:
+        manifest['sources'][str(source)] = {
+            'signature': signature, 'digest': digest
+        }
+    return digest
+
+def key(source:Path, **args) -> str:
+    '''
+        Returns the key of a job which renders the video file at `source`
+        with the arguments given as keyword arguments.  Arguments may be
+        nested tuples, lists and dicts of numbers, strings, paths and arrays,
+        and are canonicalized such that equal arguments give equal keys.
+    '''
+    contents = json.dumps(
+        {
+            'version': _version,
+            'source': source_digest(source),
+            'args': _canonical(args),
+        },
+        sort_keys = True, separators = (',', ':')
+    )
+    return hashlib.blake2b(contents.encode(), digest_size = 20).hexdigest()
+
+def fetch(job:str, destination:Path) -> Optional[Dict[str,Any]]:
+    '''
+        Copies the cached output of the job with key `job` to `destination`,
+        and returns its manifest entry, including any information stored
+        along with it (see `store`).  Returns None if the output is not
+        cached, or if it was removed or modified since it was stored.
+    '''
+    with _manifest() as manifest:
+        entry = manifest['entries'].get(job)
+        if entry is None:
+            return None
+
+        cached = paths.render_cache / entry['file']
+        paths.ensure(destination.parent)
+        try:
+            digest = _copy(cached, destination, entry['digest'])
+        except OSError:
+            digest = None
+
+        if digest is None:
+            # The cached output was removed or modified
+            del manifest['entries'][job]
+            _remove(cached)
+            return None
+
+        entry['used'] = time.time()
+        entry['hits'] += 1
+        return dict(entry)
+
+def store(job:str, output:Path, **info) -> None:
+    '''
+        Copies `output`, the output of the job with key `job`, into the
+        cache as a read-only file, along with the information given as
+        keyword arguments (e.g. the number of frames), then evicts the least
+        recently used outputs if the cache has grown too large.
+    '''
+    now = time.time()
+    cached = paths.ensure(paths.render_cache) / (job + output.suffix)
+
+    with _manifest() as manifest:
+        _remove(cached)
+        digest = _copy(output, cached)
+        os.chmod(cached, 0o444)
+        manifest['entries'][job] = dict(
+            info, file = cached.name, size = cached.stat().st_size,
+            digest = digest, created = now, used = now, hits = 0
+        )
+        _evict(manifest, video_settings.render_cache_size, keep = job)
+
+def stats() -> Dict[str,Any]:
+    '''
+        Returns the number of cached outputs, their total size in bytes, the
+        maximum size of the cache, the number of times cached outputs have
+        been reused, and the number of source files with a known hash.
+    '''
+    with _manifest() as manifest:
+        entries = manifest['entries'].values()
+        return {
+            'directory': paths.render_cache,
+            'entries': len(entries),
+            'size': sum(entry['size'] for entry in entries),
+            'max_size': video_settings.render_cache_size,
+            'hits': sum(entry['hits'] for entry in entries),
+            'sources': len(manifest['sources']),
+        }
+
+def prune(max_size:int = None) -> Dict[str,int]:
+    '''
+        Removes cached outputs which were removed or overwritten, files in the
+        cache directory which are not in the manifest, and the hashes of
+        source files which no longer exist.  Then evicts the least recently
+        used outputs until their total size is at most `max_size` bytes,
+        which defaults to `video_settings.render_cache_size`.
+
+        Returns the number of outputs removed, and the number of bytes freed.
+    '''
+    if max_size is None:
+        max_size = video_settings.render_cache_size
+
+    removed = 0
+    freed = 0
+    with _manifest() as manifest:
+        for job, entry in list(manifest['entries'].items()):
+            cached = paths.render_cache / entry['file']
+            if not cached.exists() or cached.stat().st_size != entry['size']:
+                del manifest['entries'][job]
+                removed += 1
+
+        files = {entry['file'] for entry in manifest['entries'].values()}
+        if paths.render_cache.exists():
+            for f in paths.render_cache.iterdir():
+                if f.name in files or f.name in (_manifest_name, _lock_name):
+                    continue
+                freed += f.stat().st_size
+                _remove(f)
+                removed += 1
+
+        for source in list(manifest['sources']):
+            if not Path(source).exists():
+                del manifest['sources'][source]
+
+        count, size = _evict(manifest, max_size)
+
+    return {'entries': removed + count, 'bytes': freed + size}
+
+@contextmanager
+def _manifest() -> Iterator[Dict[str,Any]]:
+    '''
+        Private context manager which yields the manifest, and writes it back
+        once the context exits without an error.  The manifest is locked
+        while in use, such that concurrent processes never overwrite each
+        other's changes.
+    '''
+    paths.ensure(paths.render_cache)
+    path = paths.render_cache / _manifest_name
+
+    with open(paths.render_cache / _lock_name, 'w') as lock:
+        try:
+            import fcntl
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        except ImportError:
+            # Not supported on Windows, where the manifest is not locked
+            pass
+
+        manifest = {'version': _version, 'entries': {}, 'sources': {}}
+        try:
+            contents = json.loads(path.read_text())
+            if contents.get('version') == _version:
+                manifest = contents
+        except (OSError, ValueError):
+            pass
+
+        yield manifest
+
+        temp_path = path.with_suffix('.tmp')
+        temp_path.write_text(json.dumps(manifest))
+        os.replace(temp_path, path)
+
+def _evict(
+manifest:Dict[str,Any], max_size:int, keep:str = None) -> Tuple[int, int]:
+    '''
+        Private function which removes the least recently used outputs in
+        `manifest` until their total size is at most `max_size` bytes.  The
+        output of the job with key `keep`, if given, is never removed.
+
+        Returns the number of outputs removed, and their total size in bytes.
+    '''
+    entries = manifest['entries']
+    total = sum(entry['size'] for entry in entries.values())
+
+    removed = 0
+    size = 0
+    for job in sorted(entries, key = lambda job: entries[job]['used']):
+        if total <= max_size:
+            break
+        if job == keep:
+            continue
+        entry = entries.pop(job)
+        _remove(paths.render_cache / entry['file'])
+        total -= entry['size']
+        removed += 1
+        size += entry['size']
+
+    return removed, size
+
+def _copy(
+source:Path, destination:Path, digest:str = None) -> Optional[str]:
+    '''
+        Private function which replaces `destination` with a copy of
+        `source`, hashing its contents as they are copied, and returns their
+        hash.  If `digest` is given and the contents do not match it,
+        `destination` is left untouched and None is returned.
+    '''
+    temp_path = destination.with_name('.' + destination.name + '.copy')
+    copied = hashlib.blake2b(digest_size = 20)
+    try:
+        with open(source, 'rb') as infile, open(temp_path, 'wb') as outfile:
+            for block in iter(lambda: infile.read(_block_size), b''):
+                copied.update(block)
+                outfile.write(block)
+        copied = copied.hexdigest()
+        if digest is not None and copied != digest:
+            return None
+        os.replace(temp_path, destination)
+        return copied
+    finally:
+        if temp_path.exists():
+            os.remove(temp_path)
+
+def _remove(path:Path) -> None:
+    '''
+        Private function which removes the file at `path` if it exists, even
+        if it is read-only, as cached outputs are.
+    '''
+    if path.exists():
+        os.chmod(path, 0o644)
+        os.remove(path)
+
+def _canonical(value:Any) -> Any:
+    '''
+        Private function which converts `value` into an equivalent value
+        consisting only of JSON types.
+    '''
+    if isinstance(value, dict):
+        return {str(k):_canonical(v) for k,v in value.items()}
+    if isinstance(value, (tuple, list, np.ndarray)):
+        return [_canonical(v) for v in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, Path):
+        return str(value)
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    msg = (
+        f'Function `key` in module `rendercache` cannot canonicalize '
+        f'arguments of {type(value)}.'
+    )
+    raise TypeError(msg)
@@ -0,0 +1,166 @@
+'''
+    Tools for cropping and downscaling video frames – either while decoding,
+    through ffmpeg filters, or afterwards, through vectorized resampling – and
+    for placing grids on frames which have been cropped or downscaled.
+'''
+from typing import List, Tuple, Union
+
+import numpy as np
+
+from gridvid.utils import geometry
+
+# Crop rectangle, as (top, left, height, width) in source pixels
+Crop = Tuple[int, int, int, int]
+
+# Output size, as (height, width) in pixels, or as a scale factor
+Size = Union[Tuple[int, int], float]
+
+# Source frame shape (height, width), crop rectangle and output shape
+Region = Tuple[Tuple[int, int], Crop, Tuple[int, int]]
+
+def region(
+source_shape:Tuple[int, int], size:Size = None, crop:Crop = None) -> Region:
+    '''
+        Returns the region of frames of shape `source_shape` (height, width)
+        selected by the crop rectangle `crop`, scaled to `size`, as a tuple
+        (source shape, crop rectangle, output shape).
+
+        `crop` defaults to the entire frame.  `size` may be given as a tuple
+        (height, width), or as a factor in (0, 1] by which the crop rectangle
+        is scaled, and defaults to the size of the crop rectangle.
+    '''
+    err_msg = (
+        'Functions in module `scaling` require that argument `{}` be {}'
+    )
+
+    height, width = source_shape
+
+    if crop is None:
+        crop = (0, 0, height, width)
+
+    if (not isinstance(crop, tuple) or len(crop) != 4 or
+        not all(isinstance(value, int) for value in crop)):
+        msg = 'a four-tuple of integers (top, left, height, width).'
+        raise TypeError(err_msg.format('crop', msg))
+
+    top, left, crop_height, crop_width = crop
+    if (top < 0 or left < 0 or crop_height <= 0 or crop_width <= 0 or
+        top + crop_height > height or left + crop_width > width):
+        msg = f'a rectangle within the frame of shape {source_shape}.'
+        raise ValueError(err_msg.format('crop', msg))
+
+    if size is None:
+        size = 1.0
+
+    if isinstance(size, (int, float)) and not isinstance(size, bool):
+        if not 0 < size <= 1:
+            msg = 'a scale factor in the range (0, 1].'
+            raise ValueError(err_msg.format('size', msg))
+        shape = (
+            max(1, int(round(crop_height * size))),
+            max(1, int(round(crop_width * size))),
+        )
+    elif (isinstance(size, tuple) and len(size) == 2 and
+          all(isinstance(value, int) and value > 0 for value in size)):
+        shape = size
+    else:
+        msg = 'a scale factor, or a two-tuple of positive integers.'
+        raise TypeError(err_msg.format('size', msg))
+
+    return (height, width), crop, shape
+
+def is_identity(region:Region) -> bool:
+    '''
+        Returns True if `region` selects the entire frame at full size.
+    '''
+    source_shape, crop, shape = region
+    return crop == (0, 0) + source_shape and shape == source_shape
+
+def ffmpeg_params(region:Region) -> List[str]:
+    '''
+        Returns the ffmpeg output parameters which crop and scale the decoded
+        frames to `region`, such that frames are only ever decoded into
+        memory at their final size.
+    '''
+    source_shape, (top, left, height, width), shape = region
+
+    filters = []
+    if (top, left, height, width) != (0, 0) + source_shape:
+        filters.append(f'crop={width:d}:{height:d}:{left:d}:{top:d}')
+    if shape != (height, width):
+        filters.append(f'scale={shape[1]:d}:{shape[0]:d}:flags=area')
+
+    if not filters:
+        return []
+    return ['-vf', ','.join(filters)]
+
+def resize(frames:np.ndarray, region:Region) -> np.ndarray:
+    '''
+        Crops and scales `frames`, an array of shape (Number of frames, Video
+        Height, Video Width, Color Channels), to `region`.
+
+        Cropping is a view of `frames`.  If the crop rectangle is an exact
+        multiple of the output shape, each output pixel is the mean of the
+        block of pixels it covers; otherwise, the nearest pixel is taken.
+    '''
+    source_shape, (top, left, height, width), shape = region
+    frames = frames[:,top:top + height,left:left + width]
+
+    if shape == (height, width):
+        return frames
+
+    if height % shape[0] == 0 and width % shape[1] == 0:
+        fy, fx = height // shape[0], width // shape[1]
+        blocks = frames.reshape(
+            frames.shape[0], shape[0], fy, shape[1], fx, frames.shape[3]
+        )
+        total = blocks.sum(axis = (2, 4), dtype = np.uint32)
+        return ((total + fy * fx // 2) // (fy * fx)).astype(np.uint8)
+
+    rows = ((np.arange(shape[0]) + 0.5) * height / shape[0]).astype(np.int64)
+    cols = ((np.arange(shape[1]) + 0.5) * width / shape[1]).astype(np.int64)
+    return frames[:,rows[:,None],cols[None,:]]
+
+def grid_placement(
+region:Region, shape:Tuple[geometry.Placement, geometry.Placement],
+width:int, antialias:bool = False) -> Tuple[Tuple, int]:
+    '''
+        Converts a grid placement (see class `GridSpec`) given for the entire
+        source frame into one for frames cropped and scaled to `region`, such
+        that the grid lines fall on the same source pixels at any scale.
+        Returns the placement and the scaled line width.
+
+        Lines are placed at their exact scaled positions (as fractions of the
+        frame size) if `antialias` is True, and at the nearest pixel
+        otherwise.  Lines outside the crop rectangle are omitted.
+    '''
+    source_shape, crop, output_shape = region
+
+    placement = []
+    scales = []
+    for axis in range(2):
+        length = source_shape[axis]
+        offset, size = crop[axis], crop[axis + 2]
+        scale = output_shape[axis] / size
+        scales.append(scale)
+
+        if antialias:
+            centers = geometry.line_centers(length, shape[axis])
+        else:
+            centers = geometry.line_positions(length, shape[axis])
+
+        # Mapping pixel centers from source to output coordinates
+        centers = (centers - offset + 0.5) * scale - 0.5
+        visible = (centers >= -0.5) & (centers <= output_shape[axis] - 0.5)
+        centers = centers[visible]
+        centers = np.clip(centers, 0, output_shape[axis] - 1)
+
+        if antialias:
+            fractions = centers / max(output_shape[axis] - 1, 1)
+            placement.append(tuple(float(f) for f in fractions))
+        else:
+            pixels = np.unique(np.rint(centers).astype(np.int64))
+            placement.append(tuple(int(p) for p in pixels))
+
+    width = max(1, int(round(width * min(scales))))
+    return tuple(placement), width
@@ -0,0 +1,398 @@
+'''
+    Tools for working with segments of video files – converting frame numbers
+    and timestamps into frame ranges, decoding only the frames in a range,
+    splicing a re-encoded segment back into the original file, and joining
+    segments encoded separately into a single file.
+'''
+from typing import Dict, Iterator, List, Tuple, Union
+from pathlib import Path
+import subprocess
+import itertools
+import re
+
+import numpy as np
+
+from gridvid.config import paths
+from gridvid.utils import encoding
+from gridvid.utils.creators import create_unique_name
+
+Position = Union[int, float, str]
+
+def parse_timestamp(timestamp:str) -> float:
+    '''
+        Converts a timestamp of the form 'HH:MM:SS.sss', 'MM:SS.sss' or
+        'SS.sss' into a number of seconds.
+    '''
+    err_msg = (
+        'Function `parse_timestamp` in module `segments` requires that '
+        f'argument `timestamp` be of the form \'HH:MM:SS.sss\', got '
+        f'\'{timestamp}\'.'
+    )
+
+    fields = timestamp.strip().split(':')
+    if len(fields) > 3:
+        raise ValueError(err_msg)
+
+    seconds = 0.0
+    try:
+        for field in fields:
+            value = float(field)
+            if value < 0:
+                raise ValueError(err_msg)
+            seconds = seconds * 60 + value
+    except ValueError:
+        raise ValueError(err_msg)
+
+    return seconds
+
+def frame_index(position:Position, fps:float) -> int:
+    '''
+        Converts `position` into a frame number, given the fps of the video.
+
+        `position` may be given as:
+
+            int   – a frame number
+            float – a time in seconds
+            str   – a timestamp, see `parse_timestamp`
+    '''
+    err_msg = (
+        'Functions in module `segments` require that a frame position be {}'
+    )
+
+    if isinstance(position, (int, np.integer)):
+        if position < 0:
+            msg = 'an integer greater than or equal to zero.'
+            raise ValueError(err_msg.format(msg))
+        return int(position)
+
+    if isinstance(position, str):
+        position = parse_timestamp(position)
+
+    if isinstance(position, (float, np.floating)):
+        if position < 0:
+            msg = 'a number of seconds greater than or equal to zero.'
+            raise ValueError(err_msg.format(msg))
+        return int(round(position * fps))
+
+    msg = 'an int (frame), a float (seconds) or a str (timestamp).'
+    raise TypeError(err_msg.format(msg))
+
+def frame_range(
+start:Position, end:Position, stride:int, fps:float,
+length:int = None) -> Tuple[int, int, int]:
+    '''
+        Returns the frames selected by `start`, `end` and `stride` as a tuple
+        (first frame, stop frame, stride), where the stop frame is excluded.
+        See `frame_index` for the accepted positions.  If `end` is None, the
+        stop frame is `length`, which is None if the length is unknown.
+    '''
+    err_msg = (
+        'Functions in module `segments` require that argument `{}` be {}'
+    )
+
+    if start is None:
+        start = 0
+
+    if stride is None:
+        stride = 1
+
+    if not isinstance(stride, int) or stride <= 0:
+        msg = 'an integer greater than zero.'
+        raise ValueError(err_msg.format('stride', msg))
+
+    first = frame_index(start, fps)
+    stop = length if end is None else frame_index(end, fps)
+
+    if length is not None:
+        first = min(first, length)
+        stop = min(stop, length)
+
+    if stop is not None and stop < first:
+        msg = 'a position after argument `start`.'
+        raise ValueError(err_msg.format('end', msg))
+
+    return first, stop, stride
+
+def read_frames(
+path:Path, fps:float, first:int = 0, stop:int = None, stride:int = 1,
+output_params:List[str] = None,
+grayscale:bool = False) -> Iterator[np.ndarray]:
+    '''
+        Yields every `stride`-th frame of the video file at `path`, from frame
+        number `first` up to (but not including) frame number `stop`, or until
+        the end of the file if `stop` is None.
+
+        The decoder seeks directly to `first` rather than decoding every frame
+        before it, and is closed as soon as `stop` is reached.  If given,
+        `output_params` are passed to ffmpeg, e.g. to crop or scale the frames
+        (see `utils/scaling.py`).
+
+        Frames are arrays of shape (Video Height, Video Width, 3), or (Video
+        Height, Video Width, 1) if `grayscale` is True, in which case ffmpeg
+        outputs the luminance of the frames directly.
+    '''
+    import imageio_ffmpeg
+
+    input_params = []
+    if first > 0:
+        # Seeking half a frame early, such that rounding never skips `first`
+        input_params = ['-ss', f'{(first - 0.5) / fps:.6f}']
+
+    channels = 1 if grayscale else 3
+    reader = imageio_ffmpeg.read_frames(
+        str(path), pix_fmt = 'gray' if grayscale else 'rgb24',
+        bits_per_pixel = 8 * channels, input_params = input_params,
+        output_params = output_params
+    )
+    try:
+        width, height = next(reader)['size']
+        idx = first
+        for frame in reader:
+            if stop is not None and idx >= stop:
+                break
+            if (idx - first) % stride == 0:
+                yield np.frombuffer(frame, np.uint8).reshape(
+                    height, width, channels
+                )
+            idx += 1
+    finally:
+        reader.close()
+
+def keyframes(path:Path) -> Tuple[np.ndarray, int]:
+    '''
+        Returns the frame numbers of the keyframes of the video file at
+        `path`, along with its total number of frames.
+
+        Only the container is read, no frames are decoded: the keyframes are
+        found from the flags and timestamps of the packets of the video
+        stream, listed by ffmpeg's `framecrc` muxer.
+    '''
+    lines = _ffmpeg(
+        '-i', str(path), '-map', '0:v:0', '-c', 'copy', '-f', 'framecrc', '-'
+    ).splitlines()
+
+    pts = []
+    key = []
+    for line in lines:
+        if line.startswith('#'):
+            continue
+        fields = [field.strip() for field in line.split(',')]
+        if len(fields) < 6:
+            continue
+        # Packet flags are only listed if they differ from a lone keyframe
+        flags = 1
+        for field in fields[6:]:
+            if field.startswith('F='):
+                flags = int(field[2:], 16)
+        pts.append(int(fields[2]))
+        key.append(bool(flags & 1))
+
+    # Frame numbers follow the presentation order of the packets
+    order = np.argsort(pts, kind = 'stable')
+    frames = np.empty(len(pts), dtype = np.int64)
+    frames[order] = np.arange(len(pts))
+
+    return frames[np.array(key, dtype = bool)], len(pts)
+
+def stream_format(path:Path) -> Dict[str,str]:
+    '''
+        Returns the format of the video stream of the video file at `path`:
+        its codec, profile, codec tag, pixel format, size, frame rate and time
+        base, and the size and checksum of its extradata (the codec's global
+        headers, e.g. the H.264 parameter sets which hold the level).
+
+        Streams are only joined without re-encoding if their formats are
+        equal.  Only the container and the first packet are read.
+    '''
+    output = _ffmpeg(
+        '-v', 'info', '-i', str(path), '-map', '0:v:0', '-c', 'copy',
+        '-frames:v', '1', '-f', 'framecrc', '-', stderr = True
+    )
+
+    # Stream parameters listed by the framecrc muxer
+    headers = dict(re.findall(r'^#(\w+) 0:\s*(.*?)\s*$', output, re.M))
+
+    # Stream parameters listed by ffmpeg for the input file, e.g.
+    # 'Video: h264 (High) (avc1 / 0x31637661), yuv420p(tv, ...), 64x64, ...'
+    stream = re.search(r'Stream #0:\d+.*?: Video: (.*)', output).group(1)
+    codec = re.match(r'(\w+)(?: \(([^)]*)\))?(?: \(([^)]*)\))?', stream)
+    fields = re.split(r',\s*(?![^()]*\))', stream)
+    tbr = re.search(r'([\d.k]+) tbr', stream)
+
+    return {
+        'codec': headers.get('codec_id', codec.group(1)),
+        'profile': codec.group(2) or '',
+        'codec tag': codec.group(3) or '',
+        'pixel format': fields[1].split('(')[0].strip(),
+        'size': headers.get('dimensions', ''),
+        'frame rate': tbr.group(1) if tbr else '',
+        'time base': headers.get('tb', ''),
+        'extradata': headers.get('extradata', ''),
+    }
+
+def splice(
+source:Path, destination:Path, first:int, stop:int,
+segment:Iterator[np.ndarray], temp_directory:Path, **params) -> None:
+    '''
+        Writes a copy of the video file at `source` to `destination`, in which
+        frames [`first`, `stop`) are replaced by the frames of `segment`.
+
+        Only the groups of pictures which overlap the segment are re-encoded,
+        from the last keyframe at or before `first` to the first keyframe at
+        or after `stop`.  The rest of the video stream is copied without being
+        decoded, such that the cost scales with the length of the segment.
+        Keyword arguments are passed to `imageio.get_writer`.
+
+        The re-encoded frames are concatenated with the copied parts of the
+        source, so they must be encoded in the stream format of the source
+        (see `stream_format`), and the source's groups of pictures must be
+        closed (as is the default for x264).  Before any frames are decoded,
+        a single frame is encoded with the given settings, and ValueError is
+        raised if its format does not match the source.  Only the video
+        stream is kept.
+    '''
+    import imageio
+
+    with imageio.get_reader(source, 'ffmpeg') as reader:
+        metadata = reader.get_meta_data()
+        fps = metadata['fps']
+        width, height = metadata['source_size']
+
+    name = create_unique_name(prefix = 'splice')
+    paths.ensure(temp_directory)
+    middle = temp_directory / (name + source.suffix)
+    pattern = temp_directory / (name + '_%03d' + source.suffix)
+    probe = temp_directory / (name + '_probe' + source.suffix)
+
+    # Copying streams of different formats into one file would corrupt it
+    try:
+        with imageio.get_writer(probe, fps = fps, **params) as writer:
+            writer.append_data(np.zeros((height, width, 3), dtype = np.uint8))
+        expected = stream_format(source)
+        encoded = stream_format(probe)
+    finally:
+        if probe.exists():
+            probe.unlink()
+
+    mismatched = [
+        f'{key} {encoded[key]!r} instead of {expected[key]!r}'
+        for key in expected if encoded[key] != expected[key]
+    ]
+    if mismatched:
+        msg = (
+            f'Function `splice` in module `segments` requires that the '
+            f'segment be encoded in the stream format of the source video, '
+            f'but the given settings encode it with '
+            f'{", ".join(mismatched)}.  Pass `codec`, `pixelformat` and '
+            f'encoder arguments which match the source.'
+        )
+        raise ValueError(msg)
+
+    keys, length = keyframes(source)
+    if stop > length:
+        stop = length
+
+    before = int(keys[keys <= first].max())
+    after = keys[keys >= stop]
+    after = int(after.min()) if after.size > 0 else length
+
+    # Boundaries at which the stream is cut, without the start and end
+    cuts = sorted({cut for cut in (before, after) if 0 < cut < length})
+    parts = [
+        temp_directory / (name + f'_{n:03d}' + source.suffix)
+        for n in range(len(cuts) + 1)
+    ]
+
+    try:
+        # Re-encoding the segment along with the rest of its keyframe groups
+        frames = itertools.chain(
+            read_frames(source, fps, before, first), segment,
+            read_frames(source, fps, stop, after)
+        )
+        with imageio.get_writer(middle, fps = fps, **params) as writer:
+            encoding.write_frames(writer, frames)
+
+        # Cutting the source at the keyframes surrounding the segment
+        if cuts:
+            _ffmpeg(
+                '-i', str(source), '-map', '0:v:0', '-c', 'copy',
+                '-f', 'segment', '-segment_frames', ','.join(map(str, cuts)),
+                '-reset_timestamps', '1', str(pattern)
+            )
+
+        files = []
+        if before > 0:
+            files.append(parts[0])
+        files.append(middle)
+        if after < length:
+            files.append(parts[-1])
+
+        concat(files, destination, temp_directory)
+    finally:
+        for path in [middle] + parts:
+            if path.exists():
+                path.unlink()
+
+def split(count:int, parts:int, keyint:int) -> List[Tuple[int, int]]:
+    '''
+        Splits `count` frames into up to `parts` consecutive segments of
+        roughly equal length, returned as a list of (first frame, stop frame)
+        tuples where the stop frame is excluded.
+
+        Segments longer than `keyint`, the maximum number of frames between
+        keyframes, are rounded up to a multiple of it, such that each segment
+        starts where groups of pictures of fixed length would start anyway,
+        rather than adding keyframes at arbitrary positions.  There are fewer
+        segments if there are too few frames for `parts` of them.
+    '''
+    length = max(1, -(-count // parts))
+    if length > keyint:
+        length = -(-length // keyint) * keyint
+
+    return [
+        (start, min(start + length, count))
+        for start in range(0, count, length)
+    ]
+
+def concat(files:List[Path], destination:Path, temp_directory:Path) -> None:
+    '''
+        Joins the video files in `files` into a single video file at
+        `destination` with ffmpeg's concat demuxer, copying their video
+        streams without re-encoding them.  The files must share their codec,
+        pixel format and resolution.
+    '''
+    paths.ensure(temp_directory)
+    listing = temp_directory / (create_unique_name(prefix = 'concat') + '.txt')
+
+    try:
+        listing.write_text(''.join(
+            'file \'{}\'\n'.format(str(f).replace('\'', '\'\\\'\''))
+            for f in files
+        ))
+
+        _ffmpeg(
+            '-f', 'concat', '-safe', '0', '-i', str(listing), '-c', 'copy',
+            str(destination)
+        )
+    finally:
+        if listing.exists():
+            listing.unlink()
+
+def _ffmpeg(*args:str, stderr:bool = False) -> str:
+    '''
+        Private function which runs the ffmpeg executable bundled with
+        imageio with the given arguments, and returns its standard output,
+        followed by its standard error if `stderr` is True.
+    '''
+    import imageio_ffmpeg
+
+    command = [imageio_ffmpeg.get_ffmpeg_exe(), '-y', '-v', 'error']
+    result = subprocess.run(
+        command + list(args), capture_output = True, text = True
+    )
+    if result.returncode != 0:
+        msg = f'ffmpeg failed with the following output:\n{result.stderr}'
+        raise RuntimeError(msg)
+    if stderr:
+        return result.stdout + result.stderr
+    return result.stdout
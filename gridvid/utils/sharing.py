@@ -0,0 +1,189 @@
+'''
+    Tools for sharing video arrays between processes through
+    `multiprocessing.shared_memory`, such that worker processes attach to the
+    frames and modify them in place, rather than receiving pickled copies.
+
+    A shared video is identified by a handle (name, shape, dtype, fps), which
+    is small enough to be pickled with every task, see class `SharedVideo`.
+'''
+from typing import Any, Callable, List, Tuple
+import functools
+import pickle
+import atexit
+import os
+
+import numpy as np
+
+from gridvid.config import defaults
+
+# Handle of a shared video: (name of the shared memory block, shape of the
+# video array, dtype of the video array, fps)
+Handle = Tuple[str, Tuple[int, ...], str, int]
+
+# Frames and function of the current worker process, see `_initialize`
+_worker = {}
+
+def create(nbytes:int):
+    '''
+        Returns a new block of shared memory of at least `nbytes` bytes.  The
+        block must be unlinked by its creator once it is no longer needed.
+    '''
+    return _memory_class()(create = True, size = max(nbytes, 1))
+
+def attach(name:str):
+    '''
+        Returns the existing block of shared memory called `name`, without
+        copying it.
+
+        The block is left to its creator to unlink.  Before Python 3.13, the
+        resource tracker of the attaching process would unlink it on exit, so
+        the block should only be attached by processes started with
+        `multiprocessing` from the creator's process, which share its tracker.
+    '''
+    try:
+        return _memory_class()(name = name, track = False)
+    except TypeError:
+        return _memory_class()(name = name)
+
+def ndarray(
+memory, shape:Tuple[int, ...], dtype:str = 'uint8') -> np.ndarray:
+    '''
+        Returns an array of the given shape and dtype which views the block of
+        shared memory `memory`.  The block cannot be closed while the array,
+        or any view of it, exists.
+    '''
+    # Unlike the ndarray constructor, frombuffer keeps the buffer exported
+    # while the array exists, which is what keeps the block from closing
+    dtype = np.dtype(dtype)
+    count = int(np.prod(shape, dtype = np.int64))
+    return np.frombuffer(memory.buf, dtype, count).reshape(shape)
+
+def ranges(frames:int, chunk_size:int = None) -> List[Tuple[int, int]]:
+    '''
+        Splits `frames` frames into disjoint ranges of up to `chunk_size`
+        frames, returned as (first frame, stop frame) tuples where the stop
+        frame is excluded.
+    '''
+    if chunk_size is None:
+        chunk_size = defaults.chunk_size
+
+    return [
+        (start, min(start + chunk_size, frames))
+        for start in range(0, frames, chunk_size)
+    ]
+
+def map_ranges(
+handle:Handle, func:Callable[[np.ndarray], Any],
+bounds:List[Tuple[int, int]], workers:int = None, stage = None) -> None:
+    '''
+        Applies `func` in place to each range of frames in `bounds` of the
+        shared video with the given handle, in a pool of `workers` processes.
+
+        Each worker attaches to the shared video once, and only the bounds of
+        each range are sent to it.  `func` receives a view of the frames in
+        the range, which it modifies in place, or it returns an array of the
+        same shape which is copied into the range.  `func` must be picklable,
+        e.g. a function defined at the top level of a module.
+
+        If given, each range is added to the totals of the profiling stage
+        `stage` once it is finished, see `utils/profiling.py`.
+    '''
+    if workers is None:
+        workers = os.cpu_count()
+
+    if not bounds:
+        return
+
+    # Worker processes are spawned rather than forked, as forking a process
+    # whose numba threading layer is already running is unsafe
+    import multiprocessing
+    context = multiprocessing.get_context('spawn')
+
+    # Pickling the function here, such that it is loaded in the workers by
+    # the initializer, which reports errors rather than crashing the worker
+    func = pickle.dumps(func)
+
+    frame_bytes = int(np.prod(handle[1][1:])) * np.dtype(handle[2]).itemsize
+    pool = context.Pool(
+        min(workers, len(bounds)), _initialize, (handle, func)
+    )
+    try:
+        for start, stop in pool.imap_unordered(_apply, bounds):
+            if stage is not None:
+                stage.advance(stop - start, (stop - start) * frame_bytes)
+        pool.close()
+    except BaseException:
+        pool.terminate()
+        raise
+    finally:
+        pool.join()
+
+@functools.lru_cache(maxsize = None)
+def _memory_class() -> type:
+    '''
+        Private function which returns the class of the blocks of shared
+        memory, defined on first use as `multiprocessing` is imported lazily.
+        Unlike `SharedMemory`, a block stays mapped, rather than raising
+        BufferError, if arrays viewing it outlive it, and is unmapped once the
+        last of them is freed.
+    '''
+    from multiprocessing import shared_memory
+
+    class SharedMemory(shared_memory.SharedMemory):
+        def __del__(self) -> None:
+            try:
+                self.close()
+            except BufferError:
+                # The arrays hold the mapping, which no longer needs the file
+                if getattr(self, '_fd', -1) >= 0:
+                    os.close(self._fd)
+                    self._fd = -1
+            except OSError:
+                pass
+
+    return SharedMemory
+
+def _initialize(handle:Handle, func:bytes) -> None:
+    '''
+        Private function which attaches a worker process to the shared video
+        with the given handle, and loads the pickled function `func`, see
+        `map_ranges`.
+
+        Errors are raised by the first task instead, as a pool replaces
+        workers whose initializer fails indefinitely.
+    '''
+    name, shape, dtype, fps = handle
+    try:
+        memory = attach(name)
+        _worker['memory'] = memory
+        _worker['frames'] = ndarray(memory, shape, dtype)
+        _worker['func'] = pickle.loads(func)
+        atexit.register(_detach)
+    except Exception as e:
+        _worker['error'] = e
+
+def _detach() -> None:
+    '''
+        Private function which releases the frames of the worker process
+        before closing its shared memory, as the memory cannot be closed while
+        the frames view it.
+    '''
+    _worker.pop('frames', None)
+    memory = _worker.pop('memory', None)
+    if memory is not None:
+        memory.close()
+
+def _apply(bounds:Tuple[int, int]) -> Tuple[int, int]:
+    '''
+        Private function which applies the function of the worker process to
+        a range of frames, and returns the range.
+    '''
+    if 'error' in _worker:
+        raise _worker['error']
+
+    start, stop = bounds
+    frames = _worker['frames'][start:stop]
+    result = _worker['func'](frames)
+    if result is not None and result is not frames:
+        frames[...] = result
+    return bounds
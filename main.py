@@ -1,3 +1,4 @@
+from pathlib import Path
 import numpy as np
 import argparse
 import time
@@ -20,6 +21,40 @@ def parse_args():
         'through the process of placing a custom-sized grid on the video.'
     )
 
+    help_batch = (
+        'Used alongside `--grid`; adds the same grid to every video in the '
+        'given directory instead.  Videos which have already been processed '
+        'are skipped.'
+    )
+
+    help_jobs = (
+        'The number of worker processes used by `--batch`.'
+    )
+
+    help_shape = (
+        'The number of horizontal and vertical grid lines used by `--batch`.'
+    )
+
+    help_width = (
+        'The width of the grid lines in pixels used by `--batch`.'
+    )
+
+    help_memory = (
+        'The memory budget of each `--batch` worker process, in megabytes.'
+    )
+
+    help_warmup = (
+        'Compiles the grid kernels ahead of time and stores them in the shared '
+        'kernel cache, such that later runs and worker processes load them '
+        'instead of compiling them.'
+    )
+
+    help_cache = (
+        'Manages the cache of rendered videos: `stats` prints its size and '
+        'contents, and `prune` removes stale files and evicts the least '
+        'recently used videos until the cache fits its maximum size.'
+    )
+
     parser = argparse.ArgumentParser(description = argparse_desc)
 
     parser.add_argument(
@@ -31,6 +66,28 @@ def parse_args():
     parser.add_argument(
         '--grid', action='store_true', help = help_grid
     )
+    parser.add_argument(
+        '--batch', type = Path, metavar = 'DIR', help = help_batch
+    )
+    parser.add_argument(
+        '--jobs', type = int, metavar = 'N', help = help_jobs
+    )
+    parser.add_argument(
+        '--shape', type = int, nargs = 2, default = (5, 5), metavar = 'N',
+        help = help_shape
+    )
+    parser.add_argument(
+        '--width', type = int, default = 1, help = help_width
+    )
+    parser.add_argument(
+        '--memory', type = int, metavar = 'MB', help = help_memory
+    )
+    parser.add_argument(
+        '--warmup', action='store_true', help = help_warmup
+    )
+    parser.add_argument(
+        '--cache', choices = ('stats', 'prune'), help = help_cache
+    )
 
     return parser.parse_args()
 
@@ -66,15 +123,58 @@ def display_status():
 def procedure_grid():
     pass
 
+def procedure_batch(args):
+    memory = None if args.memory is None else args.memory * 1024**2
+    batch.process_directory(
+        tuple(args.shape), args.width, directory = args.batch,
+        jobs = args.jobs, memory = memory, verbose = True
+    )
+
+def procedure_warmup():
+    from gridvid.utils import kernels
+    for name, cached in kernels.warmup().items():
+        status = 'already cached' if cached else 'compiled'
+        print(f'{utils.text.bold(name)}{utils.text.norm()} – {status}')
+    print(f'Kernel cache: {config.paths.kernel_cache}')
+
+def procedure_cache(action):
+    from gridvid.utils import rendercache
+    if action == 'prune':
+        removed = rendercache.prune()
+        print(
+            f'Removed {removed["entries"]:d} cached videos, freeing '
+            f'{removed["bytes"] / 1024**2:.1f} MB'
+        )
+    stats = rendercache.stats()
+    print(f'{utils.text.bold("Render cache")}{utils.text.norm()} – '
+          f'{stats["directory"]}')
+    print(f'Videos:  {stats["entries"]:d}')
+    print(
+        f'Size:    {stats["size"] / 1024**2:.1f} MB of '
+        f'{stats["max_size"] / 1024**2:.1f} MB'
+    )
+    print(f'Reused:  {stats["hits"]:d} times')
+    print(f'Sources: {stats["sources"]:d} hashed files')
+
 """MAIN SCRIPT"""
 
-args = parse_args()
+if __name__ == '__main__':
+
+    args = parse_args()
+
+    if args.warmup is True:
+        procedure_warmup()
+
+    if args.cache is not None:
+        procedure_cache(args.cache)
 
-if args.unittests is True:
-    tests.run_all()
+    if args.unittests is True:
+        tests.run_all()
 
-if args.test is True:
-    print('No Tests Implemented')
+    if args.test is True:
+        print('No Tests Implemented')
 
-if args.grid is True:
-    procedure_grid()
+    if args.grid is True and args.batch is not None:
+        procedure_batch(args)
+    elif args.grid is True:
+        procedure_grid()
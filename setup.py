@@ -1,7 +1,7 @@
 from distutils.core import setup
 
 dependencies = (
-    'numpy', 'numba', 'matplotlib', 'imageio', 'imageio-ffmpeg'
+    'numpy', 'numba', 'matplotlib', 'imageio', 'imageio-ffmpeg', 'pillow'
 )
 
 packages = ['', '.config', '.obj', '.utils']
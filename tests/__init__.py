@@ -1,3 +1,6 @@
 from . import obj
 from . import utils
+from . import tests_pipeline
+from . import tests_batch
+from . import tests_imports
 from .main import run_all
@@ -2,6 +2,22 @@
     Main testing utility for large-scale testing of program functionality
 '''
 from tests.obj import tests_Video
+from tests.obj import tests_LazyVideo
+from tests.obj import tests_NoiseVideo
+from tests.obj import tests_GridSpec
+from tests.obj import tests_Profiler
+from tests.obj import tests_SharedVideo
+from tests.utils import tests_geometry
+from tests.utils import tests_kernels
+from tests.utils import tests_segments
+from tests.utils import tests_scaling
+from tests.utils import tests_color
+from tests.utils import tests_decoding
+from tests.utils import tests_pipes
+from tests.utils import tests_rendercache
+from tests import tests_pipeline
+from tests import tests_batch
+from tests import tests_imports
 
 def run_obj() -> None:
     '''
@@ -9,12 +25,46 @@ def run_obj() -> None:
         returns True if all tests succeed, False otherwise.
     '''
     tests_Video.run_all()
+    tests_LazyVideo.run_all()
+    tests_NoiseVideo.run_all()
+    tests_GridSpec.run_all()
+    tests_Profiler.run_all()
+    tests_SharedVideo.run_all()
 
 def run_utils() -> None:
     '''
         Runs all the tests listed in src/tests/utils/;
         returns True if all tests succeed, False otherwise.
     '''
+    tests_geometry.run_all()
+    tests_kernels.run_all()
+    tests_segments.run_all()
+    tests_scaling.run_all()
+    tests_color.run_all()
+    tests_decoding.run_all()
+    tests_pipes.run_all()
+    tests_rendercache.run_all()
+
+def run_pipeline() -> None:
+    '''
+        Runs all the tests listed in src/tests/tests_pipeline.py;
+        returns True if all tests succeed, False otherwise.
+    '''
+    tests_pipeline.run_all()
+
+def run_batch() -> None:
+    '''
+        Runs all the tests listed in src/tests/tests_batch.py;
+        returns True if all tests succeed, False otherwise.
+    '''
+    tests_batch.run_all()
+
+def run_imports() -> None:
+    '''
+        Runs all the tests listed in src/tests/tests_imports.py;
+        returns True if all tests succeed, False otherwise.
+    '''
+    tests_imports.run_all()
 
 def run_all() -> None:
     '''
@@ -23,3 +73,6 @@ def run_all() -> None:
     '''
     run_obj()
     run_utils()
+    run_pipeline()
+    run_batch()
+    run_imports()
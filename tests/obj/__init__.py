@@ -1 +1,6 @@
 from . import tests_Video
+from . import tests_LazyVideo
+from . import tests_GridSpec
+from . import tests_NoiseVideo
+from . import tests_Profiler
+from . import tests_SharedVideo
@@ -0,0 +1,62 @@
+from gridvid import GridSpec
+import numpy as np
+
+def run_all() -> None:
+    '''
+        Runs all class GridSpec tests;
+        returns True if all tests succeed, False otherwise.
+    '''
+    # Reusing Previously Computed Grids
+    grid = GridSpec.get((48, 64), (2,3), 3, (255, 0, 0))
+    assert GridSpec.get((48, 64), (2,3), 3, (255, 0, 0)) is grid
+    assert GridSpec.get((48, 64), (2,3), 1, (255, 0, 0)) is not grid
+
+    # Caching Line Indices and Fractional Positions Separately
+    index = GridSpec.get((100, 100), ((1,), 0))
+    fraction = GridSpec.get((100, 100), ((1.0,), 0))
+    assert index is not fraction
+    assert index.rows.tolist() == [1]
+    assert fraction.rows.tolist() == [99]
+
+    # Computing Grid Lines
+    assert grid.rows.tolist() == [0, 1, 14, 15, 16, 30, 31, 32, 46, 47]
+    assert grid.cols.tolist() == [0, 1, 14, 15, 16, 30, 31, 32, 46, 47, 48,
+                                  62, 63]
+
+    # Drawing the Grid
+    frames = np.zeros((2, 48, 64, 3), dtype = np.uint8)
+    grid.apply(frames)
+    expected = np.zeros_like(frames)
+    expected[:,grid.rows] = (255, 0, 0)
+    expected[:,:,grid.cols] = (255, 0, 0)
+    assert np.array_equal(frames, expected)
+
+    # Blending Transparent Grids
+    grid = GridSpec.get((48, 64), (2,3), 3, (255, 0, 0), opacity = 0.5)
+    frames = np.zeros((2, 48, 64, 3), dtype = np.uint8)
+    grid.apply(frames)
+    assert np.array_equal(frames[:,grid.rows][...,0], np.full((2, 10, 64), 128))
+    assert not frames[:,:,:,1:].any()
+
+    # Anti-Aliasing Lines at Fractional Positions
+    grid = GridSpec((10, 10), ([0.5], []), 1, antialias = True)
+    frames = np.zeros((1, 10, 10, 3), dtype = np.uint8)
+    grid.apply(frames)
+    assert frames[0,:,0,0].tolist() == [0, 0, 0, 0, 128, 128, 0, 0, 0, 0]
+
+    # Rejecting Invalid Arguments
+    for args in [((48, 64), (2,), 1), ((48, 64), (2,2), 0),
+                 ((48, 64), (2,2), 1, (256, 0, 0))]:
+        try:
+            GridSpec(*args)
+        except TypeError:
+            pass
+        else:
+            raise AssertionError(f'GridSpec{args} did not raise TypeError')
+
+    try:
+        GridSpec((48, 64), (2,2), opacity = 1.5)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError('Invalid `opacity` did not raise ValueError')
@@ -0,0 +1,93 @@
+from gridvid import Video, LazyVideo
+import numpy as np
+import subprocess
+import gridvid
+
+def run_all() -> None:
+    '''
+        Runs all class LazyVideo tests;
+        returns True if all tests succeed, False otherwise.
+    '''
+    data_path = gridvid.config.paths.temp_video_directory
+    extension = '.mp4'
+    filename = 'test_lazy_video'
+
+    # Saving a Video to File
+    video = Video.noise(30, (64, 96), 30, False, filename)
+    video.save(filename, extension = extension, directory = data_path)
+
+    # Opening the Video Without Decoding
+    video_lazy = LazyVideo.from_file(filename + extension, data_path)
+    assert len(video_lazy) == 30
+    assert video_lazy.shape == (30, 64, 96, 3)
+    assert video_lazy.fps == 30
+
+    # Decoding Single Frames and Slices
+    video_loaded = Video.from_file(filename + extension, data_path)
+    assert np.array_equal(video_lazy[10], video_loaded[10])
+    assert np.array_equal(video_lazy[-1], video_loaded[-1])
+    assert np.array_equal(video_lazy[5:20:3], video_loaded[5:20:3])
+    assert np.array_equal(video_lazy[2,:,4], video_loaded[2,:,4])
+
+    # Saving Tenth Frame from Video
+    video_lazy.save_frame(10, directory = data_path)
+
+    # Creating Video Grid
+    video_lazy.create_grid((2,2))
+    assert video_lazy[0,0,0].tolist() == [255, 255, 255]
+
+    video_lazy.close()
+
+    # Cropping and Scaling Frames While Decoding
+    video_preview = LazyVideo.from_file(
+        filename + extension, data_path, size = 0.5, crop = (0, 32, 64, 64)
+    )
+    video_scaled = Video.from_file(
+        filename + extension, data_path, size = 0.5, crop = (0, 32, 64, 64)
+    )
+    assert video_preview.shape == video_scaled.shape == (30, 32, 32, 3)
+    assert np.array_equal(video_preview[4], video_scaled[4])
+
+    # Placing Grids as on the Full Size Frames
+    video_preview.create_grid((1,1), width = 4)
+    assert video_preview.grids[0].width == 2
+    assert video_preview.grids[0].shape == ((0, 15, 31), (7, 31))
+
+    video_preview.close()
+
+    # Decoding the Original Frames
+    with LazyVideo.from_file(filename + extension, data_path) as video_lazy:
+        video_lazy.create_grid((1,1))
+        assert np.array_equal(video_lazy.raw, video_loaded.raw)
+        video_lazy.remove_grid()
+
+    # Reopening the Reader after Closing the Video
+    assert np.array_equal(video_lazy[3], video_loaded[3])
+    video_lazy.close()
+
+    # Correcting an Overestimated Number of Frames
+    import imageio_ffmpeg
+    subprocess.run(
+        [
+            imageio_ffmpeg.get_ffmpeg_exe(), '-y', '-v', 'error',
+            '-i', str(data_path / (filename + extension)),
+            '-f', 'lavfi', '-t', '1.1', '-i', 'anullsrc',
+            '-c:v', 'copy', str(data_path / (filename + '.mkv'))
+        ],
+        check = True
+    )
+    video_lazy = LazyVideo.from_file(filename + '.mkv', data_path)
+    assert video_lazy.shape == (33, 64, 96, 3)
+    try:
+        video_lazy[32]
+    except IndexError:
+        pass
+    else:
+        raise AssertionError('Reading past the end did not raise IndexError')
+    assert video_lazy.shape == (32, 64, 96, 3)
+    assert len(video_lazy.array) == 30
+    assert video_lazy.shape == (30, 64, 96, 3)
+    video_lazy.close()
+
+    # Clearing Temporary Files
+    Video.clear_temporary_files()
@@ -0,0 +1,52 @@
+from gridvid import Video, NoiseVideo
+from gridvid.utils import noise
+import numpy as np
+import gridvid
+
+def run_all() -> None:
+    '''
+        Runs all class NoiseVideo tests;
+        returns True if all tests succeed, False otherwise.
+    '''
+    data_path = gridvid.config.paths.temp_video_directory
+    extension = '.mp4'
+    filename = 'test_noise_video'
+
+    # Reproducing Noise from a Seed
+    video = Video.noise(10, (16, 24), 30, seed = 7, chunk_size = 4)
+    assert video.shape == (10, 16, 24, 3)
+    repeated = Video.noise(
+        10, (16, 24), 30, seed = 7, chunk_size = 4, workers = 1
+    )
+    assert np.array_equal(video[:], repeated[:])
+    other = Video.noise(10, (16, 24), 30, seed = 8, chunk_size = 4)
+    assert not np.array_equal(video[:], other[:])
+
+    # Streaming the Same Noise in Chunks
+    chunks = list(noise.stream(10, (16, 24, 3), 7, 4))
+    assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+    assert np.array_equal(np.concatenate(chunks), video[:])
+
+    # Generating Frames on Demand
+    video_lazy = Video.noise(
+        10, (16, 24), 30, seed = 7, chunk_size = 4, lazy = True
+    )
+    assert isinstance(video_lazy, NoiseVideo)
+    assert video_lazy.shape == video.shape and video_lazy.seed == 7
+    assert np.array_equal(video_lazy[9], video[9])
+    assert np.array_equal(video_lazy[::3,2], video[::3,2])
+
+    # Drawing Grids and Modifying Frames
+    video_lazy.create_grid((1, 1))
+    assert (video_lazy[5,0] == 255).all()
+    video_lazy[0] = 0
+    assert np.array_equal(video_lazy.raw[1], video[1])
+
+    # Streaming the Noise into the Encoder
+    video_lazy = NoiseVideo(40, (32, 32), 30, True, 1, filename = filename)
+    video_lazy.save(filename, extension = extension, directory = data_path)
+    video_loaded = Video.from_file(filename + extension, data_path)
+    assert video_loaded.shape == (40, 32, 32, 3)
+
+    # Clearing Temporary Files
+    Video.clear_temporary_files()
@@ -0,0 +1,45 @@
+from gridvid import Video, Profiler
+import numpy as np
+import json
+import gridvid
+
+def run_all() -> None:
+    '''
+        Runs all class Profiler tests;
+        returns True if all tests succeed, False otherwise.
+    '''
+    data_path = gridvid.config.paths.temp_video_directory
+    extension = '.mp4'
+    filename = 'test_profiler'
+
+    # Recording Stages
+    with Profiler() as profiler:
+        video = Video.noise(20, (64, 64), 30, filename = filename)
+        video.create_grid((2, 2))
+        video.save(filename, extension = extension, directory = data_path)
+        video_loaded = Video.from_file(filename + extension, data_path)
+        Video(video_loaded.raw, 30)
+
+    summary = profiler.summary()
+    stages = ('noise', 'create_grid', 'set_grid', 'save', 'from_file', 'copy')
+    assert all(name in summary for name in stages)
+    assert summary['save']['frames'] == 20
+    assert summary['save']['bytes'] == video.raw.nbytes
+    assert summary['from_file']['frames'] == 20
+    assert summary['copy']['memory'] >= video.raw.nbytes
+
+    # Recording Nothing While Inactive
+    count = len(profiler.records)
+    video.save_frame(0, filename, directory = data_path)
+    assert len(profiler.records) == count
+
+    # Exporting Results
+    profiler.to_json(data_path / 'profile.json')
+    contents = json.loads((data_path / 'profile.json').read_text())
+    assert len(contents['stages']) == count
+    profiler.to_trace(data_path / 'profile.trace')
+    trace = json.loads((data_path / 'profile.trace').read_text())
+    assert {event['name'] for event in trace['traceEvents']} == set(summary)
+
+    # Clearing Temporary Files
+    Video.clear_temporary_files()
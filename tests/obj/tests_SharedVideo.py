@@ -0,0 +1,97 @@
+from gridvid import Video, SharedVideo
+from pathlib import Path
+import numpy as np
+import pickle
+
+def invert(frames:np.ndarray) -> np.ndarray:
+    '''
+        Returns the inverted frames, run in the worker processes.
+    '''
+    return 255 - frames
+
+def brighten(frames:np.ndarray) -> None:
+    '''
+        Brightens the frames in place, run in the worker processes.
+    '''
+    frames += 1
+
+def run_all() -> None:
+    '''
+        Runs all class SharedVideo tests;
+        returns True if all tests succeed, False otherwise.
+    '''
+    # Mapping Frame Functions over a Video in Worker Processes
+    video = Video.noise(40, (32, 48), 30, verbose = False)
+    original = video[:].copy()
+    video.parallel_map(invert, chunk_size = 8, workers = 2)
+    assert np.array_equal(video[:], 255 - original)
+    assert np.array_equal(video.raw, original)
+
+    # Keeping the Modified Frames in Unlinked Shared Memory
+    name = video._shared_frames.handle[0]
+    assert not (Path('/dev/shm') / name.lstrip('/')).exists()
+
+    # Drawing a Grid into the Frames in Place
+    grid = video.create_grid((2, 2), linecolor = (255, 0, 0))
+    expected = video[:]
+    video.remove_grid(grid)
+    video.parallel_map(grid.apply, workers = 2)
+    assert np.array_equal(video[:], expected)
+
+    # Sharing Frames without Copying
+    with video.to_shared() as shared:
+        name, shape, dtype, fps = shared.handle
+        assert shared.owner
+        assert (shape, dtype, fps) == ((40, 32, 48, 3), '|u1', 30)
+
+        shared.parallel_map(brighten, workers = 2)
+        assert np.array_equal(shared[:], expected + 1)
+
+        # Attaching to the Frames
+        attached = SharedVideo.attach(shared.handle)
+        attached[0] = 7
+        assert not attached.owner
+        assert (shared.raw[0] == 7).all()
+        attached.close()
+
+        # Pickling Only the Handle
+        shared._default_extension = '.avi'
+        shared._region = ((64, 96), (0, 0, 64, 96), (32, 48))
+        copied = pickle.loads(pickle.dumps(shared))
+        assert len(pickle.dumps(shared)) < 1024
+        assert np.array_equal(copied.raw, shared.raw)
+        assert copied._default_extension == '.avi'
+        assert copied._region == shared._region
+        copied.close()
+
+        # Keeping the Video Usable if Views Prevent Closing It
+        attached = SharedVideo.attach(shared.handle)
+        view = attached.raw
+        try:
+            attached.close()
+        except BufferError:
+            pass
+        else:
+            msg = 'Closing with a view did not raise BufferError'
+            raise AssertionError(msg)
+        assert np.array_equal(attached[:], shared[:])
+        del view
+        attached.close()
+
+    # Unlinking the Shared Memory
+    assert not (Path('/dev/shm') / name.lstrip('/')).exists()
+
+    # Closing and Unlinking the Shared Memory on Garbage Collection
+    shared = video.to_shared()
+    name, memory = shared.handle[0], shared._memory
+    del shared
+    assert memory.buf is None
+    assert not (Path('/dev/shm') / name.lstrip('/')).exists()
+
+    # Rejecting Invalid Arguments
+    try:
+        video.parallel_map(invert, chunk_size = 0)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError('Invalid `chunk_size` did not raise ValueError')
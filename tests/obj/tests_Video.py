@@ -1,7 +1,321 @@
 from gridvid import Video
+from gridvid.utils import segments
 from pathlib import Path
 import numpy as np
 import gridvid
+import imageio.v2 as imageio
+
+def run_copy_on_write() -> None:
+    '''
+        Checks that wrapped arrays are shared, and only copied on write.
+    '''
+    data = np.zeros((4, 32, 32, 3), dtype = np.uint8)
+
+    # Wrapping an Array Without Copying
+    video = Video.wrap(data, 30)
+    assert video.raw is data
+    assert np.shares_memory(video[0], data)
+
+    # Modifying the Video Leaves the Wrapped Array Untouched
+    video.create_grid((1,1))
+    assert video[0,0,0].tolist() == [255, 255, 255]
+    assert not data.any()
+
+    # Removing the Grid Restores the Original Frames
+    video.remove_grid()
+    assert np.shares_memory(video[0], data)
+    assert not video.array.any()
+
+def run_overlays() -> None:
+    '''
+        Checks that grids are drawn onto frames as they are accessed, without
+        modifying the video data.
+    '''
+    data = np.zeros((4, 32, 32, 3), dtype = np.uint8)
+    video = Video.wrap(data, 30)
+
+    # Adding Grids Leaves the Video Data Untouched
+    white = video.create_grid((1,1))
+    red = video.create_grid((3,3), linecolor = (255, 0, 0))
+    assert video.grids == (white, red)
+    assert video.raw is data and not data.any()
+
+    # Drawing Grids in the Order They Were Added
+    expected = red.apply(white.apply(data.copy()))
+    assert np.array_equal(video[:], expected)
+    assert np.array_equal(video[2], expected[2])
+    assert np.array_equal(video[-1,:,0], expected[-1,:,0])
+    assert np.array_equal(video[[0, 3]], expected[[0, 3]])
+    assert np.array_equal(np.array(list(video)), expected)
+    assert np.array_equal(video.array, expected)
+
+    # Removing a Single Grid
+    video.remove_grid(red)
+    assert video.grids == (white,)
+    assert np.array_equal(video[:], white.apply(data.copy()))
+
+    try:
+        video.remove_grid(red)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError('Removing a missing grid did not raise ValueError')
+
+    # Removing All Grids Keeps Modified Frames
+    video[0, 5, 5] = (0, 0, 255)
+    video.remove_grid()
+    assert video.grids == ()
+    assert video[0, 5, 5].tolist() == [0, 0, 255]
+    assert not data.any()
+
+def run_segments() -> None:
+    '''
+        Checks that segments of a video file can be loaded, saved and spliced
+        back into the file.
+    '''
+    data_path = gridvid.config.paths.temp_video_directory
+    extension = '.mp4'
+    filename = 'test_segments'
+
+    # Saving a Lossless Video with Frequent Keyframes
+    lossless = {'codec': 'libx264rgb', 'pixelformat': 'rgb24', 'crf': 0}
+    video = Video.noise(60, (64, 64), 30, False, filename)
+    video.save(filename, extension = extension, directory = data_path,
+               keyint = 10, **lossless)
+    assert np.array_equal(
+        Video.from_file(filename + extension, data_path)[:], video[:]
+    )
+    video_loaded = Video.from_file(filename + extension, data_path)
+
+    # Loading Segments by Frame Number and Timestamp
+    segment = Video.from_file(
+        filename + extension, data_path, start = 25, end = '00:01.5'
+    )
+    assert np.array_equal(segment[:], video_loaded[25:45])
+
+    segment_strided = Video.from_file(
+        filename + extension, data_path, start = 7, stride = 4
+    )
+    assert np.array_equal(segment_strided[:], video_loaded[7::4])
+
+    # Saving a Segment
+    video_loaded.save(
+        filename + '_part', directory = data_path, start = 10, end = 20
+    )
+    assert len(Video.from_file(filename + '_part' + extension, data_path)) == 10
+
+    # Splicing a Modified Segment into the File
+    segment.create_grid((1,1))
+    segment.save(filename + '_spliced', directory = data_path, splice = True,
+                 keyint = 10, **lossless)
+    video_spliced = Video.from_file(filename + '_spliced' + extension, data_path)
+    assert len(video_spliced) == 60
+    assert np.array_equal(video_spliced[25:45], segment[:])
+
+    # Rejecting a Segment Encoded in Another Format
+    try:
+        segment.save(filename + '_mismatched', directory = data_path,
+                     splice = True, keyint = 10)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError('Splicing another format did not raise ValueError')
+    assert not (data_path / (filename + '_mismatched' + extension)).exists()
+
+    # Frames Outside the Re-Encoded Keyframe Groups are Copied Exactly
+    keys, length = segments.keyframes(data_path / (filename + extension))
+    before, after = keys[keys <= 25].max(), keys[keys >= 45].min()
+    assert np.array_equal(video_spliced[:before], video_loaded[:before])
+    assert np.array_equal(video_spliced[after:], video_loaded[after:])
+
+    # Clearing Temporary Files
+    Video.clear_temporary_files()
+
+def run_frame_cache() -> None:
+    '''
+        Checks that cached videos are memory mapped on subsequent loads.
+    '''
+    data_path = gridvid.config.paths.temp_video_directory
+    extension = '.mp4'
+    filename = 'test_cache'
+
+    # Saving a Video to File
+    video = Video.noise(10, (64, 64), 30, False, filename)
+    video.save(filename, extension = extension, directory = data_path)
+
+    # Decoding the Video into the Cache
+    video_decoded = Video.from_file(filename + extension, data_path, cache = True)
+    assert isinstance(video_decoded.raw, np.memmap)
+
+    # Mapping the Cache on the Second Load
+    video_cached = Video.from_file(filename + extension, data_path, cache = True)
+    assert isinstance(video_cached.raw, np.memmap)
+    assert video_cached.shape == (10, 64, 64, 3)
+    assert video_cached.fps == 30
+    assert np.array_equal(video_cached[5], video_decoded[5])
+
+    # Clearing Temporary Files
+    Video.clear_temporary_files()
+
+def run_encoder_settings() -> None:
+    '''
+        Checks that videos can be saved with custom encoder settings.
+    '''
+    data_path = gridvid.config.paths.temp_video_directory
+    extension = '.mp4'
+    filename = 'test_encoder'
+
+    # Saving with Custom Encoder Settings
+    video = Video.noise(12, (64, 64), 30, False, filename)
+    video.save(
+        filename, extension = extension, directory = data_path, crf = 0,
+        preset = 'ultrafast', threads = 2, pixelformat = 'yuv444p'
+    )
+
+    # Reloading Saved Video
+    video_loaded = Video.from_file(filename + extension, data_path)
+    assert video_loaded.shape == video.shape
+
+    # Rejecting Invalid Encoder Settings
+    try:
+        video.save(filename, directory = data_path, crf = 'high')
+    except TypeError:
+        pass
+    else:
+        raise AssertionError('Invalid `crf` did not raise TypeError')
+
+    # Clearing Temporary Files
+    Video.clear_temporary_files()
+
+def run_grayscale() -> None:
+    '''
+        Checks that grayscale videos are stored, drawn on and saved with a
+        single color channel.
+    '''
+    data_path = gridvid.config.paths.temp_video_directory
+    extension = '.mp4'
+    filename = 'test_grayscale'
+
+    # Storing a Single Channel
+    video = Video.noise(10, (64, 64), 30, True, filename)
+    assert video.shape == (10, 64, 64, 1) and video.grayscale
+    assert Video.wrap(video.raw[...,0], 30).shape == (10, 64, 64, 1)
+
+    # Drawing Grids with the Luminance of their Color
+    grid = video.create_grid((1, 1), linecolor = (255, 0, 0))
+    assert grid.linecolor == (gridvid.utils.color.luminance((255, 0, 0)),)
+    assert (video[:,0,:,0] == grid.linecolor[0]).all()
+    video.save_frame(0, filename, directory = data_path)
+
+    # Converting to RGB Only When Asked
+    rgb = video.to_rgb()
+    assert rgb.shape == (10, 64, 64, 3)
+    assert rgb.grids[0].linecolor == grid.linecolor * 3
+    assert np.array_equal(rgb[:,...,1:2], video[:])
+
+    # Saving and Reloading in Grayscale
+    video.save(filename, extension = extension, directory = data_path, crf = 0)
+    video_loaded = Video.from_file(
+        filename + extension, data_path, grayscale = True
+    )
+    assert video_loaded.shape == (10, 64, 64, 1)
+    assert np.array_equal(video_loaded[:], video[:])
+
+    # Decoding Lazily in Grayscale
+    lazy = gridvid.LazyVideo.from_file(
+        filename + extension, data_path, grayscale = True
+    )
+    assert lazy.shape == (10, 64, 64, 1)
+    assert np.abs(lazy[3].astype(int) - video[3]).max() <= 1
+    lazy.close()
+
+    # Clearing Temporary Files
+    Video.clear_temporary_files()
+
+def run_save_frames() -> None:
+    '''
+        Checks that a selection of frames is saved to uniquely named images.
+    '''
+    data_path = gridvid.config.paths.temp_video_directory
+    filename = 'test_frames'
+
+    # Saving Every Other Frame, Including Grids
+    video = Video.noise(12, (32, 48), 30, False, filename)
+    video.create_grid((1, 1), linecolor = (255, 0, 0))
+    files = video.save_frames(
+        slice(None, None, 2), data_path, compression = 1, workers = 2
+    )
+    assert len(files) == 6 and len(set(files)) == 6
+    assert all(f.suffix == '.png' and f.exists() for f in files)
+    assert files[-1].stem.endswith('_10')
+
+    image = imageio.imread(files[2])
+    assert np.array_equal(image, video[4])
+
+    # Saving Selected Grayscale Frames as JPEG
+    video = Video.noise(4, (32, 48), 30, True, filename)
+    files = video.save_frames([0, -1], data_path, '.jpg', quality = 50)
+    assert imageio.imread(files[1]).shape == (32, 48)
+
+    # Rejecting Unsupported Formats
+    try:
+        video.save_frames(directory = data_path, extension = '.bmp')
+    except ValueError:
+        pass
+    else:
+        raise AssertionError('Unsupported extension did not raise ValueError')
+
+    # Clearing Temporary Files
+    Video.clear_temporary_files()
+
+def run_parallel_save() -> None:
+    '''
+        Checks that segments encoded in parallel are joined into one video.
+    '''
+    data_path = gridvid.config.paths.temp_video_directory
+    extension = '.mp4'
+    filename = 'test_parallel'
+
+    # Saving Lossless Segments, Including Grids
+    video = Video.noise(70, (32, 48), 30, True, filename)
+    video.create_grid((2, 2), linecolor = (255, 0, 0))
+    video.save(
+        filename, extension = extension, directory = data_path, crf = 0,
+        keyint = 10, parallel = 3
+    )
+    video_loaded = Video.from_file(
+        filename + extension, data_path, grayscale = True
+    )
+    assert np.array_equal(video_loaded[:], video[:])
+
+    # Starting Each Segment on a Keyframe
+    keys, length = segments.keyframes(data_path / (filename + extension))
+    assert length == 70
+    assert {0, 30, 60} <= set(keys.tolist())
+
+    # Removing Segments After a Failed Encode
+    try:
+        video.save(
+            filename, extension = extension, directory = data_path,
+            codec = 'nonexistent', parallel = 2
+        )
+    except (OSError, RuntimeError):
+        pass
+    else:
+        raise AssertionError('Invalid `codec` did not raise')
+    assert not list(data_path.glob('parallel_*'))
+
+    # Rejecting Parallel Splicing
+    try:
+        video.save(filename, directory = data_path, splice = True,
+                   parallel = 2)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError('Parallel splicing did not raise ValueError')
+
+    # Clearing Temporary Files
+    Video.clear_temporary_files()
 
 def run_all() -> None:
     '''
@@ -30,3 +344,27 @@ def run_all() -> None:
 
     # Clearing Temporary Files
     Video.clear_temporary_files()
+
+    # Copy-on-Write Storage
+    run_copy_on_write()
+
+    # Grid Overlays
+    run_overlays()
+
+    # Segments of Video Files
+    run_segments()
+
+    # Memory-Mapped Frame Cache
+    run_frame_cache()
+
+    # Encoder Settings
+    run_encoder_settings()
+
+    # Grayscale Videos
+    run_grayscale()
+
+    # Saving Frames as Images
+    run_save_frames()
+
+    # Encoding Segments in Parallel
+    run_parallel_save()
@@ -0,0 +1,41 @@
+from gridvid import Video, batch
+import shutil
+import gridvid
+
+def run_all() -> None:
+    '''
+        Runs all batch processing tests;
+        returns True if all tests succeed, False otherwise.
+    '''
+    data_path = gridvid.config.paths.temp_video_directory
+    input_path = data_path / 'test_batch_input'
+    output_path = data_path / 'test_batch_output'
+    input_path.mkdir(exist_ok = True)
+    output_path.mkdir(exist_ok = True)
+
+    # Creating a Directory of Videos
+    for n in range(3):
+        video = Video.noise(10, (64, 64), 30, False)
+        video.save(f'video_{n}', extension = '.mp4', directory = input_path)
+
+    # Processing the Directory
+    results = batch.process_directory(
+        (2,2), directory = input_path, output_directory = output_path,
+        jobs = 2, verbose = False
+    )
+    assert len(results) == 3
+    assert all(result['error'] is None for result in results)
+    assert all(result['frames'] == 10 for result in results)
+    assert len(list(output_path.glob('*.mp4'))) == 3
+
+    # Resuming Skips Finished Videos
+    (output_path / 'video_1.mp4').unlink()
+    results = batch.process_directory(
+        (2,2), directory = input_path, output_directory = output_path,
+        jobs = 2, verbose = False
+    )
+    assert [result['filename'] for result in results] == ['video_1.mp4']
+
+    # Clearing Temporary Files
+    shutil.rmtree(input_path)
+    shutil.rmtree(output_path)
@@ -0,0 +1,35 @@
+from pathlib import Path
+import subprocess
+import tempfile
+import sys
+import os
+
+# Dependencies which should only be imported once they are needed
+heavy_modules = ['matplotlib.pyplot', 'imageio', 'numba', 'multiprocessing']
+
+def run_all() -> None:
+    '''
+        Runs all package import tests;
+        returns True if all tests succeed, False otherwise.
+    '''
+    root = Path(__file__).parent.parent
+
+    script = (
+        'import sys, gridvid\n'
+        f'print(",".join(m for m in {heavy_modules!r} if m in sys.modules))\n'
+    )
+
+    with tempfile.TemporaryDirectory() as home:
+        env = dict(os.environ, HOME = home, PYTHONPATH = str(root))
+
+        # Importing the Package in a Fresh Interpreter
+        result = subprocess.run(
+            [sys.executable, '-c', script], env = env, cwd = home,
+            capture_output = True, text = True, check = True
+        )
+
+        # Heavy Dependencies are not Imported
+        assert result.stdout.strip() == '', result.stdout
+
+        # No Directories are Created
+        assert not any(Path(home).iterdir())
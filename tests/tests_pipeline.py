@@ -0,0 +1,41 @@
+from gridvid import Video, pipeline
+import contextlib
+import gridvid
+import io
+
+def run_all() -> None:
+    '''
+        Runs all streaming pipeline tests;
+        returns True if all tests succeed, False otherwise.
+    '''
+    data_path = gridvid.config.paths.temp_video_directory
+    extension = '.mp4'
+    filename = 'test_pipeline'
+
+    # Creating Video from Array
+    video = Video.noise(40, (128, 128), 30, False, filename)
+    video.save(filename, extension = extension, directory = data_path)
+
+    # Streaming the Video in Chunks
+    chunks = list(Video.stream(filename + extension, data_path, 16))
+    assert [len(chunk) for chunk in chunks] == [16, 16, 8]
+
+    # Adding a Grid Chunk by Chunk
+    source = data_path / (filename + extension)
+    destination = data_path / (filename + '_grid' + extension)
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        frames = pipeline.process(
+            source, destination, (3,3), width = 2, chunk_size = 16,
+            verbose = True
+        )
+    assert frames == 40
+    assert output.getvalue().splitlines()[-1].startswith('process: 40 frames')
+
+    # Reloading Processed Video
+    video_loaded = Video.from_file(destination.name, data_path)
+    assert len(video_loaded) == 40
+    assert video_loaded[0,0].min() > 200
+
+    # Clearing Temporary Files
+    Video.clear_temporary_files()
@@ -0,0 +1,8 @@
+from . import tests_geometry
+from . import tests_kernels
+from . import tests_segments
+from . import tests_scaling
+from . import tests_color
+from . import tests_decoding
+from . import tests_pipes
+from . import tests_rendercache
@@ -0,0 +1,30 @@
+from gridvid.utils import color
+import numpy as np
+
+def run_all() -> None:
+    '''
+        Runs all color conversion tests;
+        returns True if all tests succeed, False otherwise.
+    '''
+    # Converting Colors
+    assert color.luminance((255, 255, 255)) == 255
+    assert color.luminance((0, 0, 0)) == 0
+    assert color.grid_color(None, 1) == (255,)
+    assert color.grid_color(None, 3) == (255, 255, 255)
+    assert color.grid_color((128,), 3) == (128, 128, 128)
+    assert color.grid_color((255, 0, 0), 1) == (color.luminance((255, 0, 0)),)
+    assert color.grid_color((255, 0, 0), 3) == (255, 0, 0)
+
+    # Converting Frames to Grayscale in Chunks
+    frames = np.random.randint(0, 256, (5, 8, 8, 3), dtype = np.uint8)
+    gray = color.to_grayscale(frames, chunk_size = 2)
+    assert gray.shape == (5, 8, 8, 1)
+    expected = np.rint(
+        frames.astype(np.float64) @ np.array([77, 150, 29]) / 256
+    )
+    assert np.abs(gray[...,0] - expected).max() <= 1
+
+    # Converting Grayscale Frames to RGB
+    rgb = color.to_rgb(gray)
+    assert rgb.shape == (5, 8, 8, 3)
+    assert np.array_equal(rgb[...,1], gray[...,0])
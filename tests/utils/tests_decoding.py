@@ -0,0 +1,26 @@
+from gridvid.utils import decoding
+import numpy as np
+
+def run_all() -> None:
+    '''
+        Runs all preallocated decoding tests;
+        returns True if all tests succeed, False otherwise.
+    '''
+    # Estimating Frame Counts from Metadata
+    metadata = {'nframes': 100, 'duration': 10.0, 'fps': 10.0}
+    assert decoding.frame_count(metadata) == 100
+    assert decoding.frame_count(metadata, 10, 50, 3) == 14
+    metadata = {'nframes': float('inf'), 'duration': 2.0, 'fps': 30.0}
+    assert decoding.frame_count(metadata, 5, None, 2) == 28
+    assert decoding.frame_count({'nframes': float('inf'), 'fps': 30.0}) == 0
+
+    # Filling, Growing and Shrinking the Buffer
+    for frames, count in [(10, 10), (10, 3), (10, 0), (10, 40)]:
+        data = decoding.read_into(
+            (np.full((4, 6, 3), n, np.uint8) for n in range(frames)), count
+        )
+        assert data.shape == (frames, 4, 6, 3)
+        assert np.array_equal(data[:,0,0,0], np.arange(frames))
+
+    # Reading No Frames
+    assert decoding.read_into(iter([]), 5) is None
@@ -0,0 +1,38 @@
+from gridvid.utils import geometry
+import numpy as np
+
+def run_all() -> None:
+    '''
+        Runs all grid geometry tests;
+        returns True if all tests succeed, False otherwise.
+    '''
+    # Uniform Line Placement
+    positions = geometry.line_positions(101, 3)
+    assert positions.tolist() == [0, 25, 50, 75, 100]
+
+    # Explicit Pixel Placement
+    positions = geometry.line_positions(101, [60, 10, 10])
+    assert positions.tolist() == [10, 60]
+
+    # Fractional Placement
+    positions = geometry.line_positions(101, [0.0, 0.333, 1.0])
+    assert positions.tolist() == [0, 33, 100]
+
+    # Widening Lines, Clipped at the Image Borders
+    bands = geometry.line_bands(np.array([0, 50, 100]), 4, 101)
+    assert bands.tolist() == [0, 1, 2, 49, 50, 51, 52, 99, 100]
+
+    # Covered Pixel Coordinates
+    rows, cols = geometry.grid_indices(np.array([0]), np.array([2]), (3, 4))
+    assert list(zip(rows.tolist(), cols.tolist())) == [
+        (0, 0), (0, 1), (0, 2), (0, 3), (1, 2), (2, 2)
+    ]
+
+    # Rejecting Invalid Placements
+    for placement in (-1, [101], [1.5], [[1, 2]]):
+        try:
+            geometry.line_positions(101, placement)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f'Placement {placement} was accepted')
@@ -0,0 +1,78 @@
+from pathlib import Path
+import subprocess
+import tempfile
+import sys
+import os
+
+from gridvid.config import paths
+from gridvid.utils import kernels
+import numpy as np
+
+def run_all() -> None:
+    '''
+        Runs all compiled kernel tests;
+        returns True if all tests succeed, False otherwise.
+    '''
+    # Compiling Every Kernel Ahead of Time
+    status = kernels.warmup()
+    assert sorted(status) == ['blend_grid', 'set_grid']
+    for kernel in kernels.kernels.values():
+        assert len(kernel.signatures) == 2
+
+    # Loading the Kernels from the Cache in a New Process
+    script = (
+        'import numba, os\n'
+        'cache_dir = numba.config.CACHE_DIR\n'
+        'from gridvid.utils import kernels\n'
+        'print(kernels.set_grid.compiled)\n'
+        'print(all(kernels.warmup().values()))\n'
+        'print(numba.config.CACHE_DIR == cache_dir)\n'
+        'print(\'NUMBA_CACHE_DIR\' in os.environ)\n'
+    )
+    env = {k:v for k,v in os.environ.items() if k != 'NUMBA_CACHE_DIR'}
+    result = subprocess.run(
+        [sys.executable, '-c', script], cwd = Path(__file__).parents[2],
+        capture_output = True, text = True, check = True, env = env
+    )
+
+    # Compiling Nothing on Import, and Leaving numba's Cache Settings Unchanged
+    expected = ['False', 'True', 'True', 'False']
+    assert result.stdout.split() == expected, result.stdout
+    assert any(paths.kernel_cache.rglob('kernels.*.nbi'))
+
+    # Compiling Without the Cache if its Directory Cannot be Created
+    script = (
+        'from gridvid.utils import kernels\n'
+        'import numpy as np\n'
+        'frames = np.zeros((1, 4, 4, 3), dtype = np.uint8)\n'
+        'idx = np.arange(4, dtype = np.int64)\n'
+        'color = np.array([255, 0, 0], dtype = np.uint8)\n'
+        'kernels.set_grid(frames, idx, idx, color)\n'
+        'print(frames[0,idx,idx,0].all())\n'
+        'print(kernels.is_cached(kernels.set_grid))\n'
+    )
+    with tempfile.TemporaryDirectory() as home:
+        # The package data directory is a file, so no directory can be made
+        (Path(home) / '.Gridvid').touch()
+        result = subprocess.run(
+            [sys.executable, '-c', script], cwd = Path(__file__).parents[2],
+            capture_output = True, text = True, check = True,
+            env = dict(env, HOME = home, USERPROFILE = home)
+        )
+    assert result.stdout.split() == ['True', 'False'], result.stdout
+
+    # Drawing onto Contiguous and Strided Frames
+    frames = np.zeros((2, 8, 8, 3), dtype = np.uint8)
+    idx = np.arange(8, dtype = np.int64)
+    color = np.array([255, 0, 0], dtype = np.uint8)
+    kernels.set_grid(frames, idx, idx, color)
+    kernels.set_grid(frames[:,::2], idx[:4], idx[:4], color)
+    assert frames[:,idx,idx,0].all()
+
+    # Rejecting Frames of Other Types
+    try:
+        kernels.set_grid(frames.astype(np.float32), idx, idx, color)
+    except TypeError:
+        pass
+    else:
+        raise AssertionError('Frames of dtype float32 did not raise TypeError')
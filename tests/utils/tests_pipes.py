@@ -0,0 +1,83 @@
+from gridvid import Video
+from gridvid.config import paths, video_settings
+from gridvid.utils import pipes
+import numpy as np
+
+def run_all() -> None:
+    '''
+        Runs all raw ffmpeg pipe tests;
+        returns True if all tests succeed, False otherwise.
+    '''
+    data_path = paths.temp_video_directory
+    extension = '.mp4'
+    filename = 'test_pipes'
+
+    # Selecting Segments with Filters
+    assert pipes.input_args(30, 0) == ([], [])
+    input_params, output_params = pipes.input_args(
+        30, 10, 20, 3, ['-vf', 'crop=8:8:0:0']
+    )
+    assert input_params == ['-ss', f'{9.5 / 30:.6f}']
+    assert output_params == [
+        '-vf', 'select=not(mod(n\\,3)),crop=8:8:0:0', '-fps_mode',
+        'passthrough', '-frames:v', '4'
+    ]
+
+    # Writing Chunks of Frames
+    video = Video.noise(20, (32, 48), 30, False, filename, False)
+    path = paths.ensure(data_path) / (filename + extension)
+    with pipes.Writer(
+        path, 30, (32, 48, 3), 'libx264', 'yuv444p', ['-crf', '0']
+    ) as writer:
+        writer.append_data(video[:12])
+        writer.append_data(video[12:])
+
+    # Reading Frames into a Growing Array
+    data = pipes.read_into(path, (32, 48, 3), 5)
+    assert data.shape == (20, 32, 48, 3)
+    video_loaded = Video.from_file(filename + extension, data_path)
+    assert np.array_equal(data, video_loaded[:])
+
+    # Reading Frames into a Reused Buffer
+    chunks = [
+        chunk.copy() for chunk in pipes.read_chunks(path, (32, 48, 3), 8)
+    ]
+    assert [len(chunk) for chunk in chunks] == [8, 8, 4]
+    assert np.array_equal(np.concatenate(chunks), data)
+
+    # Stopping a Read Early
+    chunks = pipes.read_chunks(path, (32, 48, 3), 8)
+    assert len(next(chunks)) == 8
+    chunks.close()
+
+    # Reporting ffmpeg Errors
+    broken = data_path / (filename + '.txt')
+    broken.write_text('Not a video')
+    try:
+        pipes.read_into(broken, (32, 48, 3), 5)
+    except RuntimeError as e:
+        assert 'ffmpeg failed' in str(e)
+    else:
+        raise AssertionError('Decoding a broken file did not raise')
+
+    # Selecting the Backend
+    default = video_settings.encoder
+    video_settings.encoder = 'pipe'
+    try:
+        video.create_grid((1, 1))
+        video.save(
+            filename, extension = extension, directory = data_path, crf = 0,
+            pixelformat = 'yuv444p'
+        )
+        video_piped = Video.from_file(
+            filename + extension, data_path, start = 3, stride = 2
+        )
+    finally:
+        video_settings.encoder = default
+
+    video_loaded = Video.from_file(filename + extension, data_path)
+    assert np.array_equal(video_piped[:], video_loaded[3::2])
+    assert (video_loaded[:,0] >= 250).all()
+
+    # Clearing Temporary Files
+    Video.clear_temporary_files()
@@ -0,0 +1,116 @@
+from gridvid import Video, batch
+from gridvid.utils import rendercache
+import numpy as np
+import gridvid
+import shutil
+import os
+
+def run_all() -> None:
+    '''
+        Runs all render cache tests;
+        returns True if all tests succeed, False otherwise.
+    '''
+    paths = gridvid.config.paths
+    data_path = paths.temp_video_directory
+    cache_path = paths.render_cache
+    extension = '.mp4'
+    filename = 'test_render_cache'
+
+    # Keeping the Tests Apart from the Real Cache
+    paths.render_cache = data_path / 'test_render_cache'
+    try:
+        Video.noise(10, (32, 48), 30).save(
+            filename, extension = extension, directory = data_path
+        )
+        video = Video.from_file(filename + extension, data_path)
+        video.create_grid((2, 2), linecolor = (255, 0, 0))
+
+        # Storing the First Render
+        first = data_path / 'test_render_first.mp4'
+        video.save(
+            first.stem, extension = extension, directory = data_path,
+            cache = True
+        )
+        assert rendercache.stats()['entries'] == 1
+
+        # Reusing the Render of an Identical Job
+        second = data_path / 'test_render_second.mp4'
+        video.save(
+            second.stem, extension = extension, directory = data_path,
+            cache = True
+        )
+        assert not os.path.samefile(first, second)
+        assert first.read_bytes() == second.read_bytes()
+        assert rendercache.stats()['hits'] == 1
+
+        # Keeping Cached Renders Read-Only
+        cached = next(paths.render_cache.glob('*' + extension))
+        assert not os.stat(cached).st_mode & 0o222
+
+        # Editing an Output in Place without Changing the Cached Render
+        rendered = second.read_bytes()
+        with open(first, 'r+b') as outfile:
+            outfile.write(bytes(64))
+        third = data_path / 'test_render_third.mp4'
+        video.save(
+            third.stem, extension = extension, directory = data_path,
+            cache = True
+        )
+        assert third.read_bytes() == rendered
+        assert rendercache.stats()['hits'] == 2
+        assert rendercache.prune()['entries'] == 0
+
+        # Rendering Again if the Cached Render was Modified
+        os.chmod(cached, 0o644)
+        with open(cached, 'r+b') as outfile:
+            outfile.write(bytes(64))
+        video.save(
+            third.stem, extension = extension, directory = data_path,
+            cache = True
+        )
+        assert third.read_bytes() == rendered
+        assert rendercache.stats()['hits'] == 0
+
+        # Rendering Again after Changing the Grid or Arguments
+        video.save(third.stem, directory = data_path, crf = 30, cache = True)
+        assert third.read_bytes() != rendered
+        assert rendercache.stats()['entries'] == 2
+        video.create_grid((1, 1))
+        job = video._cache_key(segment = (0, 10, 1))
+        assert job != video._cache_key(segment = (0, 10, 2))
+        assert job != rendercache.key(
+            video._source, segment = np.array([0, 10, 1])
+        )
+
+        # Skipping the Cache for Modified Videos
+        video[0] = 0
+        assert video._cache_key() is None
+
+        # Evicting the Least Recently Used Renders
+        removed = rendercache.prune(max_size = 0)
+        assert removed['entries'] == 2
+        assert rendercache.stats()['entries'] == 0
+
+        # Reusing Renders in Batch Processing
+        input_path = data_path / 'test_render_input'
+        output_path = data_path / 'test_render_output'
+        input_path.mkdir(exist_ok = True)
+        shutil.copy(data_path / (filename + extension), input_path)
+        for n in range(2):
+            results = batch.process_directory(
+                (2,2), directory = input_path, output_directory = output_path,
+                jobs = 1, verbose = False, cache = True
+            )
+            assert results[0]['error'] is None
+            assert results[0]['cached'] == (n == 1)
+            assert results[0]['frames'] == 10
+            (output_path / (filename + extension)).unlink()
+        assert rendercache.stats()['hits'] == 1
+    finally:
+        shutil.rmtree(paths.render_cache, ignore_errors = True)
+        shutil.rmtree(data_path / 'test_render_input', ignore_errors = True)
+        shutil.rmtree(data_path / 'test_render_output', ignore_errors = True)
+        paths.render_cache = cache_path
+
+    # Clearing Temporary Files
+    Video.clear_temporary_files()
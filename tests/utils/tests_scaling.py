@@ -0,0 +1,49 @@
+from gridvid.utils import scaling
+from gridvid import GridSpec
+import numpy as np
+
+def run_all() -> None:
+    '''
+        Runs all cropping and scaling tests;
+        returns True if all tests succeed, False otherwise.
+    '''
+    # Selecting Regions
+    region = scaling.region((480, 640), 0.25)
+    assert region == ((480, 640), (0, 0, 480, 640), (120, 160))
+    assert scaling.is_identity(scaling.region((480, 640)))
+
+    region = scaling.region((480, 640), (60, 80), (40, 80, 240, 320))
+    assert scaling.ffmpeg_params(region) == [
+        '-vf', 'crop=320:240:80:40,scale=80:60:flags=area'
+    ]
+
+    for size, crop in [(1.5, None), (None, (0, 0, 500, 640))]:
+        try:
+            scaling.region((480, 640), size, crop)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f'Region {size}, {crop} did not raise')
+
+    # Resizing Frames by Block Averaging
+    frames = np.arange(2*4*6*3, dtype = np.uint8).reshape(2, 4, 6, 3)
+    region = scaling.region((4, 6), (2, 3))
+    resized = scaling.resize(frames, region)
+    expected = frames.reshape(2, 2, 2, 3, 2, 3).mean(axis = (2, 4))
+    assert np.array_equal(resized, np.round(expected + 1e-9))
+
+    # Cropping Frames Without Copying
+    region = scaling.region((4, 6), None, (1, 2, 2, 3))
+    assert np.shares_memory(scaling.resize(frames, region), frames)
+
+    # Placing Grids on Downscaled Frames
+    region = scaling.region((400, 400), 0.25)
+    placement, width = scaling.grid_placement(region, (3, 3), 8)
+    assert GridSpec((400, 400), (3, 3)).rows.tolist() == [0, 99, 199, 299, 399]
+    assert placement == ((0, 24, 49, 74, 99), (0, 24, 49, 74, 99))
+    assert width == 2
+
+    # Omitting Lines Outside of the Crop Rectangle
+    region = scaling.region((400, 400), None, (50, 50, 100, 100))
+    placement, width = scaling.grid_placement(region, (3, 3), 1)
+    assert placement == ((49,), (49,))
@@ -0,0 +1,62 @@
+from gridvid.utils import segments
+import numpy as np
+import gridvid
+
+def run_all() -> None:
+    '''
+        Runs all video segment tests;
+        returns True if all tests succeed, False otherwise.
+    '''
+    # Parsing Timestamps
+    assert segments.parse_timestamp('01:02:03.5') == 3723.5
+    assert segments.parse_timestamp('00:30') == 30
+    assert segments.parse_timestamp('12.25') == 12.25
+
+    for timestamp in ['1:2:3:4', 'ab:10', '-5']:
+        try:
+            segments.parse_timestamp(timestamp)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f'Timestamp {timestamp!r} did not raise')
+
+    # Converting Frames, Seconds and Timestamps to Frame Numbers
+    assert segments.frame_index(12, 30) == 12
+    assert segments.frame_index(1.5, 30) == 45
+    assert segments.frame_index('00:02', 25) == 50
+
+    # Selecting Frame Ranges
+    assert segments.frame_range(None, None, None, 30) == (0, None, 1)
+    assert segments.frame_range(10, '00:01', 2, 30) == (10, 30, 2)
+    assert segments.frame_range(10, 500, 1, 30, 100) == (10, 100, 1)
+
+    try:
+        segments.frame_range(20, 10, 1, 30)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError('`end` before `start` did not raise ValueError')
+
+    # Splitting Frames into Segments Aligned to Keyframes
+    assert segments.split(100, 3, 10) == [(0, 40), (40, 80), (80, 100)]
+    assert segments.split(10, 4, 250) == [(0, 3), (3, 6), (6, 9), (9, 10)]
+    assert segments.split(2, 8, 250) == [(0, 1), (1, 2)]
+
+    # Finding Keyframes Without Decoding
+    data_path = gridvid.config.paths.temp_video_directory
+    video = gridvid.Video.noise(25, (32, 32), 30)
+    video.save('test_segments', extension = '.mp4', directory = data_path,
+               keyint = 10)
+    keys, length = segments.keyframes(data_path / 'test_segments.mp4')
+    assert length == 25
+    assert keys[0] == 0 and len(keys) >= 3
+    assert np.diff(keys).max() <= 10
+
+    # Reading the Stream Format
+    stream = segments.stream_format(data_path / 'test_segments.mp4')
+    assert stream['codec'] == 'h264' and stream['size'] == '32x32'
+    assert stream['frame rate'] == '30' and stream['extradata']
+    assert stream['profile'] and stream['codec tag'].startswith('avc1')
+
+    # Clearing Temporary Files
+    gridvid.Video.clear_temporary_files()